@@ -6,6 +6,7 @@ import sys
 import time
 
 from paths import Paths  # импорт класса настроек путей к ресурсам приложения
+from minefield import Minefield  # импорт класса логики игрового поля
 
 from PySide6.QtWidgets import (QApplication,
                                QWidget,
@@ -295,11 +296,14 @@ class MainWindow(QMainWindow):
         Метод инициализации игровой карты
         :return: None
         """
+        self.field = Minefield(self.b_size, self.n_mines)  # создание логики игрового поля
+        self.cells = [None] * (self.b_size * self.b_size)  # список виджетов ячеек по индексу y * b_size + x
         # цикл создания ячеек игрового поля
         for x in range(0, self.b_size):  # проход по горизонтали
             for y in range(0, self.b_size):  # проход по вертикали
                 w = Pos(x, y)  # создание экземпляра класса виджета ячейки игрового поля
                 self.grid.addWidget(w, y, x)  # добавление виджета ячейки игрового поля в сетку слоя для виджетов
+                self.cells[y * self.b_size + x] = w  # сохранение ссылки на виджет ячейки
                 w.clicked.connect(self.trigger_start)  # создание сигнала на нажатие на ячейку игрового поля
                 w.revealed.connect(self.on_reveal)  # сигнал на открытие нажатой ячейки
                 w.expandable.connect(self.expand_reveal)  # сигнал на расширение раскрытия свободных от мин ячеек
@@ -323,50 +327,32 @@ class MainWindow(QMainWindow):
         Внутренний метод для удаления мин и очистки их данных
         :return: None
         """
-        for x in range(0, self.b_size):  # проход по горизонтали
-            for y in range(0, self.b_size):  # проход по вертикали
-                w = self.grid.itemAtPosition(y, x).widget()  # выбирает ячейку сетки слоя и возвращает
-                # находящийся в ней виджет
-                w.reset()  # вызов метода ячейки игрового поля для перезагрузки виджета к исходному состоянию
+        for w in self.cells:  # проход по виджетам ячеек
+            w.reset()  # вызов метода ячейки игрового поля для перезагрузки виджета к исходному состоянию
 
     def _reset_add_mines(self) -> list:
         """
         Внутренний метод для расстановки мин на игровом поле
         :return: list - список заминированных ячеек
         """
+        self.field.place_mines()  # расстановка мин без повторов за один вызов
         positions = []  # создание списка для хранения позиций мин
-        while len(positions) < self.n_mines:  # цикл по условию заполнения списка мин
-            x, y = (random.randint(0, self.b_size - 1),  # случайный выбор ячейки игрового поля
-                    random.randint(0, self.b_size - 1)
-                    )
-            if (x, y) not in positions:  # проверка условия нахождения позиции в списке мин
-                w = self.grid.itemAtPosition(y, x).widget()  # выбор ячейки и возврат виджета, размещенного в ней
+        for w, is_mine in zip(self.cells, self.field.mines):  # перенос мин в виджеты ячеек
+            if is_mine:
                 w.is_mine = True  # размещение мины в ячейке
-                positions.append((x, y))  # добавление заминированной ячейки в список мин
-                self.end_game_n = (self.b_size * self.b_size) - (self.n_mines + 1)  # расчет условия завершения игры
+                positions.append((w.x, w.y))  # добавление заминированной ячейки в список мин
+        self.end_game_n = (self.b_size * self.b_size) - (self.n_mines + 1)  # расчет условия завершения игры
         return positions
 
     def _reset_calculate_adjacency(self):
         """
-        Метод подсчета количества мни в окружении позиции
+        Метод подсчета количества мни в окружении позиции. Подсчет для всего поля выполняется
+        логикой игрового поля одной сверткой массива мин
         :return: None
         """
-
-        def get_adjacency_n(x: int, y: int) -> int:
-            """
-            Внутренний метод подсчета количества мин в окружении позиции
-            :param x: int - координата позиции по горизонтали
-            :param y: int - координата позиции по вертикали
-            :return: int - количество мин в окружении позиции
-            """
-            positions = self.get_surrounding(x, y)  # вызов метода, возвращающего координаты окружающих позиций
-            return sum(1 for w in positions if w.is_mine)  # подсчет количества мин в окружении
-
-        for x in range(0, self.b_size):  # проход по ячейкам игрового поля по горизонтали
-            for y in range(0, self.b_size):  # проход по ячейкам игрового поля по вертикали
-                w = self.grid.itemAtPosition(y, x).widget()  # извлечение ссылки на виджет ячейки игрового поля из
-                # сетки слоя по координатам
-                w.adjacent_n = get_adjacency_n(x, y)  # запись в игровую ячейку количество мин в ее окружении
+        self.field.calculate_adjacency()  # подсчет мин в окружении всех ячеек
+        for w, adjacent_n in zip(self.cells, self.field.adjacent):  # проход по виджетам ячеек
+            w.adjacent_n = adjacent_n  # запись в игровую ячейку количество мин в ее окружении
 
     def _reset_add_starting_marker(self) -> None:
         """
@@ -378,8 +364,7 @@ class MainWindow(QMainWindow):
             x, y = (random.randint(0, self.b_size - 1),  # генерация случайной координаты по горизонтали
                     random.randint(0, self.b_size - 1)  # генерация случайной координаты по вертикали
                     )
-            w = self.grid.itemAtPosition(y, x).widget()  # извлечение ссылки на виджет ячейки игрового поля
-            # из сетки слоя
+            w = self.cells[y * self.b_size + x]  # извлечение ссылки на виджет ячейки игрового поля
             if not w.is_mine:  # проверка наличия мины
                 w.is_start = True  # установка стартовой позиции
                 w.is_revealed = True  # вскрытие ячейки старковой позиции
@@ -392,18 +377,12 @@ class MainWindow(QMainWindow):
 
     def get_surrounding(self, x: int, y: int) -> list:
         """
-        Метод, возвращающий список координат окружающих ячеек
+        Метод, возвращающий список виджетов окружающих ячеек
         :param x: координата по горизонтали
         :param y: координата по вертикали
-        :return: список координат позиций окружения
+        :return: список виджетов ячеек окружения
         """
-        positions = []  # создание списка для хранения координат окружения
-        for xi in range(max(0, x - 1), min(x + 2, self.b_size)):  # обход по горизонтали
-            for yi in range(max(0, y - 1), min(y + 2, self.b_size)):  # обход по вертикали
-                if not (xi == x and yi == y):  # исключение координат входной ячейки
-                    positions.append(self.grid.itemAtPosition(yi, xi).widget())  # добавление координат
-                    # ячеек окружения в список
-        return positions  # возврат списка
+        return [self.cells[j] for j in self.field.neighbours(self.field.index(x, y))]  # виджеты ячеек окружения
 
     def button_pressed(self) -> None:
         """
@@ -420,40 +399,20 @@ class MainWindow(QMainWindow):
         Метод для вскрытия всех ячеек игрового поля
         :return: None
         """
-        for x in range(0, self.b_size):  # проход по горизонтали
-            for y in range(0, self.b_size):  # проход по вертикали
-                w = self.grid.itemAtPosition(y, x).widget()  # извлечение ссылки на игровую ячейку по координатам
-                w.reveal(False)  # вызов метода открытия ячейки с запретом на подачу сигнала открытия ячейки
+        for w in self.cells:  # проход по виджетам ячеек
+            w.reveal(False)  # вызов метода открытия ячейки с запретом на подачу сигнала открытия ячейки
 
     def expand_reveal(self, x: int, y: int) -> None:
         """
         Метод расширения вскрытия ячеек, в окружении которых нет мин. Данный метод вызывается методом ".click()"
-        Итерация выполняется в обратном порядке от начальной точки, добавляя новые ячейки в очередь. Это позволяет
-        расширить область вскрытых ячеек за один раз, вместо большого количества обратных вызовов.
+        Область находится логикой игрового поля обходом в ширину, каждая ячейка посещается один раз,
+        поэтому время поиска пропорционально размеру области, а не квадрату.
         :param x: Координата по горизонтали.
         :param y: Координата по вертикали.
         :return: None
         """
-        to_expand = [(x, y)]  # создание списка координат ячеек, которые должны быть проверены на наличие мин
-        # в окружении с добавлением в него координат исходной ячейки
-        to_reveal = []  # создание списка ячеек, которые должны быть вскрыты по результатам проверки на наличие
-        # мин в окружении
-        any_added = True  # создание переменной для хранения статуса добавления ячеек в список на проверку
-        while any_added:  # цикл проверки ячеек выполняется пока в список на проверку добавляются новые ячейки
-            any_added = False  # сброс состояния добавления
-            to_expand, l = [], to_expand  # перенос данных из списка ячеек на проверку во временную ячейку
-            for x, y in l:  # цикл обхода списка ячеек на проверку
-                positions = self.get_surrounding(x, y)  # получение списка окружающих ячеек
-                for w in positions:  # обход списка окружающих ячеек
-                    if not w.is_mine and w not in to_reveal:  # проверка статуса минирования ячейки и проверка наличия
-                        # ячейки в списке вскрываемых
-                        to_reveal.append(w)  # добавление ячейки в список вскрываемых
-                        if w.adjacent_n == 0:  # проверка количества мин в окружении ячейки
-                            to_expand.append((w.x, w.y))  # если мин в окружении нет, ячейка добавляется в список на
-                            # расширение области вскрытия
-                            any_added = True  # установка статуса пополнения списка на расширение
-        for w in to_reveal:  # обход списка ячеек на вскрытие
-            w.reveal()  # вызов метода вскрытия ячейки
+        for i in self.field.flood(self.field.index(x, y)):  # обход ячеек области, свободной от мин
+            self.cells[i].reveal()  # вызов метода вскрытия ячейки, уже открытые ячейки пропускаются
 
     def trigger_start(self) -> None:
         """
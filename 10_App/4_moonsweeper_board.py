@@ -0,0 +1,466 @@
+"""
+Пример игры аналога минера из windows.
+В данном примере игровое поле рисуется одним виджетом вместо отдельного виджета на каждую ячейку.
+Состояние ячеек хранится в плоских массивах логики игрового поля (модуль minefield), изображения ячеек
+рисуются один раз и переиспользуются, а при изменении ячеек перерисовывается только их прямоугольник.
+Это позволяет играть на полях 200x200.
+"""
+import sys
+import time
+
+from paths import Paths  # импорт класса настроек путей к ресурсам приложения
+from minefield import Minefield  # импорт класса логики игрового поля
+
+from PySide6.QtWidgets import (QApplication,
+                               QWidget,
+                               QMainWindow,
+                               QVBoxLayout,
+                               QHBoxLayout,
+                               QLayout,
+                               QLabel,
+                               QPushButton,
+                               QScrollArea,
+                               QFrame,
+                               )
+
+from PySide6.QtGui import (QImage,
+                           QColor,
+                           QPainter,
+                           QPixmap,
+                           QPen,
+                           QBrush,
+                           QFont,
+                           QIcon,
+                           QAction,
+                           )
+
+from PySide6.QtCore import QTimer, Signal, QSize, QRect, Qt
+
+"""
+Импорт модуля sys, предоставляющего доступ к объекта интерпретатора, нужен для доступа
+к аргументам командной строки. Если использование аргументов командной строки не предполагается,
+то импорт можно не выполнять. При этом, при создании приложения в класс QtWidgets.QApplication([])
+в качестве аргумента передается пустой
+Импорт модуля time для работы величинами времени.
+
+Импорт из модуля PySide6.QWidgets класса управления приложением QApplication, класса базового виджета QWidget,
+класса главных окон QMainWindow, класса ярлыка QLabel, класса кнопок QPushButton,
+класса слоя с вертикальной организацией QVBoxLayout, класса слоя с горизонтальной организацией QHBoxLayout,
+класса базового менеджера геометрии слоев QLayout, класса области прокрутки QScrollArea,
+класса виджета с рамкой QFrame
+
+Импорт из модуля PySide6.QtGui класса графических изображений QImage, класса представления цветов QColor,
+класса низкоуровневого рисования на виджетах и других устройствах рисования QPainter, класса представления
+изображения QPixmap, класса настроек пера рисовальщика QPen, класса настроек кисти QBrush, класс шрифтов QFont,
+класса иконок QIcon, абстрактного класса пользовательских команд QAction
+
+Импорт из модуля PySide6.QtCore класса таймера QTimer, класс сигналов Signal, класс размеров QSize,
+класс прямоугольника QRect, класса пространства имен различных идентификаторов Qt
+"""
+
+# глобальные переменные для хранения объектов изображений
+IMG_BOMB = QImage(Paths.icon('bug.png'))
+IMG_FLAG = QImage(Paths.icon('flag.png'))
+IMG_START = QImage(Paths.icon('rocket.png'))
+IMG_CLOCK = QImage(Paths.icon('clock-select.png'))
+
+# словарь с цветами цифр
+NUM_COLORS = {1: QColor('#f44336'),
+              2: QColor('#9C27B0'),
+              3: QColor('#3F51B5'),
+              4: QColor('#03A9F4'),
+              5: QColor('#00BCD4'),
+              6: QColor('#4CAF50'),
+              7: QColor('#E91E63'),
+              8: QColor('#FF9800')}
+
+# глобальные переменные для хранения кодов состояния
+STATUS_READY = 0
+STATUS_PLAYING = 1
+STATUS_FAILED = 2
+STATUS_SUCCESS = 3
+
+# словарь с иконками состояний
+STATUS_ICONS = {STATUS_READY: Paths.icon('plus.png'),
+                STATUS_PLAYING: Paths.icon('smiley.png'),
+                STATUS_FAILED: Paths.icon('cross.png'),
+                STATUS_SUCCESS: Paths.icon('smiley-lol.png')}
+
+# список кортежей с уровнями сложности и размерами поля с количеством пришельцев
+# (сложность, размер поля, количество пришельцев)
+LEVELS = [('Easy', 8, 10), ('Medium', 16, 40), ('Hard', 24, 99), ('Huge', 200, 7000)]
+
+CELL_SIZE = 20  # размер ячейки в пикселях
+CELL_PITCH = CELL_SIZE + 5  # шаг ячеек с учетом промежутка между ними
+MAX_VIEW = 800  # максимальный размер видимой области поля, большее поле прокручивается
+
+# коды изображений ячеек для словаря заранее нарисованных ячеек
+TILE_HIDDEN = 'hidden'
+TILE_FLAG = 'flag'
+TILE_START = 'start'
+TILE_MINE = 'mine'
+
+
+class Board(QWidget):
+    """
+    Виджет игрового поля, рисующий все ячейки.
+    Состояние ячейки с координатами (x, y) хранится в элементе с индексом y * field_size + x плоских массивов
+    логики игрового поля Minefield.
+    Изображения ячеек каждого вида рисуются один раз и хранятся в словаре, при отрисовке они только
+    копируются на виджет и только для ячеек, попавших в перерисовываемую область
+    """
+    cell_clicked = Signal(int)  # создание объекта сигнала нажатия левой кнопкой на закрытую ячейку
+    clicked = Signal()  # создание объекта сигнала клика по ячейке
+
+    def __init__(self) -> None:
+        """
+        Конструктор игрового поля
+        """
+        QWidget.__init__(self)  # явный вызов конструктора родительского класса
+        self._tiles = {}  # создание словаря заранее нарисованных изображений ячеек
+        self._tiles_ratio = None  # масштаб экрана, для которого нарисованы изображения
+        self.field = None  # логика игрового поля
+        self.field_size = 0  # размер поля в ячейках
+
+    def set_field(self, field: Minefield) -> None:
+        """
+        Метод установки логики игрового поля для отображения
+        :param field: логика игрового поля
+        :return: None
+        """
+        self.field = field  # сохранение ссылки на логику игрового поля
+        self.field_size = field.size  # сохранение размера поля
+        self.setFixedSize(QSize(self.field_size * CELL_PITCH, self.field_size * CELL_PITCH))  # размер виджета по размеру поля
+        self.update()  # вызов встроенного метода обновления всего виджета
+
+    def cell_rect(self, i: int) -> QRect:
+        """
+        Метод, возвращающий прямоугольник ячейки на виджете
+        :param i: индекс ячейки
+        :return: QRect - прямоугольник ячейки
+        """
+        y, x = divmod(i, self.field_size)
+        return QRect(x * CELL_PITCH, y * CELL_PITCH, CELL_SIZE, CELL_SIZE)
+
+    def update_cell(self, i: int) -> None:
+        """
+        Метод перерисовки одной ячейки. Qt объединяет прямоугольники нескольких вызовов
+        в одну область перерисовки
+        :param i: индекс ячейки
+        :return: None
+        """
+        self.update(self.cell_rect(i))
+
+    def update_cells(self, cells: list) -> None:
+        """
+        Метод перерисовки группы ячеек одним прямоугольником, охватывающим их все.
+        Область, открытая одним кликом, может содержать сотни тысяч ячеек, поэтому прямоугольники
+        отдельных ячеек не передаются в Qt
+        :param cells: список индексов ячеек
+        :return: None
+        """
+        if not cells:
+            return
+        rows = [i // self.field_size for i in cells]  # строки ячеек
+        cols = [i % self.field_size for i in cells]  # столбцы ячеек
+        self.update(QRect(min(cols) * CELL_PITCH, min(rows) * CELL_PITCH,
+                          (max(cols) - min(cols)) * CELL_PITCH + CELL_SIZE,
+                          (max(rows) - min(rows)) * CELL_PITCH + CELL_SIZE))
+
+    def tiles(self) -> dict:
+        """
+        Метод, возвращающий словарь заранее нарисованных изображений ячеек.
+        Изображения рисуются при первом обращении и заново только при смене масштаба экрана
+        :return: словарь {вид ячейки: QPixmap}
+        """
+        ratio = self.devicePixelRatioF()  # масштаб экрана
+        if ratio != self._tiles_ratio:
+            self._tiles_ratio = ratio
+            self._tiles = {TILE_HIDDEN: self._make_tile(ratio, TILE_HIDDEN),
+                           TILE_FLAG: self._make_tile(ratio, TILE_FLAG),
+                           TILE_START: self._make_tile(ratio, TILE_START),
+                           TILE_MINE: self._make_tile(ratio, TILE_MINE)}
+            for n in NUM_COLORS:
+                self._tiles[n] = self._make_tile(ratio, n)
+        return self._tiles
+
+    @staticmethod
+    def _make_tile(ratio: float, kind: str | int) -> QPixmap:
+        """
+        Метод рисования изображения ячейки одного вида (так же, как ячейка рисовалась в виджете Pos)
+        :param ratio: масштаб экрана
+        :param kind: вид ячейки или количество мин в окружении
+        :return: QPixmap - изображение ячейки
+        """
+        pixmap = QPixmap(int(CELL_SIZE * ratio), int(CELL_SIZE * ratio))  # создание изображения в пикселях экрана
+        pixmap.setDevicePixelRatio(ratio)  # установка масштаба, чтобы рисовать в логических координатах
+        pixmap.fill(Qt.transparent)  # прозрачный фон
+        p = QPainter(pixmap)  # создание экземпляра класса рисовальщика
+        p.setRenderHint(QPainter.Antialiasing)  # установка настройки рендеринга для рисовальщика
+        r = QRect(0, 0, CELL_SIZE, CELL_SIZE)  # прямоугольник ячейки
+        if kind in (TILE_HIDDEN, TILE_FLAG):  # закрытая ячейка
+            p.fillRect(r, QBrush(Qt.lightGray))  # заливка ячейки светлосерым цветом
+            pen = QPen(Qt.gray)  # создание пера рисовальщика с установкой цвета
+            pen.setWidth(1)  # установка толщины линии для пера
+            p.setPen(pen)  # применение настроек пера к рисовальщику
+            p.drawRect(r)  # рисование прямоугольника в ячейке по ее контуру
+            if kind == TILE_FLAG:
+                p.drawImage(r, IMG_FLAG)  # рисование флага в ячейке
+        elif kind == TILE_START:
+            p.drawImage(r, IMG_START)  # рисование на ячейке стартового маркера
+        elif kind == TILE_MINE:
+            p.drawImage(r, IMG_BOMB)  # рисования на ячейке изображения мины
+        else:  # количество мин в окружении
+            p.setPen(QPen(NUM_COLORS[kind]))  # применение настроек пера к рисовальщику
+            f = p.font()  # извлечение ссылки на настройки шрифта рисовальщика
+            f.setBold(True)  # настройка шрифта рисовальщика
+            p.setFont(f)  # применение настроек шрифта рисовальщика
+            p.drawText(r, Qt.AlignHCenter | Qt.AlignVCenter, str(kind))  # рисование количества мин
+        p.end()  # завершение рисования
+        return pixmap
+
+    def paintEvent(self, event) -> None:
+        """
+        Метод обработчик событий отрисовки. Рисуются только ячейки, пересекающие область перерисовки
+        :param event: PySide6.QtGui.QPaintEvent
+        :return: None
+        """
+        if not self.field_size:
+            return
+        tiles = self.tiles()  # словарь изображений ячеек
+        r = event.rect()  # прямоугольник области перерисовки
+        x0 = max(0, r.left() // CELL_PITCH)  # диапазон столбцов, попавших в область
+        x1 = min(self.field_size - 1, r.right() // CELL_PITCH)
+        y0 = max(0, r.top() // CELL_PITCH)  # диапазон строк, попавших в область
+        y1 = min(self.field_size - 1, r.bottom() // CELL_PITCH)
+        field = self.field
+        p = QPainter(self)  # создание экземпляра класса рисовальщика
+        for y in range(y0, y1 + 1):
+            row = y * self.field_size
+            for x in range(x0, x1 + 1):
+                i = row + x
+                if field.revealed[i]:
+                    if i == field.start:
+                        tile = tiles[TILE_START]
+                    elif field.mines[i]:
+                        tile = tiles[TILE_MINE]
+                    elif field.adjacent[i]:
+                        tile = tiles[field.adjacent[i]]
+                    else:
+                        continue  # открытая пустая ячейка не рисуется
+                else:
+                    tile = tiles[TILE_FLAG] if field.flagged[i] else tiles[TILE_HIDDEN]
+                p.drawPixmap(x * CELL_PITCH, y * CELL_PITCH, tile)  # копирование изображения ячейки
+        p.end()  # завершение рисования
+
+    def cell_at(self, pos) -> int:
+        """
+        Метод, возвращающий индекс ячейки под точкой виджета
+        :param pos: QPoint - точка на виджете
+        :return: индекс ячейки или -1, если точка попала в промежуток между ячейками
+        """
+        x, dx = divmod(pos.x(), CELL_PITCH)
+        y, dy = divmod(pos.y(), CELL_PITCH)
+        if dx >= CELL_SIZE or dy >= CELL_SIZE or not (0 <= x < self.field_size and 0 <= y < self.field_size):
+            return -1
+        return y * self.field_size + x
+
+    def mouseReleaseEvent(self, event) -> None:
+        """
+        Метод обработки отпускания кнопки мыши
+        :param event: PySide6.QtGui.QMouseEvent
+        :return: None
+        """
+        i = self.cell_at(event.position().toPoint())  # определение ячейки под курсором
+        if i == -1 or self.field.revealed[i]:
+            return
+        if event.button() == Qt.RightButton:  # правая кнопка мыши переключает флаг
+            self.field.toggle_flag(i)  # смена статуса флага на противоположный
+            self.update_cell(i)  # перерисовка ячейки
+            self.clicked.emit()  # передача сигнала о том, что ячейка была нажата
+        elif event.button() == Qt.LeftButton and not self.field.flagged[i]:  # левая кнопка открывает ячейку без флага
+            self.clicked.emit()  # передача сигнала о том, что ячейка была нажата
+            self.cell_clicked.emit(i)  # передача сигнала о нажатии на ячейку
+
+    def reveal_all(self) -> None:
+        """
+        Метод вскрытия всех ячеек поля
+        :return: None
+        """
+        self.field.reveal_all()
+        self.update()  # перерисовка видимой части виджета
+
+
+class MainWindow(QMainWindow):
+    """
+    Подкласс главного окна приложения от класса главных окон
+    """
+
+    def __init__(self):
+        """
+        Конструктор главного окна приложения
+        """
+        QMainWindow.__init__(self)  # явный вызов конструктора родительского класса
+        w = QWidget()  # создание игрового поля
+        hb = QHBoxLayout()  # создание горизонтальной панели
+        hb.setSizeConstraint(QLayout.SetFixedSize)  # установка фиксированного размера горизонтальной панели
+        self._timer = QTimer()  # создание таймера игры
+        self._timer.timeout.connect(self.update_timer)  # создание сигнала на истечение таймера с привязкой
+        # метода обновления таймера
+        self._timer.start(1000)  # запуск таймера на 1000 мсек = 1 сек
+        self.mines = QLabel()  # создание ярлыка для отображения количества мин на поле
+        self.mines.setAlignment(Qt.AlignHCenter | Qt.AlignVCenter)  # настройка выравнивание по центру
+        # по вертикали и горизонтали
+        self.clock = QLabel()  # создание ярлыка для отображения часов
+        self.clock.setAlignment(Qt.AlignHCenter | Qt.AlignVCenter)  # настройка выравнивание по центру
+        # по вертикали и горизонтали
+        f = self.mines.font()  # создание настроек для шрифта
+        f.setPointSize(24)  # установка размера шрифта
+        f.setWeight(QFont.Bold)  # установка толщины шрифта
+        self.mines.setFont(f)  # применение настроек шрифта к ярлыку для отображения количества мин на поле
+        self.clock.setFont(f)  # применение настроек шрифта к ярлыку для отображения часов
+        self.clock.setText('000')  # установка начального значения часов
+        self.button = QPushButton()  # создание кнопки для завершения текущей игры
+        self.button.setFixedSize(QSize(32, 32))  # установка фиксированного размера кнопки
+        self.button.setIconSize(QSize(32, 32))  # установка размера иконки, отображающейся на кнопке
+        self.button.setIcon(QIcon(Paths.icon('smiley.png')))  # размещение на кнопке иконки
+        self.button.setFlat(True)  # сделать кнопку плоской
+        self.button.pressed.connect(self.button_pressed)  # создание сигнала нажатия на кнопку завершения игры
+        # с привязкой слота
+        self.statusBar()  # создание панели статусов в окне приложения
+        l = QLabel()  # создание ярлыка для размещения изображения бомбы
+        l.setPixmap(QPixmap.fromImage(IMG_BOMB))  # установка изображения бомбы
+        l.setAlignment(Qt.AlignRight | Qt.AlignVCenter)  # настройка выравнивания изображения по правому краю
+        # и посередине по вертикали
+        hb.addWidget(l)  # добавление изображения мины на горизонтальную панель
+        hb.addWidget(self.mines)  # добавление на горизонтальную панель счетчика мин
+        hb.addWidget(self.button)  # добавление на горизонтальную панель кнопки завершения текущий игры
+        hb.addWidget(self.clock)  # добавление на горизонтальную панель часов
+        l = QLabel()  # создание ярлыка для размещения изображения символа часов
+        l.setPixmap(QPixmap.fromImage(IMG_CLOCK))  # установка изображения часов
+        l.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)  # настройка выравнивания для изображения часов
+        hb.addWidget(l)  # добавление изображения часов на горизонтальную панель
+        vb = QVBoxLayout()  # создание экземпляра слоя с вертикальной организацией виджетов
+        vb.setSizeConstraint(QLayout.SetFixedSize)  # установка фиксированных размеров вертикальной панели
+        vb.addLayout(hb)  # добавление горизонтальной панели на вертикальную панель
+        self.board = Board()  # создание виджета игрового поля
+        self.board.clicked.connect(self.trigger_start)  # создание сигнала на нажатие на ячейку игрового поля
+        self.board.cell_clicked.connect(self.click)  # создание сигнала на открытие нажатой ячейки
+        self.scroll = QScrollArea()  # создание области прокрутки для больших полей
+        self.scroll.setFrameShape(QFrame.NoFrame)  # область прокрутки без рамки
+        self.scroll.setWidget(self.board)  # размещение игрового поля в области прокрутки
+        vb.addWidget(self.scroll)  # добавление области прокрутки на слой
+        w.setLayout(vb)  # добавление слоя с виджетами на виджет игрового поля
+        self.setCentralWidget(w)  # размещение игрового поля в главном окне приложения
+
+        self.menuBar().setNativeMenuBar(False)  # отказ от настроек панели меню, зависящих от платформы
+        game_menu = self.menuBar().addMenu('&Game')  # выпадающего меню
+        new_game_action = QAction('New game', self)  # создание команды на начало новой игры
+        new_game_action.setStatusTip('Start a new game (your current game will be lost)')  # создание подсказки
+        # для отображения в панели статуса
+        new_game_action.triggered.connect(self.reset_map)  # создание сигнала для команды и привязка слота
+        game_menu.addAction(new_game_action)  # размещение команды в выпадающем меню
+        levels = game_menu.addMenu('Levels')  # создание выпадающего меню настроек уровня сложности (размеров)
+        for n, level in enumerate(LEVELS):  # цикл для создания пунктов меню настроек размеров поля
+            level_action = QAction(level[0], self)  # создание команды
+            level_action.setStatusTip(f'{level[1]}x{level[1]} grid, with {level[2]} mines')  # создание подсказки
+            level_action.triggered.connect(lambda checked=None, n=n: self.set_level(n))  # создание сигнала
+            # с привязкой слота
+            levels.addAction(level_action)  # размещение команды в выпадающем меню
+
+        self.set_level(0)  # установка по умолчанию легкого уровня
+
+    def set_level(self, level):
+        self.level_name, self.b_size, self.n_mines = LEVELS[level]
+        self.setWindowTitle(f'Moonsweeper - {self.level_name}')
+        self.field = Minefield(self.b_size, self.n_mines)  # создание логики игрового поля
+        self.mines.setText(f'{self.n_mines:03d}')
+        self.reset_map()  # вызов метода для перезагрузки параметров игры
+        side = self.b_size * CELL_PITCH  # размер поля в пикселях
+        self.scroll.setFixedSize(QSize(min(side, MAX_VIEW), min(side, MAX_VIEW)))  # размер видимой области
+        QTimer.singleShot(0, lambda: self.resize(1, 1))  # помещает изменение размера в очередь, возвращая управление
+        # Qt до выполнения изменения размера
+
+    def reset_map(self) -> None:
+        """
+        Методы вызова внутриклассовых методов для инициализации и ренинициализации игровой карты
+        :return: None
+        """
+        self.field.reset()  # расстановка мин и подсчет мин в окружении каждой ячейки
+        self.board.set_field(self.field)  # отображение нового поля
+        self.update_status(STATUS_READY)  # установка начального статуса
+        self.board.update_cells(self.field.open_start())  # открытие стартовой ячейки и ее окружения
+        self.update_timer()  # вызов метода перезагрузки таймера
+
+    def button_pressed(self) -> None:
+        """
+        Метод слот завершения игры по нажатию кнопки завершения
+        :return: None
+        """
+        if self.status == STATUS_PLAYING:  # проверка статуса игры
+            self.game_over()  # вызов метода завершения игры с поражением
+        elif self.status == STATUS_FAILED or self.status == STATUS_SUCCESS:  # проверка статуса игры
+            self.reset_map()  # вызов метода перезапуска игровой карты
+
+    def click(self, i: int) -> None:
+        """
+        Метод, отрабатывающий нажатие на ячейку
+        :param i: индекс ячейки
+        :return: None
+        """
+        self.board.update_cells(self.field.reveal(i))  # открытие ячейки или прилегающей области без мин
+        if self.field.mines[i]:  # проверка минирования нажатой ячейки
+            self.game_over()  # вызов метода, завершающего игру с поражением
+        elif self.field.remaining == 0 and self.status != STATUS_SUCCESS:  # проверка количества не открытых ячеек
+            self.game_won()  # завершение игры с победой
+
+    def trigger_start(self) -> None:
+        """
+        Метод для запуска новой игры
+        :return: None
+        """
+        if self.status == STATUS_READY:  # проверка статуса готовности к новой игре
+            self.update_status(STATUS_PLAYING)  # смена статуса на "в игре"
+            self._timer_start_nsecs = int(time.time())  # запуск таймера игры
+
+    def update_status(self, status) -> None:
+        """
+        Метод для обновления статуса игры
+        :param status: статус
+        :return: None
+        """
+        self.status = status  # установка статуса игры
+        self.button.setIcon(QIcon(STATUS_ICONS[self.status]))  # обновление иконки на кнопке завершения игры
+        if status == STATUS_READY:  # проверка статуса готовности к новой игре
+            self.statusBar().showMessage('Ready')  # вывод сообщения о готовности
+
+    def update_timer(self) -> None:
+        if self.status == STATUS_PLAYING:
+            n_secs = int(time.time()) - self._timer_start_nsecs
+            self.clock.setText(f'{n_secs:03d}')
+        elif self.status == STATUS_READY:
+            self.clock.setText(f'{0:03d}')
+
+    def game_over(self) -> None:
+        """
+        Метод для завершения игры с поражением
+        :return: None
+        """
+        self.board.reveal_all()  # метод для вскрытия всей карты
+        self.update_status(STATUS_FAILED)  # установка статуса игры на поражение
+
+    def game_won(self) -> None:
+        """
+        Метода для завершения игры с победой
+        :return: None
+        """
+        self.board.reveal_all()  # метод для вскрытия всей карты
+        self.update_status(STATUS_SUCCESS)  # установка статуса игры на победу
+
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)  # создание основного цикла событий главного окна
+    window = MainWindow()  # создание главного окна приложения
+    app.setStyle('Fusion')  # установка более красивого стиля интерфейса
+    window.show()  # вызов метода главного окна, делающего его видимым (по умолчанию окно спрятано)
+    app.exec()  # запуск основного цикла событий главного окна
@@ -0,0 +1,192 @@
+"""
+Данный модуль содержит логику игрового поля Moonsweeper без зависимости от Qt.
+Состояние ячеек хранится в плоских массивах bytearray (индекс ячейки (x, y) равен y * size + x).
+Поверх тех же буферов создаются массивы NumPy, поэтому расстановка мин и подсчет мин в окружении
+выполняются векторно, а виджеты читают отдельные ячейки без накладных расходов NumPy.
+Запуск модуля как скрипта выполняет замер производительности: python minefield.py
+"""
+
+import time  # импорт модуля для замера времени
+
+import numpy as np  # импорт библиотеки для векторных вычислений
+
+
+class Minefield:
+    """
+    Класс игрового поля: мины, количество мин в окружении, открытые ячейки и флаги
+    """
+
+    def __init__(self, size: int, n_mines: int, seed: int | None = None) -> None:
+        """
+        Конструктор игрового поля
+        :param size: размер поля в ячейках
+        :param n_mines: количество мин
+        :param seed: начальное значение генератора случайных чисел (для повторяемых партий)
+        """
+        self.size = size  # сохранение размера поля
+        self.n_mines = n_mines  # сохранение количества мин
+        self.rng = np.random.default_rng(seed)  # создание генератора случайных чисел
+        n = size * size  # количество ячеек
+        self.mines = bytearray(n)  # признаки мин
+        self.adjacent = bytearray(n)  # количество мин в окружении
+        self.revealed = bytearray(n)  # признаки вскрытия
+        self.flagged = bytearray(n)  # признаки флагов
+        self._mines = np.frombuffer(self.mines, np.uint8).reshape(size, size)  # представления NumPy
+        self._adjacent = np.frombuffer(self.adjacent, np.uint8).reshape(size, size)  # поверх тех же буферов
+        self._revealed = np.frombuffer(self.revealed, np.uint8)
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Метод подготовки новой партии: расстановка мин и подсчет мин в окружении
+        :return: None
+        """
+        self._revealed[:] = 0  # все ячейки закрыты
+        self.flagged[:] = bytes(len(self.flagged))  # флагов нет
+        self.start = -1  # стартовая ячейка не выбрана
+        self.remaining = self.size * self.size - self.n_mines  # количество не открытых ячеек без мин
+        self.place_mines()
+        self.calculate_adjacency()
+
+    def place_mines(self) -> None:
+        """
+        Метод расстановки мин: выбор индексов без повторов за один вызов
+        :return: None
+        """
+        self._mines[:] = 0
+        self._mines.ravel()[self.rng.choice(self.size * self.size, self.n_mines, replace=False)] = 1
+
+    def calculate_adjacency(self) -> None:
+        """
+        Метод подсчета мин в окружении каждой ячейки - свертка поля мин с ядром 3x3 без центра,
+        выполненная как сумма восьми сдвигов поля, дополненного нулями по краям
+        :return: None
+        """
+        size = self.size
+        padded = np.pad(self._mines, 1)  # поле с рамкой из нулей
+        self._adjacent[:] = sum(padded[1 + dy:1 + dy + size, 1 + dx:1 + dx + size]
+                                for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx)
+
+    def index(self, x: int, y: int) -> int:
+        """
+        Метод, возвращающий индекс ячейки по координатам
+        :param x: координата по горизонтали
+        :param y: координата по вертикали
+        :return: индекс ячейки
+        """
+        return y * self.size + x
+
+    def neighbours(self, i: int) -> list:
+        """
+        Метод, возвращающий список индексов окружающих ячеек
+        :param i: индекс ячейки
+        :return: список индексов ячеек окружения
+        """
+        size = self.size
+        y, x = divmod(i, size)
+        x0, x1 = max(0, x - 1), min(x + 2, size)
+        return [j
+                for row in range(max(0, y - 1) * size, min(y + 2, size) * size, size)
+                for j in range(row + x0, row + x1)
+                if j != i]
+
+    def flood(self, i: int) -> list:
+        """
+        Метод поиска области, открывающейся от ячейки: обход в ширину через ячейки без мин в окружении.
+        Каждая ячейка посещается один раз, поэтому время пропорционально размеру области.
+        Состояние открытых ячеек не используется и не изменяется
+        :param i: индекс начальной ячейки
+        :return: список индексов ячеек без мин, входящих в область
+        """
+        seen = bytearray(len(self.mines))  # признаки посещенных ячеек
+        seen[i] = 1
+        area = [i]  # список ячеек области, он же очередь обхода
+        for c in area:  # список пополняется во время обхода
+            if self.adjacent[c]:  # ячейка с минами в окружении - граница области
+                continue
+            for j in self.neighbours(c):
+                if not seen[j] and not self.mines[j]:
+                    seen[j] = 1
+                    area.append(j)
+        return area
+
+    def reveal(self, i: int) -> list:
+        """
+        Метод открытия ячейки. Если в окружении ячейки нет мин, открывается вся прилегающая область.
+        Уже открытые ячейки служат признаком посещения, поэтому повторно не обходятся
+        :param i: индекс ячейки
+        :return: список индексов открытых этим вызовом ячеек
+        """
+        if self.revealed[i]:
+            return []
+        self.revealed[i] = 1
+        if self.mines[i]:  # открыта мина - партия проиграна, решение принимает вызывающий код
+            return [i]
+        opened = [i]  # список открытых ячеек, он же очередь обхода
+        for c in opened:
+            if self.adjacent[c]:
+                continue
+            for j in self.neighbours(c):
+                if not self.revealed[j] and not self.mines[j]:
+                    self.revealed[j] = 1
+                    opened.append(j)
+        self.remaining -= len(opened)
+        return opened
+
+    def open_start(self) -> list:
+        """
+        Метод выбора случайной стартовой ячейки без мины, ее открытия и открытия
+        всех ячеек без мин из ее окружения
+        :return: список индексов открытых ячеек
+        """
+        self.start = int(self.rng.choice(np.flatnonzero(self._mines.ravel() == 0)))  # случайная ячейка без мины
+        opened = self.reveal(self.start)
+        for j in self.neighbours(self.start):
+            if not self.mines[j]:
+                opened += self.reveal(j)
+        return opened
+
+    def toggle_flag(self, i: int) -> None:
+        """
+        Метод переключения флага закрытой ячейки
+        :param i: индекс ячейки
+        :return: None
+        """
+        if not self.revealed[i]:
+            self.flagged[i] ^= 1
+
+    def reveal_all(self) -> None:
+        """
+        Метод открытия всех ячеек поля
+        :return: None
+        """
+        self._revealed[:] = 1
+
+
+def benchmark() -> None:
+    """
+    Функция замера производительности: подготовка поля (расстановка мин и подсчет окружения),
+    открытие области от ячейки без мин в окружении и полное открытие поля серией кликов
+    :return: None
+    """
+    print(f'{"size":>5} {"density":>8} {"reset, ms":>10} {"flood, ms":>10} {"cells":>9} {"clear, ms":>10}')
+    for size in (100, 200, 500, 1000):
+        for density in (0.05, 0.15, 0.30):
+            field = Minefield(size, int(size * size * density), seed=1)
+            start = time.perf_counter()
+            field.reset()
+            reset = (time.perf_counter() - start) * 1000
+            zeros = np.flatnonzero((field._adjacent.ravel() == 0) & (field._mines.ravel() == 0))
+            start = time.perf_counter()
+            area = field.flood(int(zeros[0])) if len(zeros) else []  # область от первой пустой ячейки
+            flood = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            for i in np.flatnonzero(field._mines.ravel() == 0).tolist():  # клик по каждой ячейке без мины
+                field.reveal(i)
+            clear = (time.perf_counter() - start) * 1000
+            assert field.remaining == 0
+            print(f'{size:>5} {density:>8.2f} {reset:>10.2f} {flood:>10.2f} {len(area):>9} {clear:>10.2f}')
+
+
+if __name__ == '__main__':
+    benchmark()
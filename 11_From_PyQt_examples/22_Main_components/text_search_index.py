@@ -0,0 +1,412 @@
+"""
+Индекс для поиска текста в документе QTextDocument (используется примером textedit_22_6_5.py).
+
+Поиск перебором document.find() выполняется в основном потоке и на документах в несколько мегабайт
+останавливает интерфейс, а найденные курсоры после правки документа указывают не туда. Здесь:
+♦ индекс хранит копию текста документа в виде списка строк блоков (абзацев и ячеек таблиц). Список заполняется
+  один раз из document.toRawText(), а после правок по сигналу contentsChange перечитываются только измененные
+  блоки;
+♦ поиск выполняется в рабочем потоке по копии списка (копируются только ссылки на строки). Результат - список
+  совпадений (номер блока, начало, конец), он передается в основной поток сигналом и отбрасывается, если документ
+  или строка поиска изменились за время поиска. После правки документа поиск повторяется после паузы;
+♦ позиции совпадений в документе вычисляются по запросу, а класс SearchHighlighter выделяет через
+  ExtraSelections только совпадения в видимой части области редактирования.
+Поиск без учета регистра, как document.find() без флагов.
+Запуск модуля как скрипта выполняет сравнение с поиском через document.find(): python text_search_index.py
+"""
+import bisect
+import itertools
+import re
+import sys
+import time
+
+from PySide6.QtCore import QObject, QPoint, QRunnable, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QColor, QTextCharFormat, QTextCursor, QTextDocument
+from PySide6.QtWidgets import QApplication, QTextEdit
+
+"""
+Импорт модуля bisect для двоичного поиска в упорядоченных списках, модуля itertools для накопления смещений блоков,
+модуля re для разбиения текста документа на блоки.
+Модули sys и time для замера производительности.
+Импорт из модуля PySide6.QtCore базового класса объектов Qt QObject, класса точки QPoint, класса контейнера
+для исполняемого кода QRunnable, класса пула потоков QThreadPool, класса таймера QTimer, класса сигналов Signal.
+Импорт из модуля PySide6.QtGui класса цветов QColor, класса формата символов QTextCharFormat,
+класса текстового курсора QTextCursor, класса текстового документа QTextDocument.
+Импорт из модуля PySide6.QtWidgets класса управления приложением QApplication и класса области
+редактирования QTextEdit.
+"""
+
+RESEARCH_DELAY = 150  # пауза в мсек после правки документа, после которой поиск повторяется
+MAX_HIGHLIGHTS = 1000  # наибольшее количество выделенных совпадений в видимой части
+
+# разделители блоков в document.toRawText(): конец абзаца U+2029, а также начало (U+FDD0) и конец (U+FDD1) рамки,
+# которыми отделены ячейки таблиц и вложенные рамки
+block_separator_re = re.compile('[\u2029\ufdd0\ufdd1]')
+
+
+def document_blocks(document: QTextDocument) -> list:
+    """
+    Функция, возвращающая строки всех блоков документа
+    :param document: документ
+    :return: list - список строк блоков
+    """
+    blocks = block_separator_re.split(document.toRawText())  # в несколько раз быстрее перебора блоков
+    if len(blocks) != document.blockCount():  # разбиение не совпало со структурой документа - перебор блоков
+        blocks = []
+        block = document.begin()
+        while block.isValid():
+            blocks.append(block.text())
+            block = block.next()
+    return blocks
+
+
+def utf16_length(s: str) -> int:
+    """
+    Функция, возвращающая длину строки в позициях документа Qt (символы вне основной плоскости Unicode,
+    например эмодзи, занимают две позиции)
+    :param s: строка
+    :return: int - длина
+    """
+    return len(s) if s.isascii() else len(s.encode('utf-16-le')) // 2
+
+
+class SearchSignals(QObject):
+    """
+    Класс сигналов рабочего потока поиска
+    result - номер версии документа, строка поиска и список совпадений
+    """
+    result = Signal(int, str, list)
+
+
+class SearchJob(QRunnable):
+    """
+    Рабочий поток поиска - подкласс контейнера для исполняемого кода
+    """
+
+    def __init__(self, blocks: list, pattern: str, version: int, is_stale) -> None:
+        """
+        Конструктор рабочего потока
+        :param blocks: копия списка строк блоков
+        :param pattern: строка поиска
+        :param version: номер версии документа
+        :param is_stale: функция без аргументов, возвращающая True, если поиск устарел
+        """
+        QRunnable.__init__(self)  # явный вызов конструктора родительского класса
+        self.signals = SearchSignals()
+        self.blocks = blocks
+        self.pattern = pattern
+        self.version = version
+        self.is_stale = is_stale
+
+    def run(self) -> None:
+        """
+        Метод, выполняемый в потоке: поиск в тексте, собранном из блоков, и перевод позиций совпадений
+        в номера блоков и позиции в блоках
+        :return: None
+        """
+        if self.is_stale():
+            return
+        text = '\n'.join(self.blocks)  # одна строка - поиск выполняется методом find() без цикла по блокам
+        pattern = self.pattern.lower()
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            text = lowered
+        else:  # lower() меняет длину некоторых символов (например, 'İ') - такие блоки ищутся с учетом регистра
+            text = '\n'.join(block.lower() if len(block.lower()) == len(block) else block for block in self.blocks)
+        starts = list(itertools.accumulate((len(block) + 1 for block in self.blocks), initial=0))  # начала блоков
+        matches = []
+        n = len(pattern)
+        i = text.find(pattern)
+        while i >= 0:
+            block = bisect.bisect_right(starts, i) - 1
+            matches.append((block, i - starts[block], i - starts[block] + n))
+            if len(matches) % 10000 == 0 and self.is_stale():  # устаревший поиск прерывается
+                return
+            i = text.find(pattern, i + n)
+        self.signals.result.emit(self.version, self.pattern, matches)
+
+
+class TextSearchIndex(QObject):
+    """
+    Класс индекса для поиска в документе
+    """
+    results_changed = Signal()  # сигнал о новых результатах поиска (или их сбросе после правки документа)
+
+    def __init__(self, document: QTextDocument, parent: QObject = None) -> None:
+        """
+        Конструктор индекса
+        :param document: документ
+        :param parent: родительский объект
+        """
+        QObject.__init__(self, parent)  # явный вызов конструктора родительского класса
+        self.document = document
+        self.version = 0  # номер версии документа, увеличивается при каждой правке
+        self.pattern = ''  # текущая строка поиска
+        self.matches = []  # совпадения (номер блока, начало, конец), упорядоченные по положению в документе
+        self._blocks = []  # строки блоков документа
+        self.rebuild()
+        document.documentLayout()  # сигнал contentsChange передается только документом с разметкой
+        document.contentsChange.connect(self.on_contents_change)
+        self.timer = QTimer(self)  # таймер повторного поиска после правки
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(RESEARCH_DELAY)
+        self.timer.timeout.connect(self._start)
+        self.pool = QThreadPool(self)  # собственный пул из одного потока - поиски выполняются по очереди
+        self.pool.setMaxThreadCount(1)
+
+    def rebuild(self) -> None:
+        """
+        Метод полного заполнения списка строк блоков
+        :return: None
+        """
+        self._blocks = document_blocks(self.document)
+
+    def on_contents_change(self, position: int, removed: int, added: int) -> None:
+        """
+        Метод ресивер (слот) правки документа: перечитываются блоки, попавшие в измененную часть документа,
+        а количество удаляемых старых блоков определяется по изменению количества блоков документа
+        :param position: позиция начала правки
+        :param removed: количество удаленных символов
+        :param added: количество добавленных символов
+        :return: None
+        """
+        document = self.document
+        end = min(position + added, document.characterCount() - 1)
+        first = document.findBlock(position).blockNumber()
+        last = document.findBlock(end).blockNumber()
+        replaced = last - first + 1 + len(self._blocks) - document.blockCount()  # количество старых блоков
+        if first < 0 or last < 0 or replaced < 0:
+            self.rebuild()
+        else:
+            block = document.findBlockByNumber(first)
+            new = []
+            for _ in range(last - first + 1):
+                new.append(block.text())
+                block = block.next()
+            self._blocks[first:first + replaced] = new
+        if len(self._blocks) != document.blockCount():  # защита от неполных сведений о правке
+            self.rebuild()
+        self.version += 1
+        if self.matches:
+            self.matches = []  # позиции совпадений устарели
+            self.results_changed.emit()
+        if self.pattern:
+            self.timer.start()  # повторный поиск после паузы в правках
+
+    def search(self, pattern: str) -> None:
+        """
+        Метод запуска поиска в рабочем потоке, результат передается сигналом results_changed
+        :param pattern: строка поиска, пустая строка - сброс результатов
+        :return: None
+        """
+        self.pattern = pattern
+        self.timer.stop()
+        self._start()
+
+    def _start(self) -> None:
+        """
+        Метод запуска рабочего потока поиска по копии списка блоков
+        :return: None
+        """
+        self.version += 1  # результаты предыдущих поисков будут отброшены
+        self.matches = []
+        if not self.pattern:
+            self.results_changed.emit()
+            return
+        version = self.version
+        job = SearchJob(list(self._blocks), self.pattern, version, lambda: version != self.version)
+        job.signals.result.connect(self._apply)
+        self.pool.start(job)
+
+    def _apply(self, version: int, pattern: str, matches: list) -> None:
+        """
+        Метод ресивер (слот) результата поиска из рабочего потока
+        :param version: номер версии документа, для которой выполнен поиск
+        :param pattern: строка поиска
+        :param matches: список совпадений
+        :return: None
+        """
+        if version != self.version or pattern != self.pattern:  # документ или строка поиска изменились
+            return
+        self.matches = matches
+        self.results_changed.emit()
+
+    def cursor(self, match: tuple) -> QTextCursor:
+        """
+        Метод, возвращающий курсор с выделенным совпадением
+        :param match: совпадение (номер блока, начало, конец)
+        :return: QTextCursor - курсор
+        """
+        number, start, end = match
+        block = self.document.findBlockByNumber(number)
+        text = self._blocks[number]
+        cursor = QTextCursor(block)
+        cursor.setPosition(block.position() + utf16_length(text[:start]))
+        cursor.setPosition(block.position() + utf16_length(text[:end]), QTextCursor.MoveMode.KeepAnchor)
+        return cursor
+
+    def matches_in_blocks(self, first: int, last: int) -> list:
+        """
+        Метод, возвращающий совпадения в блоках с номерами от first до last включительно
+        :param first: номер первого блока
+        :param last: номер последнего блока
+        :return: список совпадений
+        """
+        lo = bisect.bisect_left(self.matches, (first,))
+        hi = bisect.bisect_left(self.matches, (last + 1,))
+        return self.matches[lo:hi]
+
+    def next_match(self, cursor: QTextCursor) -> QTextCursor | None:
+        """
+        Метод, возвращающий курсор следующего после курсора cursor совпадения (после последнего - первое)
+        :param cursor: текущий курсор
+        :return: QTextCursor или None, если совпадений нет
+        """
+        if not self.matches:
+            return None
+        number = self.document.findBlock(cursor.selectionStart()).blockNumber()
+        column = self._column(number, cursor.selectionStart())
+        if cursor.hasSelection():  # выделение - текущее совпадение, ищется следующее после его начала
+            column += 1
+        i = bisect.bisect_left(self.matches, (number, column))
+        return self.cursor(self.matches[i % len(self.matches)])
+
+    def _column(self, number: int, position: int) -> int:
+        """
+        Метод перевода позиции документа в позицию в строке блока
+        :param number: номер блока
+        :param position: позиция в документе
+        :return: int - позиция в строке блока
+        """
+        text = self._blocks[number]
+        offset = position - self.document.findBlockByNumber(number).position()
+        if text.isascii():
+            return offset
+        return len(text.encode('utf-16-le')[:offset * 2].decode('utf-16-le', 'ignore'))
+
+    def wait(self) -> None:
+        """
+        Метод прерывания поиска и ожидания завершения рабочего потока (например, при закрытии окна)
+        :return: None
+        """
+        self.timer.stop()
+        self.version += 1
+        self.pool.waitForDone()
+
+
+class SearchHighlighter(QObject):
+    """
+    Класс выделения совпадений в видимой части области редактирования. Выделение обновляется при прокрутке,
+    изменении размеров и новых результатах поиска
+    """
+
+    def __init__(self, text_edit: QTextEdit, index: TextSearchIndex, color: QColor = QColor('yellow')) -> None:
+        """
+        Конструктор выделения
+        :param text_edit: область редактирования
+        :param index: индекс для поиска в документе области редактирования
+        :param color: цвет фона совпадений
+        """
+        QObject.__init__(self, text_edit)  # явный вызов конструктора родительского класса
+        self.text_edit = text_edit
+        self.index = index
+        self.format = QTextCharFormat()
+        self.format.setBackground(color)
+        self.timer = QTimer(self)  # обновление выделения не чаще одного раза за цикл событий
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.refresh)
+        index.results_changed.connect(self.timer.start)
+        text_edit.verticalScrollBar().valueChanged.connect(self.timer.start)
+        text_edit.verticalScrollBar().rangeChanged.connect(self.timer.start)  # изменение разметки и размеров
+        text_edit.horizontalScrollBar().valueChanged.connect(self.timer.start)
+
+    def refresh(self) -> None:
+        """
+        Метод выделения совпадений в блоках, видимых в области редактирования
+        :return: None
+        """
+        viewport = self.text_edit.viewport()
+        first = self.text_edit.cursorForPosition(QPoint(0, 0)).blockNumber()
+        last = self.text_edit.cursorForPosition(QPoint(viewport.width(), viewport.height())).blockNumber()
+        selections = []
+        for match in self.index.matches_in_blocks(first, last)[:MAX_HIGHLIGHTS]:
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = self.index.cursor(match)
+            selection.format = self.format
+            selections.append(selection)
+        self.text_edit.setExtraSelections(selections)
+
+
+def benchmark() -> None:
+    """
+    Функция сравнения поиска перебором document.find() с поиском по индексу на документе около 10 МБ:
+    время блокировки основного потока, время до получения результата и время обработки правки
+    :return: None
+    """
+    app = QApplication.instance() or QApplication(sys.argv)
+    line = 'Текст текстом погоняет, гонка в тексте пребывает. Текстовые документы со случайным текстом.'
+    text = '\n'.join(f'{n} {line}' for n in range(100_000))  # около 10 МБ в позициях документа
+    edit = QTextEdit()
+    edit.setPlainText(text)
+    document = edit.document()
+    start = time.perf_counter()
+    index = TextSearchIndex(document)
+    built = time.perf_counter() - start
+    highlighter = SearchHighlighter(edit, index)
+    for pattern in ('гонка', '99999 '):
+        start = time.perf_counter()
+        results = []
+        cursor = document.find(pattern)
+        while not cursor.isNull():  # перебор как в text_search()
+            results.append(cursor)
+            cursor = document.find(pattern, cursor.selectionEnd())
+        blocking = time.perf_counter() - start
+        start = time.perf_counter()
+        index.search(pattern)
+        queued = time.perf_counter() - start
+        while not index.matches:
+            app.processEvents()
+        ready = time.perf_counter() - start
+        start = time.perf_counter()
+        highlighter.refresh()
+        highlight = time.perf_counter() - start
+        assert [(c.selectionStart(), c.selectionEnd()) for c in results] == \
+               [(c.selectionStart(), c.selectionEnd()) for c in map(index.cursor, index.matches)]
+        print(f'{pattern!r}: {len(results):,} matches; document.find() loop blocks GUI {blocking * 1000:.0f} ms; '
+              f'index: GUI {queued * 1000:.2f} ms, results in {ready * 1000:.0f} ms, '
+              f'viewport highlight {highlight * 1000:.2f} ms')
+    cursor = QTextCursor(document)
+    cursor.setPosition(document.characterCount() // 2)
+    start = time.perf_counter()
+    for _ in range(100):
+        cursor.insertText('x')  # набор текста в середине документа
+    edit_time = (time.perf_counter() - start) / 100
+    index.wait()
+    assert index._blocks == document_blocks(document)
+    print(f'index built in {built * 1000:.0f} ms, typing a character {edit_time * 1000:.2f} ms including index update')
+    # документ с таблицами: ячейки - отдельные блоки, разделенные в toRawText() символами рамок
+    edit.setHtml('<p>foo</p><table><tr><td>ab</td><td>abcd</td></tr><tr><td>cd</td><td>foo</td></tr></table>'
+                 '<table><tr><td><table><tr><td>in foo</td></tr></table></td></tr></table><p>foo</p>' * 1000)
+    index.search('foo')
+    while not index.matches:
+        app.processEvents()
+    found = [(c.selectionStart(), c.selectionEnd(), c.selectedText()) for c in map(index.cursor, index.matches)]
+    expected = []
+    cursor = document.find('foo')
+    while not cursor.isNull():
+        expected.append((cursor.selectionStart(), cursor.selectionEnd(), cursor.selectedText()))
+        cursor = document.find('foo', cursor.selectionEnd())
+    assert found == expected and len(index._blocks) == document.blockCount()
+    cursor = QTextCursor(document.findBlockByNumber(2))  # ячейка таблицы 'abcd'
+    start = time.perf_counter()
+    for _ in range(100):
+        cursor.insertText('x')
+    table_edit = (time.perf_counter() - start) / 100
+    index.wait()
+    assert index._blocks == document_blocks(document)
+    print(f'document with tables: {len(found):,} matches, typing a character {table_edit * 1000:.2f} ms')
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -140,9 +140,11 @@ from PySide6.QtWidgets import (QMainWindow,
 from PySide6.QtCore import Qt
 from PySide6.QtGui import (QFont,
                            QTextDocument,
-                           QTextCursor,
                            )
 
+from text_search_index import TextSearchIndex, SearchHighlighter  # импорт классов индекса для поиска и выделения
+# найденных совпадений
+
 """
 Импорт из модуля PySide6.QtWidgets класса главных окон QMainWindow, 
 класса области редактирования QTextEdit, класса слоя сетки для виджетов QGridLayout,
@@ -224,10 +226,12 @@ class MainWindow(QMainWindow):
         self.forward_btn.setEnabled(False)  # по умолчанию кнопка заблокирована
         # сигнал на изменение поля ввода и привязка обработчика для изменения активации кнопки поиска
         self.search_field.textChanged.connect(lambda: self.btn_status_change(self.search_btn, self.search_field))
-        # todo задокументировать код по курсору
-        self.find_results = []  # создание аттрибута для хранения результатов поиска
-        self.cursor_position = 0  # хранение текущего элемента в результатах поиска
-        self.text_cursor = QTextCursor(self.document)  # создание объекта текстового курсора в документе
+        self.search_index = TextSearchIndex(self.document, self)  # индекс для поиска в рабочем потоке,
+        # обновляемый при правке документа
+        self.search_highlighter = SearchHighlighter(self.text_edit, self.search_index)  # выделение совпадений
+        # в видимой части области редактирования
+        self.search_index.results_changed.connect(lambda: self.forward_btn.setEnabled(bool(self.search_index.matches)))
+        # кнопка перебора результатов активна, если есть совпадения
         self.search_btn.clicked.connect(self.text_search)  # привязка обработчика с реализацией поиска
         self.forward_btn.clicked.connect(self.cursor_forward)  # привязка обработчика с перебором результатов поиска
 
@@ -252,33 +256,29 @@ class MainWindow(QMainWindow):
         Обработчик сигнала нажатия на кнопку поиска с реализаций поиска
         :return: None
         """
-        self.find_results.clear()  # очистка результатов поиска
-        if self.document.find(self.search_field.text()).isNull():  # проверка наличия результатов поиска
-            pass  # если результатов нет, то поиск завершается
-        else:
-            self.find_results.append(self.document.find(self.search_field.text()))  # добавление первого
-            # результата поиска
-            while True:  # цикл поиска с добавлением последующих результатов поиска
-                self.find_results.append(self.document.find(self.search_field.text(),
-                                                            self.find_results[-1].selectionEnd()))
-                if self.find_results[-1].isNull():  # проверка результативности последнего писка
-                    self.find_results.pop()  # если результаты последнего поиска пустые, то удаляем их из списка
-                    self.cursor_position = 0  # сбрасываем текущую позицию в списке результатов поиска
-                    break  # если результат поиска нулевой, то выходим из цикла
-            self.forward_btn.setEnabled(True)  # если поиска успешен активируем кнопку перебора результатов
+        self.search_index.search(self.search_field.text())  # запуск поиска в рабочем потоке, результат придет
+        # сигналом results_changed
 
     def cursor_forward(self) -> None:
         """
         Обработчик сигнала нажатия кнопки для перебора результатов поиска
         :return: None
         """
-        if self.cursor_position == len(self.find_results):  # проверка текущей позиции в переборе
-            self.cursor_position = 0  # сброс текущей позиции по достижении конца списка результатов поиска
-        self.text_edit.setTextCursor(self.find_results[self.cursor_position])  # передачи указателя результатов поиска
-        # в область редактирования
-        self.cursor_position += 1  # увеличение счетчика текущей позиции
+        cursor = self.search_index.next_match(self.text_edit.textCursor())  # совпадение после текущего курсора,
+        # после последнего совпадения - первое
+        if cursor is not None:
+            self.text_edit.setTextCursor(cursor)  # выделение совпадения в области редактирования
         self.text_edit.setFocus()  # установка фокуса ввода на область редактирования
 
+    def closeEvent(self, event) -> None:
+        """
+        Обработчик закрытия окна: ожидание завершения поиска в рабочем потоке
+        :param event: PySide6.QtGui.QCloseEvent
+        :return: None
+        """
+        self.search_index.wait()
+        event.accept()
+
     @staticmethod
     def btn_status_change(btn: QPushButton, field: QLineEdit) -> None:
         """
@@ -33,6 +33,9 @@ def paintEvent(self, е):
     pic = QtGui.QPicture()
     pic.load(r'c:\book\pic.dat')
     painter.drawPicture(0, 0, pic)
+В таком примере файл читается и разбирается при каждой перерисовке. В данном файле рисунок загружается
+один раз кэшем PictureCache (модуль picture_cache), который следит за изменением файла и выводит рисунок
+готовым растровым изображением.
 """
 
 from PySide6.QtWidgets import (QMainWindow,
@@ -42,7 +45,9 @@ from PySide6.QtGui import (QPainter,
                            QPen,
                            QPicture,
                            )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QPoint
+
+from picture_cache import PictureCache  # импорт класса кэша рисунков из файла
 
 """
 Импорт из модуля PySide6.QtWidgets класса главных окон QMainWindow
@@ -50,7 +55,7 @@ from PySide6.QtCore import Qt
 Импорт из модуля PySide6.QtGui класса пера QPen, класса инструментов для рисования QPainter,
 класса кисти QBrush, класс объекта трансформаций QTransform
 
-Импорт из модуля PySide6.QtCore класса перечислителя настроек виджетов Qt
+Импорт из модуля PySide6.QtCore класса перечислителя настроек виджетов Qt, класса точки QPoint
 """
 
 
@@ -68,7 +73,8 @@ class MainWindow(QMainWindow):
         self.setWindowTitle('Сохранение рисования в файл')  # установка заголовка главного окна
         self.resize(300, 300)  # установка исходного размера главного окна
 
-        painter = QPainter(self)  # создание объекта рисовальщика с подключением поверхности рисования
+        painter = QPainter()  # создание объекта рисовальщика, вне paintEvent() окно не может быть поверхностью
+        # рисования
         pic = QPicture()  # создание объекта для хранения команд рисования
         painter.begin(pic)  # начало записи команд рисования
         black = Qt.GlobalColor.black  # создание объекта цвета из глобального перечислителя цветов
@@ -81,6 +87,8 @@ class MainWindow(QMainWindow):
         painter.drawLine(10, 10, 290, 290)  # рисование линии
         painter.end()  # завершение записи команд рисования
         pic.save('pic.dat')  # сохранение объекта команд рисования в файл
+        self.pictures = PictureCache('pic.dat', self)  # создание кэша рисунка из файла
+        self.pictures.changed.connect(self.update)  # перерисовка окна после изменения файла
 
     def paintEvent(self, event) -> None:
         """
@@ -89,9 +97,7 @@ class MainWindow(QMainWindow):
         :return: None
         """
         painter = QPainter(self)  # создание объекта рисовальщика с подключением поверхности рисования
-        pic = QPicture()  # создание объекта для хранения команд рисования
-        pic.load('pic.dat')  # загрузка команд рисования из файла
-        painter.drawPicture(0, 0, pic)  # вывод команд рисования в область рисования
+        self.pictures.draw(painter, QPoint(0, 0))  # вывод растрового изображения рисунка, загруженного один раз
 
 
 if __name__ == '__main__':  # проверка условия запуска для предотвращения исполнения
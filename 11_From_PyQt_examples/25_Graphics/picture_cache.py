@@ -0,0 +1,195 @@
+"""
+Кэш рисунков QPicture, загруженных из файла (используется примером 25_2_5_save_drawing.py).
+
+Если в обработчике paintEvent() создавать объект QPicture и вызывать load(), то при каждой перерисовке
+(изменение размеров окна, перекрытие другими окнами) файл читается с диска и команды рисования разбираются
+заново, а затем заново выполняются. Класс PictureCache:
+♦ загружает рисунок один раз и проверяет результат загрузки. Если файл поврежден или записан не полностью,
+  используется последний успешно загруженный рисунок;
+♦ следит за файлом с помощью QFileSystemWatcher, при изменении файла загружает рисунок заново
+  и передает сигнал changed;
+♦ выполняет команды рисования один раз в растровое изображение QPixmap с учетом масштаба экрана
+  (devicePixelRatio), поэтому перерисовка сводится к выводу готового изображения.
+Рисунок выводится без масштабирования, поэтому изображение зависит только от масштаба экрана и не создается
+заново при изменении размеров окна.
+Запуск модуля как скрипта выполняет сравнение с загрузкой рисунка в каждом вызове paintEvent():
+python picture_cache.py
+"""
+import os
+
+from PySide6.QtCore import QFileSystemWatcher, QObject, QPoint, Qt, Signal
+from PySide6.QtGui import QPainter, QPicture, QPixmap
+
+"""
+Модуль os для проверки существования файла и получения имени его папки.
+Импорт из модуля PySide6.QtCore класса наблюдения за файлами QFileSystemWatcher, базового класса объектов Qt
+QObject, класса точки QPoint, класса перечислителя настроек Qt и класса сигналов Signal.
+Импорт из модуля PySide6.QtGui класса рисовальщика QPainter, класса команд рисования QPicture
+и класса растрового изображения QPixmap.
+"""
+
+MARGIN = 2  # запас в пикселях вокруг boundingRect() рисунка, который не учитывает округление краев линий
+
+
+class PictureCache(QObject):
+    """
+    Класс кэша рисунка QPicture из файла и его растровых изображений
+    changed - сигнал об изменении рисунка после изменения файла
+    """
+    changed = Signal()
+
+    def __init__(self, path: str, parent: QObject = None) -> None:
+        """
+        Конструктор кэша
+        :param path: путь к файлу рисунка
+        :param parent: родительский объект
+        """
+        QObject.__init__(self, parent)  # явный вызов конструктора родительского класса
+        self.path = os.path.abspath(path)
+        self.loads = 0  # количество чтений файла
+        self._picture = None  # последний успешно загруженный рисунок
+        self._loaded = False  # признак загрузки текущей версии файла
+        self._pixmaps = {}  # растровые изображения {масштаб экрана: QPixmap}
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.on_file_changed)
+        self.watcher.directoryChanged.connect(self.on_file_changed)  # файл может быть создан или заменен
+        self.watcher.addPath(os.path.dirname(self.path))
+        if os.path.exists(self.path):
+            self.watcher.addPath(self.path)
+
+    def picture(self) -> QPicture | None:
+        """
+        Метод, возвращающий рисунок, файл загружается при первом обращении и после изменения
+        :return: QPicture или None, если рисунок ни разу не был загружен
+        """
+        if not self._loaded:
+            self._loaded = True
+            self.loads += 1
+            picture = QPicture()
+            if picture.load(self.path) and not picture.isNull():  # проверка результата загрузки
+                self._picture = picture
+                self._pixmaps.clear()
+        return self._picture
+
+    def rect(self):
+        """
+        Метод, возвращающий прямоугольник, который занимает рисунок
+        :return: QRect - прямоугольник (пустой, если рисунка нет)
+        """
+        picture = self.picture()
+        if picture is None:
+            return QPicture().boundingRect()
+        return picture.boundingRect().adjusted(-MARGIN, -MARGIN, MARGIN, MARGIN)
+
+    def pixmap(self, ratio: float = 1.0) -> QPixmap | None:
+        """
+        Метод, возвращающий растровое изображение рисунка для масштаба экрана ratio. Изображение
+        занимает прямоугольник rect() и выводится в его левый верхний угол
+        :param ratio: масштаб экрана (devicePixelRatio)
+        :return: QPixmap или None, если рисунка нет
+        """
+        picture = self.picture()
+        if picture is None:
+            return None
+        pixmap = self._pixmaps.get(ratio)
+        if pixmap is None:
+            rect = self.rect()
+            pixmap = QPixmap(rect.size() * ratio)  # размер в физических пикселях
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.drawPicture(-rect.topLeft(), picture)  # левый верхний угол рисунка в начале изображения
+            painter.end()
+            self._pixmaps[ratio] = pixmap
+        return pixmap
+
+    def draw(self, painter: QPainter, position: QPoint = QPoint(0, 0)) -> None:
+        """
+        Метод вывода рисунка рисовальщиком painter так же, как painter.drawPicture(position, picture)
+        :param painter: рисовальщик
+        :param position: координаты вывода рисунка
+        :return: None
+        """
+        pixmap = self.pixmap(painter.device().devicePixelRatioF())
+        if pixmap is not None:
+            painter.drawPixmap(position + self.rect().topLeft(), pixmap)
+
+    def on_file_changed(self, path: str) -> None:
+        """
+        Метод ресивер (слот) изменения файла или его папки: рисунок будет загружен заново при следующем обращении
+        :param path: путь к измененному файлу или папке
+        :return: None
+        """
+        if path != self.path and self.path in self.watcher.files():  # изменение других файлов папки
+            return
+        if os.path.exists(self.path) and self.path not in self.watcher.files():
+            self.watcher.addPath(self.path)  # файл создан или заменен новым файлом
+        self._loaded = False
+        self.changed.emit()
+
+
+def benchmark(repaints: int = 500) -> None:
+    """
+    Функция сравнения перерисовки окна с загрузкой рисунка в каждом вызове paintEvent() и с кэшем рисунков
+    :param repaints: количество перерисовок
+    :return: None
+    """
+    import sys
+    import tempfile
+    import time
+    from PySide6.QtGui import QBrush, QImage, QPen
+    from PySide6.QtWidgets import QApplication, QWidget
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    path = os.path.join(tempfile.mkdtemp(), 'pic.dat')
+    picture = QPicture()
+    painter = QPainter(picture)
+    painter.setPen(QPen(Qt.GlobalColor.black, 5))
+    painter.setBrush(QBrush(Qt.GlobalColor.white))
+    painter.drawRect(3, 3, 294, 294)
+    painter.setPen(QPen(Qt.GlobalColor.red, 1))
+    for i in range(0, 280, 2):  # рисунок из нескольких сотен команд
+        painter.drawLine(10, 10 + i, 290, 290 - i)
+        painter.drawEllipse(150 - i // 2, 150 - i // 2, i, i)
+    painter.end()
+    picture.save(path)
+
+    class LoadingWidget(QWidget):
+        def paintEvent(self, event) -> None:
+            painter = QPainter(self)
+            pic = QPicture()
+            pic.load(path)
+            painter.drawPicture(0, 0, pic)
+
+    class CachedWidget(QWidget):
+        def __init__(self) -> None:
+            QWidget.__init__(self)
+            self.pictures = PictureCache(path, self)
+            self.pictures.changed.connect(self.update)
+
+        def paintEvent(self, event) -> None:
+            painter = QPainter(self)
+            self.pictures.draw(painter)
+
+    images = []
+    for widget in (LoadingWidget(), CachedWidget()):
+        widget.resize(300, 300)
+        widget.show()
+        app.processEvents()
+        start = time.perf_counter()
+        for i in range(repaints):
+            widget.resize(300 + i % 50, 300 + i % 50)  # изменение размеров окна
+            widget.repaint()
+        elapsed = (time.perf_counter() - start) / repaints
+        image = QImage(300, 300, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        widget.render(image)
+        images.append(image)
+        loads = widget.pictures.loads if isinstance(widget, CachedWidget) else repaints
+        print(f'{type(widget).__name__:>14}: {elapsed * 1000:.3f} ms per repaint, {loads} file loads')
+        widget.close()
+    print('identical output' if images[0] == images[1] else 'OUTPUT DIFFERS')
+
+
+if __name__ == '__main__':
+    benchmark()
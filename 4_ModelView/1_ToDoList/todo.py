@@ -3,11 +3,12 @@
 для PyQt и PySide варианта архитектуры Model View Controller (MVC))
 """
 
-import json
 import sys
 from MainWindow import Ui_MainWindow  # импорт скомпилированного в питон файла UI из Qt Designer
+from todo_storage import TodoJournal, apply  # импорт класса хранилища с журналом операций и функции применения
+# операции к списку дел
 from PySide6.QtWidgets import QApplication, QMainWindow
-from PySide6.QtCore import Qt, QAbstractListModel
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
 from PySide6.QtGui import QImage
 
 """
@@ -20,6 +21,7 @@ from PySide6.QtGui import QImage
 интерфейс для моделей, которые представляют свои данные в виде простой неиерархической 
 последовательности элементов (списка). Он не используется напрямую, но должен супер-классом для создаваемой модели.
 Qt из модуля PySide6.QtCore содержит различные идентификаторы, используемые в библиотеке Qt.
+Класс индекса QModelIndex из модуля PySide6.QtCore для указания родителя строк при их вставке и удалении.
 Импорт из модуля PySide6.QtGui класса изображений QImage.
 """
 
@@ -68,6 +70,38 @@ class TodoModel(QAbstractListModel):
         """
         return len(self.todos)
 
+    def add(self, text: str) -> None:
+        """
+        Метод добавления дела в конец списка с сигналами представлению о вставке одной строки
+        (вместо layoutChanged, после которого представление заново запрашивает все строки)
+        :param text: наименование дела
+        :return: None
+        """
+        row = len(self.todos)
+        self.beginInsertRows(QModelIndex(), row, row)  # сигнал о начале вставки строки row
+        apply(self.todos, 'add', text)  # добавление записи в виде кортежа из статуса и наименования дела
+        self.endInsertRows()  # сигнал об окончании вставки
+
+    def delete(self, row: int) -> None:
+        """
+        Метод удаления дела из списка с сигналами представлению об удалении одной строки
+        :param row: номер строки
+        :return: None
+        """
+        self.beginRemoveRows(QModelIndex(), row, row)  # сигнал о начале удаления строки row
+        apply(self.todos, 'delete', row)
+        self.endRemoveRows()  # сигнал об окончании удаления
+
+    def complete(self, row: int) -> None:
+        """
+        Метод смены статуса дела на завершено с сигналом об изменении одной строки
+        :param row: номер строки
+        :return: None
+        """
+        apply(self.todos, 'complete', row)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)  # подача сигнала об изменении данных строки
+
 
 # tag::model[]
 
@@ -77,6 +111,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         # Вызывать конструктор Ui_MainWindow не нужно так как у этого супер-класса его нет
         self.setupUi(self)  # вызов метода сборки интерфейса из модуля главного окна MainWindow
         self.model = TodoModel()  # создание экземпляра класса модели списка дел
+        self.storage = TodoJournal('data.json', state=lambda: self.model.todos)  # хранилище: снимок data.json
+        # и журнал операций data.journal, записываемый фоновым потоком
         self.load()  # вызов метода загрузки данных из файла в атрибут экземпляра класса модели списка дел
         self.todo_view.setModel(self.model)  # привязка модели к виджету списка подкласса главного окна
         self.add_button.pressed.connect(self.add)  # создание сигнала кнопки добавить и привязка метода ресивера
@@ -92,12 +128,10 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         # объектом индекса при режиме выбора одного пункта
         if indexes:  # проверка наличия выбранного пункта (списка)
             index = indexes[0]  # извлечение объекта индекса из списка
-            del self.model.todos[index.row()]  # удаление ссылки на объект из списка по индексу
-            # метода .row() извлекает численное значение индекса
-            self.model.layoutChanged.emit()  # подача сигнала для представления об изменении данных
-            # и необходимости обновления
+            row = index.row()  # метод .row() извлекает численное значение индекса
+            self.model.delete(row)  # удаление дела с сигналом представлению об удалении строки
             self.todo_view.clearSelection()  # сброс выделения в представлении
-        self.save()  # вызов метода сохранения данных из атрибута экземпляра класса списка дел  в файл
+            self.storage.append('delete', row)  # запись операции в журнал
 
     def complete(self) -> None:
         """
@@ -109,14 +143,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         if indexes:  # проверка наличия выбранного пункта (списка)
             index = indexes[0]  # извлечение объекта индекса из списка
             row = index.row()  # извлечение численного значения индекса из объекта индекса
-            status, text = self.model.todos[row]  # извлечение из кортежа пункта списка статуса и
-            # наименования дела в переменные
-            self.model.todos[row] = (True, text)  # упаковка нового статуса и ранее извлеченного
-            # наименования дела обратно в кортеж из списка дел по индексу
-            self.model.dataChanged.emit(index, index)  # подача сигнала в модель об изменении данных
-            # и необходимости обновления
+            self.model.complete(row)  # смена статуса дела с сигналом об изменении строки
             self.todo_view.clearSelection()  # сброс выделения в представлении
-        self.save()  # вызов метода сохранения данных из атрибута экземпляра класса списка дел  в файл
+            self.storage.append('complete', row)  # запись операции в журнал
 
     def add(self) -> None:
         """
@@ -126,34 +155,25 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         text = self.todo_edit.text()  # извлечение строки из однострочного редактируемого поля в переменную
         text = text.strip()  # удаление пробелов с концов строки
         if text:  # проверка, что строка не пустая воз избежания добавления пустых записей
-            self.model.todos.append((False, text))  # добавление записи в список в виде кортежа из статуса
-            # и наименования дела
-            self.model.layoutChanged.emit()  # подача сигнала для представления об изменении данных
-            # и необходимости обновления
+            self.model.add(text)  # добавление дела с сигналом представлению о вставке строки
             self.todo_edit.setText('')  # очистка строки в однострочном редактируемом текстовом поле
-        self.save()  # вызов метода сохранения данных из атрибута экземпляра класса списка дел  в файл
+            self.storage.append('add', text)  # запись операции в журнал без перезаписи всего файла
 
     def load(self) -> None:
         """
-        Метод загрузки данных из файла
+        Метод загрузки данных из снимка и журнала операций
         :return: None
         """
-        try:  # блок обработки ошибки, на случай если файла не существует
-            with open('data.json', 'r') as file:  # открытие файла данных на чтение
-                self.model.todos = json.load(file)  # извлечение данных из файла и помещение из в аттрибут экземпляра
-                # класса списка дел
-        except FileNotFoundError:  # перехват ошибки, если файл не найден
-            print('previously saved file not found, will be create a new one')  # вывод в консоль сообщения в случае
-            # ошибки Файл не найден
+        self.model.todos = self.storage.load()  # чтение снимка и повтор операций журнала, сделанных после него
 
-    def save(self) -> None:
+    def closeEvent(self, event) -> None:
         """
-        Метод записи данных в файл
+        Метод обработки события закрытия окна: запись снимка и ожидание записи журнала фоновым потоком
+        :param event: событие закрытия
         :return: None
         """
-        with open('data.json', 'w') as file:  # открытие файла данных на запись
-            # если файлы не существует, то он создается
-            json.dump(self.model.todos, file)
+        self.storage.close()
+        QMainWindow.closeEvent(self, event)
 
 
 def main() -> None:
@@ -0,0 +1,279 @@
+"""
+Модуль хранения списка дел в виде снимка и журнала операций (используется примером todo.py).
+Запись всего списка в data.json после каждого изменения выполняется в основном потоке и занимает тем больше времени,
+чем длиннее список. Класс TodoJournal:
+♦ записывает каждую операцию (добавление, удаление, завершение дела) одной строкой JSON в конец файла журнала.
+  Запись выполняет фоновый поток: строки, накопившиеся в очереди, записываются и сбрасываются на диск (fsync)
+  одним вызовом;
+♦ после COMPACT_EVERY операций (и при закрытии) записывает снимок списка в data.json и очищает журнал.
+  Снимок записывается во временный файл и заменяет data.json атомарно, поэтому сбой во время записи
+  не портит сохраненные данные;
+♦ при загрузке читает снимок и повторяет операции журнала. Каждая операция имеет номер, снимок хранит номер
+  последней учтенной операции, поэтому операции, уже вошедшие в снимок, не повторяются. Строка, оборванная
+  сбоем во время записи, удаляется из журнала до записи новых операций.
+Снимок в прежнем формате (список дел без номера операции) также загружается.
+Запуск модуля как скрипта выполняет сравнение с записью всего списка после каждой операции:
+python todo_storage.py
+"""
+import json
+import os
+import queue
+import threading
+
+"""
+Модуль json для записи и чтения снимка и строк журнала, модуль os для атомарной замены файла и сброса на диск,
+модуль queue для очереди строк фонового потока, модуль threading для фонового потока записи.
+"""
+
+COMPACT_EVERY = 1000  # количество операций журнала, после которого записывается снимок
+
+
+def apply(todos: list, op: str, arg) -> None:
+    """
+    Функция применения операции к списку дел (используется моделью и при повторе журнала)
+    :param todos: список дел [(статус, наименование), ...]
+    :param op: операция 'add', 'delete' или 'complete'
+    :param arg: наименование нового дела или номер строки
+    :return: None
+    """
+    if op == 'add':
+        todos.append((False, arg))
+    elif op == 'delete':
+        del todos[arg]
+    elif op == 'complete':
+        todos[arg] = (True, todos[arg][1])
+
+
+class TodoJournal:
+    """
+    Класс хранения списка дел: снимок в файле JSON и журнал операций, записываемый фоновым потоком
+    """
+
+    def __init__(self, path: str = 'data.json', journal_path: str = None, state=None) -> None:
+        """
+        Конструктор хранилища
+        :param path: путь к файлу снимка
+        :param journal_path: путь к файлу журнала, по умолчанию - путь снимка с расширением .journal
+        :param state: функция без аргументов, возвращающая текущий список дел (для записи снимка)
+        """
+        self.path = path
+        self.journal_path = journal_path or os.path.splitext(path)[0] + '.journal'
+        self.state = state
+        self.seq = 0  # номер последней операции
+        self._pending = 0  # количество операций после последнего снимка
+        self._queue = queue.Queue()  # очередь заданий фонового потока: строки журнала и снимки
+        self._thread = None
+
+    def load(self) -> list:
+        """
+        Метод загрузки списка дел: чтение снимка и повтор операций журнала, сделанных после снимка
+        :return: list - список дел
+        """
+        todos, snapshot_seq = [], 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            if isinstance(data, dict):
+                todos, snapshot_seq = [tuple(item) for item in data['todos']], data['seq']
+            else:  # прежний формат - только список дел
+                todos = [tuple(item) for item in data]
+        except FileNotFoundError:
+            print('previously saved file not found, will be create a new one')
+        self.seq = snapshot_seq
+        good = 0  # длина начала журнала из целых строк в байтах
+        try:
+            with open(self.journal_path, 'rb') as file:
+                for line in file:
+                    try:
+                        if not line.endswith(b'\n'):  # строка оборвана сбоем во время записи
+                            raise ValueError
+                        record = json.loads(line)
+                    except ValueError:  # в том числе json.JSONDecodeError и ошибка декодирования UTF-8
+                        break
+                    good += len(line)
+                    if record['seq'] > snapshot_seq:
+                        apply(todos, record['op'], record['arg'])
+                        self.seq = record['seq']
+                        self._pending += 1
+                torn = file.seek(0, os.SEEK_END) > good
+            if torn:  # оборванный конец удаляется, иначе следующая запись продолжит оборванную строку
+                with open(self.journal_path, 'r+b') as file:
+                    file.truncate(good)
+        except FileNotFoundError:
+            pass
+        return todos
+
+    def append(self, op: str, arg) -> None:
+        """
+        Метод добавления операции в журнал, запись выполняется фоновым потоком
+        :param op: операция 'add', 'delete' или 'complete'
+        :param arg: наименование нового дела или номер строки
+        :return: None
+        """
+        self.seq += 1
+        self._put(('record', json.dumps({'seq': self.seq, 'op': op, 'arg': arg}, ensure_ascii=False) + '\n'))
+        self._pending += 1
+        if self._pending >= COMPACT_EVERY:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Метод записи снимка текущего списка дел (фоновым потоком) и очистки журнала
+        :return: None
+        """
+        if self.state is None:
+            return
+        self._put(('snapshot', (self.seq, list(self.state()))))  # копия списка - основной поток может менять его
+        # во время записи снимка
+        self._pending = 0
+
+    def close(self) -> None:
+        """
+        Метод записи снимка и завершения фонового потока после записи всех операций
+        :return: None
+        """
+        if self._pending:
+            self.compact()
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _put(self, task: tuple) -> None:
+        """
+        Метод передачи задания фоновому потоку, поток запускается при первом задании
+        :param task: задание
+        :return: None
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._writer, daemon=True)
+            self._thread.start()
+        self._queue.put(task)
+
+    def _writer(self) -> None:
+        """
+        Метод фонового потока: запись строк журнала пакетами и запись снимков
+        :return: None
+        """
+        journal = open(self.journal_path, 'a', encoding='utf-8')
+        running = True
+        while running:
+            tasks = [self._queue.get()]
+            while True:  # все задания, накопившиеся в очереди, обрабатываются вместе
+                try:
+                    tasks.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = []
+            for task in tasks:
+                if task is None:
+                    running = False
+                    break
+                kind, payload = task
+                if kind == 'record':
+                    lines.append(payload)
+                else:  # снимок: сначала записываются операции, сделанные до него
+                    self._flush(journal, lines)
+                    lines = []
+                    journal.close()
+                    self._write_snapshot(*payload)
+                    journal = open(self.journal_path, 'w', encoding='utf-8')  # очистка журнала
+            self._flush(journal, lines)
+        journal.close()
+
+    @staticmethod
+    def _flush(journal, lines: list) -> None:
+        """
+        Метод записи строк журнала и сброса файла на диск
+        :param journal: файл журнала
+        :param lines: строки
+        :return: None
+        """
+        if lines:
+            journal.write(''.join(lines))
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    def _write_snapshot(self, seq: int, todos: list) -> None:
+        """
+        Метод атомарной записи снимка
+        :param seq: номер последней операции, учтенной в снимке
+        :param todos: список дел
+        :return: None
+        """
+        temp = self.path + '.tmp'
+        with open(temp, 'w', encoding='utf-8') as file:
+            json.dump({'seq': seq, 'todos': todos}, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp, self.path)
+
+
+def benchmark(items: int = 20_000, operations: int = 300) -> None:
+    """
+    Функция сравнения записи всего списка после каждой операции (как MainWindow.save() в todo.py)
+    с журналом операций: время операции в основном потоке и проверка загрузки
+    :param items: количество дел в списке
+    :param operations: количество операций
+    :return: None
+    """
+    import tempfile
+    import time
+
+    folder = tempfile.mkdtemp()
+    todos = [(i % 3 == 0, f'дело номер {i}') for i in range(items)]
+    ops = [('add', f'новое дело {i}') if i % 3 == 0 else ('complete', i * 7 % items) if i % 3 == 1
+           else ('delete', i * 11 % items) for i in range(operations)]
+
+    path = os.path.join(folder, 'full.json')
+    current = list(todos)
+    start = time.perf_counter()
+    for op, arg in ops:
+        apply(current, op, arg)
+        with open(path, 'w') as file:  # как MainWindow.save()
+            json.dump(current, file)
+            file.flush()
+            os.fsync(file.fileno())
+    full = (time.perf_counter() - start) / operations
+
+    path = os.path.join(folder, 'data.json')
+    current = list(todos)
+    storage = TodoJournal(path, state=lambda: current)
+    storage._write_snapshot(0, current)
+    start = time.perf_counter()
+    for op, arg in ops:
+        apply(current, op, arg)
+        storage.append(op, arg)
+    journal = (time.perf_counter() - start) / operations
+    storage._queue.put(None)  # завершение потока без снимка - загрузка должна повторить журнал
+    storage._thread.join()
+    replayed = TodoJournal(path).load()
+    storage = TodoJournal(path, state=lambda: current)
+    storage.load()
+    storage.close()  # запись снимка
+    compacted = TodoJournal(path).load()
+    print(f'{items:,} items, {operations} operations')
+    print(f'rewrite data.json: {full * 1000:.2f} ms per operation on the GUI thread')
+    print(f'     journal: {journal * 1000:.3f} ms per operation on the GUI thread')
+    print('replay ok' if replayed == current == compacted else 'REPLAY MISMATCH')
+
+    path = os.path.join(folder, 'torn.json')  # сбой во время записи строки, запуск, 3 операции, снова сбой
+    storage = TodoJournal(path)
+    for i in range(5):
+        storage.append('add', f'дело {i}')
+    storage._queue.put(None)
+    storage._thread.join()
+    with open(storage.journal_path, 'a', encoding='utf-8') as file:
+        file.write('{"seq": 6, "op": "ad')  # оборванная строка
+    storage = TodoJournal(path)
+    storage.load()
+    for i in range(5, 8):
+        storage.append('add', f'дело {i}')
+    storage._queue.put(None)
+    storage._thread.join()
+    restored = TodoJournal(path).load()
+    print('torn tail ok' if restored == [(False, f'дело {i}') for i in range(8)] else 'TORN TAIL LOST RECORDS')
+
+
+if __name__ == '__main__':
+    benchmark()
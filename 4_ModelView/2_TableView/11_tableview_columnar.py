@@ -0,0 +1,228 @@
+"""
+Пример модели таблицы для больших массивов NumPy и таблиц Pandas (миллион строк и более).
+В примерах 9 и 10 модель на каждый вызов .data() для каждой роли извлекает значение через .iloc[] и
+переводит его в строку. Здесь данные хранятся по столбцам в виде массивов NumPy (.to_numpy()),
+для каждого столбца заранее выбирается функция форматирования по типу данных, а отформатированные строки
+кэшируются блоками строк таблицы в кэше ограниченного размера (LRU), поэтому при прокрутке форматируются
+только впервые увиденные блоки. Роли, отличные от отображения, обслуживаются без обращения к данным.
+Запуск с аргументом --benchmark сравнивает модель с моделью из примера 10: python 11_tableview_columnar.py --benchmark
+"""
+
+import sys
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QPersistentModelIndex
+from PySide6.QtWidgets import QApplication, QMainWindow, QTableView
+
+"""
+Импорт пакета NumPy для научных расчетов и пакета Pandas для обработки и анализа данных.
+Модуль sys нужен для доступа к аргументам командной строки. Модуль time нужен для замера производительности.
+Импорт из модуля collections упорядоченного словаря OrderedDict, на основе которого построен кэш LRU.
+Импорт из модуля PySide6.QtWidgets класса для управления приложением QApplication и
+класса основного окна QMainWindow, класса представления таблиц QTableView.
+Импорт из модула PySide6.QtCore абстрактного класса QAbstractTableModel, предоставляющего стандартный
+интерфейс для моделей, которые представляют свои данные в табличной форме, а также классов индексов QModelIndex
+и QPersistentModelIndex
+Qt из модуля PySide6.QtCore содержит различные идентификаторы, используемые в библиотеке Qt.
+"""
+
+BLOCK_ROWS = 64  # количество строк таблицы в одном блоке кэша
+CACHE_BLOCKS = 512  # максимальное количество блоков в кэше (блок - часть одного столбца)
+# роли, сохраненные в переменных модуля: обращение к атрибутам пространства имен Qt занимает микросекунды,
+# что сравнимо со временем ответа модели на запрос из кэша
+DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+HORIZONTAL = Qt.Orientation.Horizontal
+
+
+def make_formatter(dtype: np.dtype):
+    """
+    Функция выбора функции форматирования значений столбца по типу его данных
+    :param dtype: тип данных столбца
+    :return: функция, переводящая список значений Python в список строк
+    """
+    if dtype.kind == 'f':  # вещественные числа - не более шести значащих цифр
+        return lambda values: [f'{v:.6g}' for v in values]
+    if dtype.kind == 'M':  # дата и время - перевод всего блока средствами NumPy
+        return lambda values: np.datetime_as_string(np.array(values, dtype=dtype), unit='s').tolist()
+    return lambda values: list(map(str, values))  # целые числа, логические значения, строки и прочие объекты
+
+
+class TableModel(QAbstractTableModel):
+    """
+    Подкласс модели таблицы только для чтения от супер-класса абстрактной модели таблиц
+    """
+
+    def __init__(self, data: pd.DataFrame | np.ndarray) -> None:
+        """
+        Конструктор модели таблицы
+        :param data: таблица Pandas или двухмерный массив NumPy
+        """
+        QAbstractTableModel.__init__(self)  # явный вызов конструктора родительского класса
+        if isinstance(data, pd.DataFrame):
+            self._columns = [data[name].to_numpy() for name in data.columns]  # массивы NumPy столбцов
+            self._header = [str(name) for name in data.columns]  # имена столбцов
+            self._index = data.index.to_numpy()  # имена строк переводятся в строки по запросу
+        else:
+            self._columns = [data[:, col] for col in range(data.shape[1])]  # представления столбцов без копирования
+            self._header = [str(col) for col in range(data.shape[1])]
+            self._index = None
+        self._rows = data.shape[0]  # количество строк
+        self._formatters = [make_formatter(column.dtype) for column in self._columns]  # форматирование по столбцам
+        self._alignment = [Qt.AlignRight | Qt.AlignVCenter if column.dtype.kind in 'iuf'
+                           else Qt.AlignLeft | Qt.AlignVCenter
+                           for column in self._columns]  # числа выравниваются по правому краю
+        self._cache = OrderedDict()  # кэш отформатированных блоков {(номер блока, столбец): список строк}
+
+    def _block(self, block: int, col: int) -> list:
+        """
+        Метод, возвращающий отформатированный блок строк столбца из кэша или форматирующий его.
+        Блок извлекается из массива одним срезом и переводится в значения Python методом .tolist(),
+        что намного быстрее поэлементного обращения к массиву
+        :param block: номер блока строк
+        :param col: номер столбца
+        :return: список строк блока
+        """
+        key = (block, col)
+        cells = self._cache.get(key)
+        if cells is not None:
+            self._cache.move_to_end(key)  # блок становится последним использованным
+            return cells
+        start = block * BLOCK_ROWS
+        cells = self._formatters[col](self._columns[col][start:start + BLOCK_ROWS].tolist())
+        self._cache[key] = cells
+        if len(self._cache) > CACHE_BLOCKS:
+            self._cache.popitem(last=False)  # удаление давно не использованного блока
+        return cells
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int) -> str or None:
+        """
+        Метод для обработки запросов из представления на выборку данных
+        :param index: координаты запрашиваемых данных предоставляемых методами .row() и .column().
+        :param role: int - код типа данных. Подробнее https://doc.qt.io/qt-5/qt.html#ItemDataRole-enum
+        :return: str - отформатированное значение ячейки или выравнивание столбца
+        """
+        if role == DISPLAY_ROLE:  # проверка соответствия данных роли текстовой строки (role=0)
+            row = index.row()
+            return self._block(row // BLOCK_ROWS, index.column())[row % BLOCK_ROWS]
+        if role == ALIGNMENT_ROLE:  # выравнивание заранее вычислено для каждого столбца
+            return self._alignment[index.column()]
+        return None  # остальные роли не требуют обращения к данным
+
+    def rowCount(self, index: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        """
+        Метод подсчета количества строк в таблице
+        :param index: экземпляр классов QModelIndex и QPersistentModelIndex из библиотеки PySide6.QtCore
+        :return: int - количество строк
+        """
+        return self._rows
+
+    def columnCount(self, index: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        """
+        Метод подсчета количества столбцов
+        :param index: экземпляр классов QModelIndex и QPersistentModelIndex из библиотеки PySide6.QtCore
+        :return: int - количество столбцов
+        """
+        return len(self._columns)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = ...) -> str or None:
+        """
+        Метод для именования столбцов и строк таблицы
+        :param section: int - индекс строки/столбца
+        :param orientation: Qt.Orientation - ориентация заголовка
+        :param role: int - код типа данных
+        """
+        if role == DISPLAY_ROLE:  # проверка соответствия данных роли текстовой строки (role=0)
+            if orientation == HORIZONTAL:
+                return self._header[section]  # имя столбца
+            return str(self._index[section]) if self._index is not None else str(section)  # имя строки
+
+
+def make_frame(rows: int) -> pd.DataFrame:
+    """
+    Функция создания таблицы Pandas с данными примера
+    :param rows: количество строк
+    :return: таблица Pandas
+    """
+    rng = np.random.default_rng(0)  # генератор случайных чисел
+    names = np.array(['alpha', 'beta', 'gamma', 'delta', 'epsilon'])
+    return pd.DataFrame({'id': np.arange(rows),
+                         'value': rng.normal(size=rows),
+                         'count': rng.integers(0, 1000, rows),
+                         'name': names[rng.integers(0, len(names), rows)],
+                         'flag': rng.random(rows) < 0.5,
+                         'time': np.datetime64('2024-01-01') + rng.integers(0, 10 ** 7, rows).astype('timedelta64[s]')},
+                        index=[f'Row {i}' for i in range(rows)])
+
+
+class MainWindow(QMainWindow):
+    """
+    Подкласс главного окна приложения от супер-класса главных окон
+    """
+
+    def __init__(self) -> None:
+        """
+        Конструктор главного окна приложения
+        """
+        QMainWindow.__init__(self)  # явный вызов конструктора родительского класса
+        self.setWindowTitle('My App')  # присвоение имени главному окну приложения
+        self.table = QTableView()  # создание экземпляра класса представления таблицы
+        self.table.verticalHeader().setDefaultSectionSize(22)  # фиксированная высота строк без подгонки
+        self.model = TableModel(make_frame(1_000_000))  # создание модели таблицы на миллион строк
+        self.table.setModel(self.model)  # помещаем модель таблицы в представление (связывание модели и представления)
+        self.setCentralWidget(self.table)  # размещение представления таблицы в главном окне приложения
+        self.setGeometry(600, 100, 800, 600)  # установка размеров и координат окна (NW угла - NWx, NWy, W, H)
+
+
+def benchmark() -> None:
+    """
+    Функция замера времени обслуживания запросов представления при прокрутке таблицы на миллион строк.
+    Прокрутка имитируется запросом ролей отображения и выравнивания для окна из 40 строк,
+    сдвигающегося на 3 строки (шаг колеса мыши). Для сравнения замеряется доступ через .iloc[] и str()
+    :return: None
+    """
+    frame = make_frame(1_000_000)
+    model = TableModel(frame)
+    window, step, steps = 40, 3, 300  # размер видимого окна, шаг прокрутки и количество шагов
+    columns = frame.shape[1]
+    start_row = 500_000  # прокрутка из середины таблицы
+    indexes = [[model.index(row, col) for col in range(columns)]  # индексы создаются представлением на C++,
+               for row in range(start_row, start_row + steps * step + window)]  # поэтому не входят в замер
+    start = time.perf_counter()
+    for n in range(steps):
+        for row in indexes[n * step:n * step + window]:
+            for index in row:
+                model.data(index, DISPLAY_ROLE)
+                model.data(index, ALIGNMENT_ROLE)
+    cached = time.perf_counter() - start
+    start = time.perf_counter()
+    for n in range(steps):
+        for row in range(start_row + n * step, start_row + n * step + window):
+            for col in range(columns):
+                str(frame.iloc[row, col])  # запрос каждой роли в модели примера 10 выполняет обращение .iloc[]
+                frame.iloc[row, col]
+    iloc = time.perf_counter() - start
+    cells = steps * window * columns
+    print(f'{cells} cells: cached model {cached * 1e6 / cells:.2f} us/cell, '
+          f'.iloc model {iloc * 1e6 / cells:.2f} us/cell, {iloc / cached:.0f}x')
+
+
+def main() -> None:
+    """
+    Функция запуска кода верхнего уроня приложения
+    """
+    app = QApplication(sys.argv)  # создание экземпляра основного цикла событий главного окна приложения
+    window = MainWindow()  # создание экземпляра главного окна приложения
+    window.show()  # установка видимости окна, по умолчанию окно скрыто
+    app.exec()  # запуск основного цикла событий главного окна приложения
+
+
+if __name__ == '__main__':  # конструкция для предотвращения запуска кода верхнего уровня при импортировании
+    # данного файла как модуля
+    if '--benchmark' in sys.argv:
+        benchmark()
+    else:
+        main()  # вызов функции запуска кода верхнего уровня приложения
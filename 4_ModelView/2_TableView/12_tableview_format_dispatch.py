@@ -0,0 +1,280 @@
+"""
+Пример модели таблицы с тем же оформлением, что и в примере 8 (формат дат, чисел и строк, выравнивание,
+красный цвет отрицательных чисел, иконки и цветовой градиент в декораторе), но рассчитанной на широкие таблицы.
+В примере 8 при каждом вызове .data() выполняется цепочка проверок isinstance, а объекты QIcon и QColor
+создаются заново для каждой ячейки при каждой отрисовке. Здесь для каждого столбца один раз по типам его значений
+составляется таблица {роль: функция}, иконки и цвета создаются один раз при создании модели, а вызов .data()
+сводится к поиску функции в словаре. Введенный при редактировании текст переводится к типу текущего значения
+ячейки, поэтому редактирование не меняет типы столбца; если в ячейку все же записано значение нового
+для столбца типа, таблица функций столбца составляется заново.
+Запуск с аргументом --benchmark сравнивает модель с моделью из примера 8: python 12_tableview_format_dispatch.py --benchmark
+"""
+
+import importlib
+import sys
+import time
+from datetime import datetime, timedelta  # импорт модуля для работы с форматами дат и времени
+from PySide6.QtCore import Qt, QAbstractTableModel, QDateTime, QModelIndex, QPersistentModelIndex
+from PySide6.QtWidgets import QApplication, QMainWindow, QTableView
+from PySide6.QtGui import QColor, QIcon
+
+"""
+Модуль sys нужен для доступа к аргументам командной строки. Модули time и importlib нужны для замера
+производительности и импорта модели из примера 8 для сравнения.
+Импорт из модуля PySide6.QtWidgets класса для управления приложением QApplication и
+класса основного окна QMainWindow, класса ярлыка представления таблиц QTableView.
+Импорт из модула PySide6.QtCore абстрактного класса QAbstractTableModel, предоставляющего стандартный
+интерфейс для моделей, которые представляют свои данные в табличной форме, а также классов индексов QModelIndex
+и QPersistentModelIndex, класса даты и времени QDateTime для редактирования дат в редакторе с календарем
+Импорт из модула PySide6.QtGui класса QColor для создания объектов цвета, класса QIcon для создания иконки.
+Qt из модуля PySide6.QtCore содержит различные идентификаторы, используемые в библиотеке Qt.
+"""
+
+COLORS = ['#053061', '#2166ac', '#4393c3', '#92c5de', '#d1e5f0',
+          '#f7f7f7', '#fddbc7', '#f4a582', '#d6604d', '#b2182b', '#67001f']
+
+# роли, сохраненные в переменных модуля: обращение к атрибутам пространства имен Qt занимает микросекунды,
+# а представление запрашивает у модели около десятка ролей для каждой ячейки при каждой отрисовке
+DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+DECORATION_ROLE = Qt.ItemDataRole.DecorationRole
+EDIT_ROLE = Qt.ItemDataRole.EditRole
+ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+FOREGROUND_ROLE = Qt.ItemDataRole.ForegroundRole
+ALIGN_NUMBER = Qt.AlignVCenter | Qt.AlignRight  # выравнивание чисел
+
+
+def same(value):
+    """
+    Функция, возвращающая значение без преобразования (функция роли для значений, которые оформлять не нужно)
+    :param value: значение ячейки
+    :return: то же значение
+    """
+    return value
+
+
+def coerce_value(text: str, current) -> int or float or str or None:
+    """
+    Функция перевода введенного при редактировании текста к типу текущего значения ячейки: в строковой ячейке
+    текст остается строкой (ввод "42" не превращает ячейку в число), в числовой переводится в число того же типа
+    :param text: введенный текст
+    :param current: текущее значение ячейки
+    :return: значение типа текущего значения или None, если текст нельзя перевести к этому типу
+    """
+    if isinstance(current, str):
+        return text
+    if isinstance(current, (int, float)) and not isinstance(current, bool):
+        try:
+            return type(current)(text)
+        except ValueError:
+            return None
+    return None
+
+
+class TableModel(QAbstractTableModel):
+    """
+    Подкласс создаваемой модели таблицы от супер-класса абстрактной модели таблиц
+    """
+
+    def __init__(self, data: list) -> None:
+        """
+        Конструктор модели таблицы
+        """
+        QAbstractTableModel.__init__(self)  # явный вызов конструктора родительского класса
+        self._data = data  # помещаем таблицу с данным в аттрибут экземпляра класса модели таблицы
+        # объекты оформления создаются один раз и возвращаются для всех ячеек
+        red = QColor(Qt.red)
+        scale = [QColor(color) for color in COLORS]
+        calendar, tick, cross = QIcon('calendar.png'), QIcon('tick.png'), QIcon('cross.png')
+        number = {  # функции ролей для чисел
+            FOREGROUND_ROLE: lambda value: red if value < 0 else None,
+            ALIGNMENT_ROLE: lambda value: ALIGN_NUMBER,
+            # подбор цвета в пределах -5...+5, все, что больше или меньше, принимается по границе диапазона
+            DECORATION_ROLE: lambda value: scale[min(5, max(-5, int(value))) + 5],
+        }
+        # таблица {тип значения: {роль: функция}}, заменяющая цепочку проверок isinstance. Роль EditRole определяет
+        # редактор ячейки: для дат передается QDateTime (редактор с датой), для вещественных чисел - полная запись
+        # числа строкой (редактор QDoubleSpinBox по умолчанию округляет до 2 знаков после запятой)
+        self._handlers = {
+            int: {**number, DISPLAY_ROLE: same, EDIT_ROLE: same},
+            float: {**number, DISPLAY_ROLE: lambda value: f'{value:.2f}', EDIT_ROLE: repr},
+            bool: {ALIGNMENT_ROLE: lambda value: ALIGN_NUMBER,  # bool - подкласс int, выравнивается как число
+                   DISPLAY_ROLE: same, EDIT_ROLE: same,
+                   DECORATION_ROLE: lambda value: tick if value else cross},
+            datetime: {DISPLAY_ROLE: lambda value: value.strftime('%Y-%m-%d'),
+                       EDIT_ROLE: QDateTime,
+                       DECORATION_ROLE: lambda value: calendar},
+            str: {DISPLAY_ROLE: lambda value: f'"{value}"', EDIT_ROLE: same},
+        }
+        self._types = []  # множества типов значений по столбцам
+        self._dispatch = []  # таблицы {роль: функция} по столбцам
+        for col in range(self.columnCount()):
+            self._types.append({type(row[col]) for row in data})
+            self._dispatch.append(self._compile_column(col))
+
+    def _compile_column(self, col: int) -> dict:
+        """
+        Метод составления таблицы функций ролей столбца. Если все значения столбца одного типа,
+        используется таблица этого типа. Для столбца со значениями разных типов функция роли
+        выбирает таблицу по точному типу значения одним поиском в словаре
+        :param col: номер столбца
+        :return: словарь {роль: функция значения ячейки}
+        """
+        tables = [self._handlers.get(t, {}) for t in self._types[col]]
+        if len(tables) == 1:
+            return tables[0]
+        handlers = self._handlers
+        empty = {}
+
+        def mixed(role):
+            def handler(value):
+                fn = handlers.get(type(value), empty).get(role)
+                return fn(value) if fn is not None else None
+            return handler
+
+        return {role: mixed(role) for table in tables for role in table}
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int) -> int or float or str:
+        """
+        Метод для обработки запросов из представления на выборку данных
+        :param index: координаты запрашиваемых данных предоставляемых методами .row() и .column().
+        index является экземпляром классов QModelIndex и QPersistentModelIndex из библиотеки PySide6.QtCore.
+        :param role: int - код типа данных. Подробнее https://doc.qt.io/qt-5/qt.html#ItemDataRole-enum
+        :return: значение для роли или None, если роль столбцом не оформляется
+        """
+        col = index.column()
+        handler = self._dispatch[col].get(role)
+        if handler is None:  # роль не оформляется - значение ячейки не извлекается
+            if role == EDIT_ROLE:  # в редактор передается исходное значение
+                return self._data[index.row()][col]
+            return None
+        return handler(self._data[index.row()][col])
+
+    def setData(self, index: QModelIndex | QPersistentModelIndex, value, role: int = EDIT_ROLE) -> bool:
+        """
+        Метод записи отредактированного значения. Введенный текст переводится к типу текущего значения ячейки,
+        текст, который нельзя перевести, не записывается. Если тип значения для столбца новый,
+        таблица функций столбца составляется заново
+        :param index: координаты ячейки
+        :param value: новое значение
+        :param role: int - код типа данных
+        :return: bool - признак успешной записи
+        """
+        if role != EDIT_ROLE:
+            return False
+        row, col = index.row(), index.column()
+        if isinstance(value, str):
+            value = coerce_value(value, self._data[row][col])
+            if value is None:  # текст нельзя перевести к типу ячейки - редактирование отклоняется
+                return False
+        elif isinstance(value, QDateTime):  # значение из редактора даты
+            value = value.toPython()
+        self._data[row][col] = value
+        if type(value) not in self._types[col]:
+            self._types[col].add(type(value))
+            self._dispatch[col] = self._compile_column(col)
+        self.dataChanged.emit(index, index)  # оповещение представления об изменении ячейки
+        return True
+
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
+        """
+        Метод, возвращающий флаги ячейки: ячейки доступны для редактирования
+        :param index: координаты ячейки
+        :return: флаги ячейки
+        """
+        return QAbstractTableModel.flags(self, index) | Qt.ItemIsEditable
+
+    def rowCount(self, index: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        """
+        Метод подсчета количества строк в таблице
+        :param index: экземпляр классов QModelIndex и QPersistentModelIndex из библиотеки PySide6.QtCore
+        :return: int - количество строк (длина внешнего списка)
+        """
+        return len(self._data)
+
+    def columnCount(self, index: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        """
+        Метод подсчета количества столбцов. Данный метод считает количество элементов 0-ой строке и работает только
+        в том случае, если во всех строках одинаковое количество элементов.
+        :param index: экземпляр классов QModelIndex и QPersistentModelIndex из библиотеки PySide6.QtCore
+        :return: int - количество столбцов
+        """
+        return len(self._data[0]) if self._data else 0
+
+
+def make_data(rows: int, columns: int) -> list:
+    """
+    Функция создания широкой таблицы со столбцами разных типов и смешанными столбцами
+    :param rows: количество строк
+    :param columns: количество столбцов
+    :return: список списков
+    """
+    start = datetime(2019, 5, 4)
+    kinds = [
+        lambda r: r % 11 - 5,  # целые числа
+        lambda r: (r % 97) / 9.7 - 5,  # вещественные числа
+        lambda r: start + timedelta(days=r),  # даты
+        lambda r: r % 3 == 0,  # логические значения
+        lambda r: f'item {r}',  # строки
+        lambda r: (True, r % 7 - 3, 2.5 - r % 5, start, 'text')[r % 5],  # значения разных типов, как в примере 8
+    ]
+    return [[kinds[col % len(kinds)](row) for col in range(columns)] for row in range(rows)]
+
+
+class MainWindow(QMainWindow):
+    """
+    Подкласс главного окна приложения от супер-класса главных окон
+    """
+
+    def __init__(self) -> None:
+        """
+        Конструктор главного окна приложения
+        """
+        QMainWindow.__init__(self)  # явный вызов конструктора родительского класса
+        self.setWindowTitle('My App')  # присвоение имени главному окну приложения
+        self.table = QTableView()  # создание экземпляра класса представления таблицы
+        self.model = TableModel(make_data(10_000, 60))  # создание модели широкой таблицы
+        self.table.setModel(self.model)  # помещаем модель таблицы в представление (связывание модели и представления)
+        self.setCentralWidget(self.table)  # размещение представления таблицы в главном окне приложения
+        self.setGeometry(100, 100, 1200, 700)  # установка размеров и координат окна (NW угла - NWx, NWy, W, H)
+
+
+def benchmark() -> None:
+    """
+    Функция замера времени отрисовки таблицы при прокрутке для модели из примера 8 и данной модели.
+    Представление прокручивается на 3 строки и перерисовывается, замеряется среднее и худшее время кадра
+    :return: None
+    """
+    reference = importlib.import_module('8_tableview_format').TableModel  # модель из примера 8 (каталог скрипта
+    # находится в sys.path при запуске)
+    data = make_data(2_000, 60)
+    table = QTableView()
+    table.resize(1600, 900)
+    table.show()
+    for name, model in (('8_tableview_format', reference(data)), ('dispatch', TableModel(data))):
+        table.setModel(model)
+        QApplication.processEvents()
+        frames = []
+        for step in range(100):
+            table.verticalScrollBar().setValue(step * 3)
+            start = time.perf_counter()
+            table.viewport().repaint()  # немедленная отрисовка видимой части таблицы
+            frames.append(time.perf_counter() - start)
+        print(f'{name:>20}: {sum(frames) / len(frames) * 1000:.1f} ms/frame, worst {max(frames) * 1000:.1f} ms')
+
+
+def main() -> None:
+    """
+    Функция запуска кода верхнего уроня приложения
+    """
+    app = QApplication(sys.argv)  # создание экземпляра основного цикла событий главного окна приложения
+    if '--benchmark' in sys.argv:
+        benchmark()
+        return
+    window = MainWindow()  # создание экземпляра главного окна приложения
+    window.show()  # установка видимости окна, по умолчанию окно скрыто
+    app.exec()  # запуск основного цикла событий главного окна приложения
+
+
+if __name__ == '__main__':  # конструкция для предотвращения запуска кода верхнего уровня при импортировании
+    # данного файла как модуля
+    main()  # вызов функции запуска кода верхнего уровня приложения
@@ -0,0 +1,275 @@
+"""
+Пример использования модели таблиц и представления QTableView. В данном примере в качестве
+структуры данных для таблицы будет файл базы данных sqlite.
+Пример организации поиска по таблице с помощью полнотекстового индекса FTS5.
+В примере 12 условия LIKE '%' || :x || '%' начинаются с подстановочного символа, поэтому индексы не используются,
+и каждый запрос просматривает все строки Track и Album. Здесь для поиска создается индекс FTS5 по названию трека,
+композитору и названию альбома. Индекс заполняется один раз, а триггеры поддерживают его в актуальном состоянии
+при изменении таблиц Track и Album. Запрос ищет слова, начинающиеся с введенных в полях строк (MATCH "bla"*),
+и выполняется по индексу.
+Индекс создается во временной схеме соединения (temp) и не изменяет файл базы данных. Флажок Full-text index
+переключает поиск между индексом и запросом с LIKE из примера 12.
+Запуск с аргументом --benchmark выполняет сравнение запросов на копии базы данных, увеличенной до миллионов
+строк: python 14_tableview_querymodel_fts.py --benchmark
+"""
+
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from PySide6.QtCore import QSize
+from PySide6.QtSql import QSqlDatabase, QSqlQuery, QSqlQueryModel
+from PySide6.QtWidgets import (QApplication,
+                               QMainWindow,
+                               QTableView,
+                               QHBoxLayout,
+                               QVBoxLayout,
+                               QLineEdit,
+                               QCheckBox,
+                               QWidget)
+
+"""
+Модуль sys нужен для доступа к аргументам командной строки. Если использование аргументов
+командной строки не предполагается, то импорт можно не выполнять. При этом, при создании
+приложения в класс QApplication([]) в качестве аргумента передается пустой список.
+Модуль re для разбиения строк поиска на слова.
+Модули os, shutil, tempfile и time для создания копии базы данных и замера времени запросов.
+Импорт из модуля PySide6.QtWidgets класса для управления приложением QApplication и
+класса основного окна QMainWindow, класса ярлыка представления таблиц QTableView, классов слоев
+с вертикальной и горизонтальной организацией виджетов QVBoxLayout и QHBoxLayout, класса
+однострочного редактируемого текстового поля QLideEdit, класса флажка QCheckBox, класса базового пустого
+виджета QWidget.
+Импорт из модула PySide6.QtCore класса размеров двухмерных объектов QSize.
+Импорт из модуля PySide6.QtSql класса для установления связи с базой данных QSqlDatabase,
+класса модели запросов QSqlQueryModel, класса для создания запроса QSqlQuery.
+"""
+
+INDEX_TABLE = 'track_fts'  # имя таблицы полнотекстового индекса
+
+INDEX_SQL = [  # создание индекса и триггеров, {schema} - схема базы данных (temp или main)
+    # rowid индекса совпадает с TrackId, текст индексируется без учета регистра и диакритических знаков
+    "CREATE VIRTUAL TABLE {schema}.track_fts USING fts5(name, composer, title)",
+    "INSERT INTO {schema}.track_fts (rowid, name, composer, title) "
+    "SELECT TrackId, Track.Name, Track.Composer, Album.Title FROM Track LEFT JOIN Album USING (AlbumId)",
+    # триггеры, поддерживающие индекс в актуальном состоянии
+    "CREATE TRIGGER {schema}.track_fts_insert AFTER INSERT ON Track BEGIN "
+    "INSERT INTO track_fts (rowid, name, composer, title) "
+    "VALUES (new.TrackId, new.Name, new.Composer, (SELECT Title FROM Album WHERE AlbumId = new.AlbumId)); END",
+    "CREATE TRIGGER {schema}.track_fts_delete AFTER DELETE ON Track BEGIN "
+    "DELETE FROM track_fts WHERE rowid = old.TrackId; END",
+    "CREATE TRIGGER {schema}.track_fts_update AFTER UPDATE OF TrackId, Name, Composer, AlbumId ON Track BEGIN "
+    "DELETE FROM track_fts WHERE rowid = old.TrackId; "
+    "INSERT INTO track_fts (rowid, name, composer, title) "
+    "VALUES (new.TrackId, new.Name, new.Composer, (SELECT Title FROM Album WHERE AlbumId = new.AlbumId)); END",
+    "CREATE TRIGGER {schema}.track_fts_album AFTER UPDATE OF Title ON Album BEGIN "
+    "UPDATE track_fts SET title = new.Title "
+    "WHERE rowid IN (SELECT TrackId FROM Track WHERE AlbumId = new.AlbumId); END",
+]
+
+LIKE_SQL = ("SELECT Name, Composer, Album.Title FROM Track "
+            "INNER JOIN Album ON Track.AlbumId = Album.AlbumId WHERE "  # связывание таблиц через AlbumId
+            "Track.Name LIKE '%' || :track_name || '%' AND "
+            "Track.Composer LIKE '%' || :track_composer || '%' AND "
+            "Album.Title LIKE '%' || :album_title || '%' ")  # запрос из примера 12
+
+ALL_SQL = ("SELECT Track.Name, Track.Composer, Album.Title FROM Track "
+           "INNER JOIN Album ON Track.AlbumId = Album.AlbumId")  # все строки - поля поиска пустые
+
+MATCH_SQL = ("SELECT Track.Name, Track.Composer, Album.Title FROM track_fts "
+             "INNER JOIN Track ON Track.TrackId = track_fts.rowid "  # найденные в индексе строки по первичному ключу
+             "INNER JOIN Album ON Track.AlbumId = Album.AlbumId "
+             "WHERE track_fts MATCH :expression")
+
+
+def create_search_index(db: QSqlDatabase, schema: str = 'temp') -> bool:
+    """
+    Функция создания и заполнения полнотекстового индекса с триггерами, если индекс еще не создан
+    :param db: соединение с базой данных
+    :param schema: схема базы данных: temp - индекс существует до закрытия соединения и не изменяет файл,
+    main - индекс сохраняется в файле базы данных
+    :return: True, если индекс создан или уже существует
+    """
+    query = QSqlQuery(db)
+    query.exec(f"SELECT 1 FROM {schema}.sqlite_master WHERE name = '{INDEX_TABLE}'")
+    if query.next():  # индекс уже создан
+        return True
+    db.transaction()  # все вставки в индекс выполняются одной транзакцией
+    for statement in INDEX_SQL:
+        if not query.exec(statement.format(schema=schema)):
+            db.rollback()
+            return False
+    return db.commit()
+
+
+def match_expression(**fields: str) -> str:
+    """
+    Функция сборки выражения MATCH: каждое слово строки поиска ищется как начало слова в своем столбце индекса
+    (name="black sab" -> name : ("black"* "sab"*)), условия для разных столбцов объединяются через AND
+    :param fields: строки поиска по столбцам индекса
+    :return: str - выражение для MATCH или пустая строка, если слов для поиска нет
+    """
+    terms = []
+    for column, text in fields.items():
+        words = re.findall(r'\w+', text)  # слова в кавычках - служебные слова FTS5 (AND, OR, NOT) ищутся как текст
+        if words:
+            terms.append(f'{column} : (' + ' '.join(f'"{w}"*' for w in words) + ')')
+    return ' AND '.join(terms)
+
+
+class MainWindow(QMainWindow):
+    """
+    Подкласс главного окна приложения от супер класса главных окон
+    """
+
+    def __init__(self, db: QSqlDatabase) -> None:
+        """
+        Конструктор главного окна приложения
+        :param db: соединение с базой данных
+        """
+        QMainWindow.__init__(self)  # явный вызов конструктора родительского класса
+        container = QWidget()  # создание контейнера для слоев с виджетами
+        layout_search = QHBoxLayout()  # создание экземпляра класса слоя с горизонтальной организацией виджетов
+        self.track = QLineEdit()  # создание экземпляра класса виджета однострочного редактируемого
+        # поля для поиска по названию трека
+        self.track.setPlaceholderText('Track name...')  # установка затемненного текста, отображаемого в пустом поле
+        self.track.textChanged.connect(self.update_query)  # создание сигнала на изменение содержимого поля для строки
+        # поиска с привязкой метода ресивера
+        self.composer = QLineEdit()
+        self.composer.setPlaceholderText('Composer name...')
+        self.composer.textChanged.connect(self.update_query)
+        self.album = QLineEdit()
+        self.album.setPlaceholderText('Album name...')
+        self.album.textChanged.connect(self.update_query)
+        self.fts = QCheckBox('Full-text index')  # флажок выбора поиска по индексу
+        self.fts.setChecked(create_search_index(db))  # создание индекса, без индекса - поиск через LIKE
+        self.fts.setEnabled(self.fts.isChecked())
+        self.fts.toggled.connect(self.update_query)
+        layout_search.addWidget(self.track)  # размещение на слое виджета
+        layout_search.addWidget(self.composer)
+        layout_search.addWidget(self.album)
+        layout_search.addWidget(self.fts)
+        layout_view = QVBoxLayout()  # создание экземпляра класса слоя с вертикальным расположением виджетов
+        layout_view.addLayout(layout_search)  # размещение в слое другого слоя с виджетами
+        self.table = QTableView()  # создание экземпляра класса представления таблиц
+        layout_view.addWidget(self.table)
+        container.setLayout(layout_view)
+        self.model = QSqlQueryModel()  # создание экземпляра модели запросов
+        self.table.setModel(self.model)  # подключение модели запросов к представлению таблиц
+        self.like_query = QSqlQuery(db=db)  # подготовка запросов с параметрами
+        self.like_query.prepare(LIKE_SQL)
+        self.match_query = QSqlQuery(db=db)
+        self.match_query.prepare(MATCH_SQL)
+        self.all_query = QSqlQuery(db=db)
+        self.all_query.prepare(ALL_SQL)
+        self.update_query()  # вызов метода обновления, сборки и выполнения запроса в базу данных
+        self.setMinimumSize(QSize(1024, 600))  # установка минимального размера главного окна приложения
+        self.setCentralWidget(container)  # размещение представления таблицы в главном окне приложения
+
+    def update_query(self, s: str = None) -> None:
+        """
+        Методы ресивер (слот) сигнала на обновление (сборку) и выполнения запроса в базу данных
+        """
+        if self.fts.isChecked():
+            expression = match_expression(name=self.track.text(), composer=self.composer.text(),
+                                          title=self.album.text())
+            if expression:
+                query = self.match_query
+                query.bindValue(':expression', expression)  # присвоение значение параметру
+            else:
+                query = self.all_query  # без слов для поиска показываются все строки
+        else:
+            query = self.like_query
+            query.bindValue(":track_name", self.track.text())  # присвоение значение параметру
+            query.bindValue(":track_composer", self.composer.text())
+            query.bindValue(":album_title", self.album.text())
+        query.exec()  # выполнение запроса в базу данных
+        self.model.setQuery(query)  # передача запроса в модель запросов
+
+
+def benchmark(copies: int = 600) -> None:
+    """
+    Функция сравнения запросов с LIKE и MATCH на копии базы данных, в которой таблица Track увеличена
+    в copies раз (у копий к названию и композитору добавлен номер копии).
+    Для каждого запроса замеряется время передачи в модель (первая порция строк, которую видит пользователь)
+    и время выборки всех найденных строк
+    :param copies: количество копий строк таблицы Track
+    :return: None
+    """
+    app = QApplication.instance() or QApplication(sys.argv)
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, 'chinook_big.sqlite')
+    shutil.copy('chinook.sqlite', path)  # исходный файл базы данных не изменяется
+    db = QSqlDatabase.addDatabase('QSQLITE', 'benchmark')
+    db.setDatabaseName(path)
+    db.open()
+    query = QSqlQuery(db)
+    start = time.perf_counter()
+    query.exec(f"INSERT INTO Track (Name, AlbumId, MediaTypeId, GenreId, Composer, Milliseconds, Bytes, UnitPrice) "
+               f"WITH RECURSIVE copy(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM copy WHERE n < {copies - 1}) "
+               f"SELECT Name || ' ' || n, AlbumId, MediaTypeId, GenreId, Composer || ' ' || n, "
+               f"Milliseconds, Bytes, UnitPrice FROM Track, copy")
+    query.exec('SELECT count(*) FROM Track')
+    query.next()
+    print(f'Track inflated to {query.value(0):,} rows in {time.perf_counter() - start:.1f} s')
+    start = time.perf_counter()
+    create_search_index(db, 'main')
+    print(f'FTS5 index built in {time.perf_counter() - start:.1f} s, '
+          f'database {os.path.getsize(path) / 2 ** 20:.0f} MB')
+
+    model = QSqlQueryModel()
+    like = QSqlQuery(db)
+    like.prepare(LIKE_SQL)
+    match = QSqlQuery(db)
+    match.prepare(MATCH_SQL)
+    print(f'{"search (track / composer / album)":<36} {"LIKE first, ms":>15} {"all, ms":>9} {"rows":>8}'
+          f' {"MATCH first, ms":>16} {"all, ms":>9} {"rows":>8}')
+    for track, composer, album in (('black', '', ''), ('love', '', ''), ('', 'clapton', ''),
+                                   ('', '', 'greatest'), ('', 'iommi', 'black'), ('zzzz', '', '')):
+        results = []
+        for q in (like, match):
+            if q is like:
+                q.bindValue(':track_name', track)
+                q.bindValue(':track_composer', composer)
+                q.bindValue(':album_title', album)
+            else:
+                q.bindValue(':expression', match_expression(name=track, composer=composer, title=album))
+            start = time.perf_counter()
+            q.exec()
+            model.setQuery(q)  # модель читает первую порцию строк
+            first = time.perf_counter() - start
+            while model.canFetchMore():  # выборка всех строк (прокрутка до конца таблицы)
+                model.fetchMore()
+            results.append(f'{first * 1000:>{15 if q is like else 16}.1f} '
+                           f'{(time.perf_counter() - start) * 1000:>9.1f} {model.rowCount():>8}')
+        print(f'{" / ".join((track, composer, album)):<36} {results[0]} {results[1]}')
+    model.clear()
+    like.clear()
+    match.clear()
+    query.clear()
+    db.close()
+    del db
+    QSqlDatabase.removeDatabase('benchmark')
+    shutil.rmtree(folder)
+
+
+def main() -> None:
+    """
+    Функция запуска кода верхнего уроня приложения
+    """
+    app = QApplication(sys.argv)  # создание экземпляра основного цикла событий главного окна приложения
+    db = QSqlDatabase.addDatabase('QSQLITE')  # создание соединения с базой данных
+    db.setDatabaseName('chinook.sqlite')  # указание имени файл базы данных
+    db.open()  # команда на открытие базы данных
+    window = MainWindow(db)  # создание экземпляра главного окна приложения
+    window.show()  # установка видимости окна, по умолчанию окно скрыто
+    app.exec()  # запуск основного цикла событий главного окна приложения
+
+
+if __name__ == '__main__':  # конструкция для предотвращения запуска кода верхнего уровня при импортировании
+    # данного файла как модуля
+    if '--benchmark' in sys.argv:  # запуск замера производительности вместо приложения
+        benchmark()
+    else:
+        main()  # вызов функции запуска кода верхнего уровня приложения
@@ -0,0 +1,79 @@
+"""
+Пример использования модели таблиц и представления QTableView. В данном примере в качестве
+структуры данных для таблицы будет файл базы данных sqlite.
+Пример модели с постраничной выборкой строк для больших таблиц (модуль paged_sql_model).
+QSqlTableModel из примера 1 выбирает строки порциями по мере прокрутки, и перемещение полосы прокрутки в конец
+таблицы загружает в модель все строки. Модель PagedSqlModel сразу знает количество строк, выбирает только
+страницы, попавшие в видимую область, запросом по ключу и хранит ограниченное количество последних страниц.
+Модель только для чтения. В строке состояния выводится количество строк, хранящихся в модели.
+"""
+
+import sys
+from PySide6.QtCore import QSize, QTimer
+from PySide6.QtSql import QSqlDatabase
+from PySide6.QtWidgets import QApplication, QMainWindow, QTableView
+
+from paged_sql_model import PagedSqlModel  # импорт класса модели с постраничной выборкой строк
+
+"""
+Модуль sys нужен для доступа к аргументам командной строки. Если использование аргументов
+командной строки не предполагается, то импорт можно не выполнять. При этом, при создании
+приложения в класс QApplication([]) в качестве аргумента передается пустой список.
+Импорт из модуля PySide6.QtWidgets класса для управления приложением QApplication и
+класса основного окна QMainWindow, класса ярлыка представления таблиц QTableView.
+Импорт из модула PySide6.QtCore класса размеров двухмерных объектов QSize и класса таймера QTimer.
+Импорт из модуля PySide6.QtSql класса для установления связи с базой данных QSqlDatabase.
+"""
+
+db = QSqlDatabase('QSQLITE')  # создание экземпляра объекта базы данных с присвоением имени
+db.setDatabaseName('chinook.sqlite')  # указание имени файл базы данных
+db.open()  # команда на открытие базы данных
+
+
+class MainWindow(QMainWindow):
+    """
+    Подкласс главного окна приложения от супер класса главных окон
+    """
+
+    def __init__(self) -> None:
+        """
+        Конструктор главного окна приложения
+        """
+        QMainWindow.__init__(self)  # явный запуск конструктора родительского класса
+        self.table = QTableView()  # создание экземпляра класса представления таблиц
+        self.model = PagedSqlModel(db, 'Track', 'TrackId')  # создание модели таблицы Track, строки которой
+        # упорядочены по первичному ключу TrackId
+        self.table.setModel(self.model)  # привязка модели к представлению
+        self.model.select()  # подсчет строк, сами строки выбираются при отображении
+        self.table.verticalHeader().setDefaultSectionSize(24)  # одинаковая высота строк - представлению
+        # не нужно запрашивать размеры строк у модели
+
+        self.timer = QTimer(self)  # таймер обновления строки состояния
+        self.timer.setInterval(500)
+        self.timer.timeout.connect(self.show_cached)
+        self.timer.start()
+
+        self.setMinimumSize(QSize(1024, 600))  # установка минимального размера главного окна
+        self.setCentralWidget(self.table)  # размещение представления таблицы в главном окне приложения
+
+    def show_cached(self) -> None:
+        """
+        Метод вывода в строку состояния количества строк таблицы и строк, хранящихся в модели
+        :return: None
+        """
+        self.statusBar().showMessage(f'{self.model.rowCount():,} rows, {self.model.cached_rows():,} held in cache')
+
+
+def main() -> None:
+    """
+    Функция запуска кода верхнего уроня приложения
+    """
+    app = QApplication(sys.argv)  # создание экземпляра основного цикла событий главного окна приложения
+    window = MainWindow()  # создание экземпляра главного окна приложения
+    window.show()  # установка видимости окна, по умолчанию окно скрыто
+    app.exec()  # запуск основного цикла событий главного окна приложения
+
+
+if __name__ == '__main__':  # конструкция для предотвращения запуска кода верхнего уровня при импортировании
+    # данного файла как модуля
+    main()  # вызов функции запуска кода верхнего уровня приложения
@@ -0,0 +1,201 @@
+"""
+Пример использования модели таблиц и представления QTableView. В данном примере в качестве
+структуры данных для таблицы будет файл базы данных sqlite.
+Пример использования кэша связанных таблиц (модуль relation_cache) вместо модели QSqlRelationalTableModel
+и делегата QSqlRelationalDelegate из примера 9. Связи задаются так же, методом setRelation(), но запрос модели
+выбирает только строки таблицы Track, а названия альбомов, типов медиа и жанров берутся из словарей, в которые
+связанные таблицы читаются один раз. Выпадающие списки редакторов заполняются из тех же кэшей.
+Поиск по колонке Name работает, т.к. в запросе модели нет одноименных колонок связанных таблиц.
+Запуск с аргументом --benchmark выполняет сравнение с QSqlRelationalTableModel на копии базы данных, увеличенной
+до миллионов строк: python 16_tableview_relation_cache.py --benchmark
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from PySide6.QtCore import Qt, QSize
+from PySide6.QtSql import QSqlDatabase, QSqlQuery, QSqlRelation, QSqlRelationalTableModel, QSqlRelationalDelegate
+from PySide6.QtWidgets import (
+    QApplication,
+    QMainWindow,
+    QTableView,
+    QLineEdit,
+    QVBoxLayout,
+    QStyleOptionViewItem,
+    QWidget
+)
+
+from async_filter import AsyncFilter  # импорт класса отложенной фильтрации в фоновом потоке
+from relation_cache import CachedRelationalModel, CachedRelationDelegate  # импорт классов модели и делегата
+# с кэшем связанных таблиц
+
+"""
+Модуль sys нужен для доступа к аргументам командной строки. Если использование аргументов
+командной строки не предполагается, то импорт можно не выполнять. При этом, при создании
+приложения в класс QApplication([]) в качестве аргумента передается пустой список.
+Модули os, shutil, tempfile и time для создания копии базы данных и замера производительности.
+Импорт из модуля PySide6.QtWidgets класса для управления приложением QApplication и
+класса основного окна QMainWindow, класса ярлыка представления таблиц QTableView,
+класс виджета однострочного текстового поля QLideEdit, класс слоя с вертикальной группировкой
+виджетов QVBoxLayout, класса параметров отображения элемента QStyleOptionViewItem
+и класс базового пустого виджета QWidget.
+Импорт из модула PySide6.QtCore класса размеров двухмерных объектов QSize и класса Qt,
+содержащего различные идентификаторы, используемые в библиотеке Qt.
+Импорт из модуля PySide6.QtSql класса для установления связи с базой данных QSqlDatabase, класса запросов
+QSqlQuery, класса для создания связи между таблицами QSqlRelation, а также модели связанных таблиц
+QSqlRelationalTableModel и делегата QSqlRelationalDelegate (для сравнения).
+"""
+
+RELATIONS = {  # связи столбцов таблицы Track с другими таблицами
+    2: QSqlRelation('Album', 'AlbumId', 'Title'),
+    3: QSqlRelation('MediaType', 'MediaTypeId', 'Name'),
+    4: QSqlRelation('Genre', 'GenreId', 'Name')
+}
+
+
+class MainWindow(QMainWindow):
+    """
+    Подкласс главного окна приложения от супер класса главных окон
+    """
+
+    def __init__(self, db: QSqlDatabase) -> None:
+        """
+        Конструктор главного окна приложения
+        :param db: соединение с базой данных
+        """
+        QMainWindow.__init__(self)  # явный запуск конструктора родительского класса
+        container = QWidget()  # создание контейнера для слоя с виджетами
+        layout = QVBoxLayout()  # создание экземпляра класса слоя виджетов с вертикальной группировкой
+        self.search = QLineEdit()  # создание текстового поля для ввода строки поиска
+        self.table = QTableView()  # создание экземпляра класса табличного представления
+        layout.addWidget(self.search)  # размещение на слое строки поиска
+        layout.addWidget(self.table)  # размещение на слое представления таблицы
+        container.setLayout(layout)  # помещение в контейнер слоя с виджетами
+
+        self.model = CachedRelationalModel(db=db)  # создание модели с кэшем связанных таблиц
+        self.table.setModel(self.model)  # подключение модели к представлению
+        self.model.setTable('Track')  # выбор таблицы модели для передачи в представление
+        for column, relation in RELATIONS.items():
+            self.model.setRelation(column, relation)  # установка связи, имя колонки при этом не меняется
+        self.table.setItemDelegate(CachedRelationDelegate(self.table))  # делегат с выпадающими списками из кэша
+
+        column_titles = {
+            'Name': 'Name',
+            'AlbumId': 'Album Title',
+            'MediaTypeId': 'Media Type',
+            'GenreId': 'Genre',
+            'Composer': 'Composer'
+        }
+        for n, t in column_titles.items():  # извлечение имени столбца в базе и имени для представления
+            idx = self.model.fieldIndex(n)  # извлечение индекса столбца по его имени в базе
+            self.model.setHeaderData(idx, Qt.Horizontal, t)  # присвоение имени столбцу по его индексу в базе
+        self.model.select()  # выборка данных из таблицы Track без соединения со связанными таблицами
+        self.filter = AsyncFilter(self.model, 'Name', 'TrackId', self)  # создание фильтра модели,
+        # выполняющего поиск в фоновом потоке после паузы в наборе текста
+        self.search.textChanged.connect(self.filter.set_text)  # создание сигнала на изменение в строке поиска с
+        # привязкой ресивера
+
+        self.setMinimumSize(QSize(1024, 600))  # установка минимального размера главного окна
+        self.setCentralWidget(container)  # размещение представления таблицы в главном окне приложения
+
+    def closeEvent(self, event) -> None:
+        """
+        Метод обработки закрытия окна: ожидание завершения фонового поиска
+        :param event: PySide6.QtGui.QCloseEvent
+        :return: None
+        """
+        self.filter.wait()
+        event.accept()
+
+
+def benchmark(copies: int = 600) -> None:
+    """
+    Функция сравнения QSqlRelationalTableModel и QSqlRelationalDelegate с моделью и делегатом с кэшем на копии
+    базы данных, в которой таблица Track увеличена в copies раз: выборка модели, фильтрация, отображение
+    видимых строк и открытие выпадающего списка альбомов
+    :param copies: количество копий строк таблицы Track
+    :return: None
+    """
+    app = QApplication.instance() or QApplication(sys.argv)
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, 'chinook_big.sqlite')
+    shutil.copy('chinook.sqlite', path)  # исходный файл базы данных не изменяется
+    db = QSqlDatabase.addDatabase('QSQLITE', 'benchmark')
+    db.setDatabaseName(path)
+    db.open()
+    query = QSqlQuery(db)
+    query.exec(f"INSERT INTO Track (Name, AlbumId, MediaTypeId, GenreId, Composer, Milliseconds, Bytes, UnitPrice) "
+               f"WITH RECURSIVE copy(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM copy WHERE n < {copies - 1}) "
+               f"SELECT Name || ' ' || n, AlbumId, MediaTypeId, GenreId, Composer || ' ' || n, "
+               f"Milliseconds, Bytes, UnitPrice FROM Track, copy")
+    query.clear()
+    print(f'Track: {3503 * copies:,} rows')
+    option = QStyleOptionViewItem()
+    for model, delegate in ((QSqlRelationalTableModel(db=db), QSqlRelationalDelegate()),
+                            (CachedRelationalModel(db=db), CachedRelationDelegate())):
+        model.setTable('Track')
+        for column, relation in RELATIONS.items():
+            model.setRelation(column, relation)
+        timings = []
+        start = time.perf_counter()
+        model.select()
+        timings.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        for prefix in ('B', 'Bl', 'Bla', 'Blac', 'Black'):  # фильтр на каждое нажатие клавиши
+            model.setFilter(f"Track.Name LIKE '{prefix}%'")
+        timings.append((time.perf_counter() - start) / 5)
+        model.setFilter('')
+        start = time.perf_counter()
+        for top in range(0, 4000, 40):  # отображение 100 экранов по 40 строк
+            for row in range(top, top + 40):
+                for column in range(model.columnCount()):
+                    model.data(model.index(row, column))
+        timings.append((time.perf_counter() - start) / 100)
+        start = time.perf_counter()
+        while model.canFetchMore():  # прокрутка до конца таблицы - выборка всех строк
+            model.fetchMore()
+        timings.append(time.perf_counter() - start)
+        model.select()
+        index = model.index(0, 2)
+        parent = QWidget()  # родительский виджет редакторов, как область отображения представления
+        start = time.perf_counter()
+        for _ in range(20):  # открытие выпадающего списка альбомов
+            editor = delegate.createEditor(parent, option, index)
+            delegate.setEditorData(editor, index)
+            editor.setParent(None)  # редактор передается во владение Python и удаляется сразу,
+            del editor  # пока его модель еще существует
+        timings.append((time.perf_counter() - start) / 20)
+        del parent
+        print(f'{type(model).__name__:>24}: select {timings[0] * 1000:.1f} ms, filter {timings[1] * 1000:.0f} ms, '
+              f'40-row screen {timings[2] * 1000:.2f} ms, fetch all rows {timings[3]:.2f} s, '
+              f'album editor {timings[4] * 1000:.2f} ms')
+        model.clear()
+    app.processEvents()
+    del model, delegate
+    db.close()
+    del db
+    QSqlDatabase.removeDatabase('benchmark')
+    shutil.rmtree(folder)
+
+
+def main() -> None:
+    """
+    Функция запуска кода верхнего уроня приложения
+    """
+    app = QApplication(sys.argv)  # создание экземпляра основного цикла событий главного окна приложения
+    db = QSqlDatabase.addDatabase('QSQLITE')  # создание соединения с базой данных
+    db.setDatabaseName('chinook.sqlite')  # указание имени файл базы данных
+    db.open()  # команда на открытие базы данных
+    window = MainWindow(db)  # создание экземпляра главного окна приложения
+    window.show()  # установка видимости окна, по умолчанию окно скрыто
+    app.exec()  # запуск основного цикла событий главного окна приложения
+
+
+if __name__ == '__main__':  # конструкция для предотвращения запуска кода верхнего уровня при импортировании
+    # данного файла как модуля
+    if '--benchmark' in sys.argv:  # запуск замера производительности вместо приложения
+        benchmark()
+    else:
+        main()  # вызов функции запуска кода верхнего уровня приложения
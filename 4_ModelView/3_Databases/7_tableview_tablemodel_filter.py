@@ -6,7 +6,6 @@
 """
 
 import sys
-import re
 from PySide6.QtCore import Qt, QSize
 from PySide6.QtSql import QSqlDatabase, QSqlTableModel
 from PySide6.QtWidgets import (
@@ -18,6 +17,8 @@ from PySide6.QtWidgets import (
     QWidget
 )
 
+from async_filter import AsyncFilter  # импорт класса отложенной фильтрации в фоновом потоке
+
 """
 Модуль sys нужен для доступа к аргументам командной строки. Если использование аргументов
 командной строки не предполагается, то импорт можно не выполнять. При этом, при создании
@@ -50,8 +51,6 @@ class MainWindow(QMainWindow):
         container = QWidget()  # создание контейнера для слоя с виджетами
         layout = QVBoxLayout()  # создание экземпляра класса слоя виджетов с вертикальной группировкой
         self.search = QLineEdit()  # создание текстового поля для ввода строки поиска
-        self.search.textChanged.connect(self.update_filter)  # создание сигнала на изменение в строке поиска с
-        # привязкой ресивера
         self.table = QTableView()  # создание экземпляра класса табличного представления
         layout.addWidget(self.search)  # размещение на слое строки поиска
         layout.addWidget(self.table)  # размещение на слое представления таблицы
@@ -73,6 +72,10 @@ class MainWindow(QMainWindow):
         # Qt.Horizontal или Qt.Vertical задают или проверяют? ориентацию чего-то? Если задать Vertical,
         # то имя не присвоится
         self.model.select()  # выборка данных из подключенной таблицы базы данных
+        self.filter = AsyncFilter(self.model, 'Name', 'TrackId', self)  # создание фильтра модели,
+        # выполняющего поиск в фоновом потоке после паузы в наборе текста
+        self.search.textChanged.connect(self.update_filter)  # создание сигнала на изменение в строке поиска с
+        # привязкой ресивера
 
         self.setMinimumSize(QSize(1024, 600))  # установка минимального размера главного окна
         self.setCentralWidget(container)  # размещение представления таблицы в главном окне приложения
@@ -83,12 +86,19 @@ class MainWindow(QMainWindow):
         :param s: str - содержимое строки поиска
         :return: None
         """
-        s = re.sub(r'[\W_]+', '', s)  # очистка строки содержимого строки поиска от небуквенных включений
-        # Если в строке поиска попадется двойная кавычка, то метод фильтрации зависнет, т.к. будет сформирована
-        # некорректная строка поиска
-        filer_str = f'Name LIKE "{s}%"'  # формирование строки поиска для передачи в метод фильтрации
-        # фильтрация по столбцу Name, выбирается все, что начинается с s
-        self.model.setFilter(filer_str)  # фильтрация данных из таблицы
+        self.filter.set_text(s)  # поиск строк, у которых Name начинается с s, запускается после паузы в наборе
+        # текста в фоновом потоке, затем в модель передается фильтр по найденным первичным ключам
+        # (TrackId IN (...)). Строка поиска передается в запрос параметром, поэтому кавычки и другие символы
+        # не ломают запрос и не требуют очистки
+
+    def closeEvent(self, event) -> None:
+        """
+        Метод обработки закрытия окна: ожидание завершения фонового поиска
+        :param event: PySide6.QtGui.QCloseEvent
+        :return: None
+        """
+        self.filter.wait()
+        event.accept()
 
 
 def main() -> None:
@@ -9,7 +9,6 @@
 """
 
 import sys
-import re
 from PySide6.QtCore import Qt, QSize
 from PySide6.QtSql import (
     QSqlDatabase,
@@ -26,6 +25,8 @@ from PySide6.QtWidgets import (
     QWidget
 )
 
+from async_filter import AsyncFilter  # импорт класса отложенной фильтрации в фоновом потоке
+
 """
 Модуль sys нужен для доступа к аргументам командной строки. Если использование аргументов
 командной строки не предполагается, то импорт можно не выполнять. При этом, при создании
@@ -59,8 +60,6 @@ class MainWindow(QMainWindow):
         container = QWidget()  # создание контейнера для слоя с виджетами
         layout = QVBoxLayout()  # создание экземпляра класса слоя виджетов с вертикальной группировкой
         self.search = QLineEdit()  # создание текстового поля для ввода строки поиска
-        self.search.textChanged.connect(self.update_filter)  # создание сигнала на изменение в строке поиска с
-        # привязкой ресивера
         self.table = QTableView()  # создание экземпляра класса табличного представления
         layout.addWidget(self.search)  # размещение на слое строки поиска
         layout.addWidget(self.table)  # размещение на слое представления таблицы
@@ -106,6 +105,10 @@ class MainWindow(QMainWindow):
         # Qt.Horizontal или Qt.Vertical задают или проверяют? ориентацию чего-то? Если задать Vertical,
         # то имя не присвоится
         self.model.select()  # выборка данных из подключенной таблицы базы данных
+        self.filter = AsyncFilter(self.model, 'Name', 'TrackId', self)  # создание фильтра модели,
+        # выполняющего поиск в фоновом потоке после паузы в наборе текста
+        self.search.textChanged.connect(self.update_filter)  # создание сигнала на изменение в строке поиска с
+        # привязкой ресивера
 
         self.setMinimumSize(QSize(1024, 600))  # установка минимального размера главного окна
         self.setCentralWidget(container)  # размещение представления таблицы в главном окне приложения
@@ -116,18 +119,23 @@ class MainWindow(QMainWindow):
         :param s: str - содержимое строки поиска
         :return: None
 
-        ПРИМЕЧАНИЕ: в данном примере из-за установления связей с таблицами, из которых мы берем содержимое колонки Name
-        в таблице появилось несколько колонок с данным наименованием, оно стало не уникальным и фильтрация по данной
-        колонке перестала работать. Поскольку, фильтр работает с наименованиями колонок из базы данных замещение
-        названий не меняет ситуацию. Фильтрация по другим колонкам (с уникальными названиями) работает.
+        ПРИМЕЧАНИЕ: из-за установления связей с таблицами, из которых мы берем содержимое колонки Name,
+        в запросе модели появилось несколько колонок с данным наименованием, и фильтр Name LIKE ... в методе
+        .setFilter() перестает работать. Поэтому поиск выполняется отдельным запросом к таблице Track в фоновом
+        потоке, а в модель передается фильтр по первичному ключу с именем таблицы (Track.TrackId IN (...)),
+        который однозначен и при наличии связей.
+        """
+        self.filter.set_text(s)  # поиск строк, у которых Name начинается с s, запускается после паузы в наборе
+        # текста, кавычки и другие символы в строке поиска не ломают запрос
+
+    def closeEvent(self, event) -> None:
+        """
+        Метод обработки закрытия окна: ожидание завершения фонового поиска
+        :param event: PySide6.QtGui.QCloseEvent
+        :return: None
         """
-        s = re.sub(r'[\W_]+', '', s)  # очистка строки содержимого строки поиска от небуквенных включений
-        # Если в строке поиска попадется двойная кавычка, то метод фильтрации зависнет, т.к. будет сформирована
-        # некорректная строка поиска
-        filer_str = f'Name LIKE "{s}%"'  # формирование строки поиска для передачи в метод фильтрации
-        # фильтрация по столбцу Name (по исходному имени столбца из подключенной к представлению таблицы,
-        # не по замещенному имени), выбирается все, что начинается с s
-        self.model.setFilter(filer_str)  # фильтрация данных из таблицы
+        self.filter.wait()
+        event.accept()
 
 
 def main() -> None:
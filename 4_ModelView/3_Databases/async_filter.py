@@ -0,0 +1,196 @@
+"""
+Модуль отложенной фильтрации в фоновом потоке для моделей QSqlTableModel (используется примерами
+7_tableview_tablemodel_filter.py и 9_tableview_relational_delegate.py).
+Вызов model.setFilter() на каждое изменение строки поиска выполняет запрос с LIKE по всей таблице в основном
+потоке, и интерфейс замирает на время каждого запроса. Здесь:
+- запрос запускается только после паузы в наборе текста (таймер перезапускается при каждом изменении);
+- поиск выполняется в отдельном потоке через собственное соединение с базой данных и возвращает только
+  первичные ключи найденных строк;
+- результат устаревшего запроса (строка поиска успела измениться) отбрасывается, а сам запрос прерывается
+  на следующей прочитанной строке;
+- фильтр для модели составляет рабочий поток по найденным ключам, и условие без ограничения по ключу
+  (просмотр всей таблицы) в основной поток не передается. Если найденные строки лежат плотно, в модель
+  передается условие LIKE только в диапазоне ключей от первой до последней найденной строки: выборка
+  просматривает по первичному ключу только этот диапазон (и при сортировке модели тоже). Если найденные строки
+  разбросаны по таблице, в модель передается список их первичных ключей (массив JSON для функции json_each),
+  выборка по которому выполняется по индексу. Разбор одного ключа списка примерно в SCAN_RATIO раз дороже
+  просмотра одной строки с LIKE, поэтому выбирается условие с меньшей стоимостью, и время выборки в основном
+  потоке зависит от количества найденных строк, а не от размера таблицы.
+"""
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
+from PySide6.QtSql import QSqlDatabase, QSqlQuery, QSqlTableModel
+
+"""
+Импорт из модуля PySide6.QtCore базового класса объектов Qt QObject, класса контейнера для исполняемого кода
+QRunnable, класса пула потоков QThreadPool, класса таймера QTimer, класса сигналов Signal.
+Импорт из модуля PySide6.QtSql класса соединения с базой данных QSqlDatabase, класса запросов QSqlQuery,
+класса модели таблиц QSqlTableModel.
+"""
+
+DEBOUNCE_INTERVAL = 250  # пауза в наборе текста в мсек, после которой запускается поиск
+SCAN_RATIO = 7  # во сколько раз разбор ключа в списке IN дороже просмотра строки таблицы с условием LIKE
+
+
+class SearchSignals(QObject):
+    """
+    Класс сигналов рабочего потока поиска
+    result - номер запроса и условие фильтра для модели
+    """
+    result = Signal(int, str)
+
+
+class SearchJob(QRunnable):
+    """
+    Рабочий поток поиска - подкласс контейнера для исполняемого кода. Открывает собственное соединение
+    с базой данных (соединение можно использовать только в создавшем его потоке)
+    """
+
+    def __init__(self, database: str, sql: str, key: str, column: str, pattern: str, generation: int,
+                 is_stale) -> None:
+        """
+        Конструктор рабочего потока
+        :param database: путь к файлу базы данных sqlite
+        :param sql: запрос, возвращающий первичные ключи по возрастанию, с одним параметром для шаблона LIKE
+        :param key: имя столбца первичного ключа с именем таблицы (для условия фильтра)
+        :param column: имя столбца поиска с именем таблицы (для условия фильтра)
+        :param pattern: шаблон LIKE
+        :param generation: номер запроса
+        :param is_stale: функция без аргументов, возвращающая True, если запрос устарел
+        """
+        QRunnable.__init__(self)  # явный вызов конструктора родительского класса
+        self.signals = SearchSignals()
+        self.database = database
+        self.sql = sql
+        self.key = key
+        self.column = column
+        self.pattern = pattern
+        self.generation = generation
+        self.is_stale = is_stale
+
+    def run(self) -> None:
+        """
+        Метод, выполняемый в потоке: поиск и передача условия фильтра, если запрос не устарел
+        :return: None
+        """
+        if self.is_stale():  # запрос устарел, пока ожидал свободного потока
+            return
+        name = f'async-filter-{id(self)}'  # уникальное имя соединения этого потока
+        keys = self.search(name)
+        QSqlDatabase.removeDatabase(name)  # удаление соединения после уничтожения всех его объектов
+        if keys is not None:
+            self.signals.result.emit(self.generation, self.key_filter(keys))
+
+    def key_filter(self, keys: list) -> str:
+        """
+        Метод составления условия фильтра с меньшей стоимостью выборки: LIKE в диапазоне ключей
+        найденных строк или список первичных ключей
+        :param keys: список первичных ключей найденных строк по возрастанию
+        :return: str - условие фильтра
+        """
+        if keys and keys[-1] - keys[0] + 1 <= SCAN_RATIO * len(keys):  # диапазон просматривается
+            # дешевле разбора списка
+            pattern = self.pattern.replace("'", "''")  # шаблон в запросе в виде строки в кавычках
+            return f"{self.key} BETWEEN {keys[0]} AND {keys[-1]} AND {self.column} LIKE '{pattern}' ESCAPE '\\'"
+        ids = ','.join(str(int(k)) for k in keys)  # список собирается в рабочем потоке
+        return f"{self.key} IN (SELECT value FROM json_each('[{ids}]'))"  # массив JSON разбирается sqlite
+        # быстрее, чем такой же длинный список чисел в тексте запроса
+
+    def search(self, name: str) -> list | None:
+        """
+        Метод выполнения запроса через соединение с заданным именем
+        :param name: имя соединения
+        :return: список первичных ключей или None, если запрос устарел или не выполнен
+        """
+        db = QSqlDatabase.addDatabase('QSQLITE', name)
+        db.setDatabaseName(self.database)
+        if not db.open():
+            return None
+        query = QSqlQuery(db)
+        query.prepare(self.sql)
+        query.addBindValue(self.pattern)  # шаблон передается параметром, кавычки в строке поиска не ломают запрос
+        query.setForwardOnly(True)  # строки читаются один раз, без кэширования в запросе
+        if not query.exec():
+            return None
+        keys = []
+        while query.next():  # sqlite находит строки по мере чтения, поэтому устаревший запрос
+            if self.is_stale():  # прерывается на следующей строке
+                return None
+            keys.append(query.value(0))
+        return keys
+
+
+class AsyncFilter(QObject):
+    """
+    Класс отложенной фильтрации модели по началу значения столбца
+    """
+
+    def __init__(self, model: QSqlTableModel, column: str, key: str, parent: QObject = None) -> None:
+        """
+        Конструктор фильтра
+        :param model: модель таблицы (выбранная методом setTable())
+        :param column: имя столбца таблицы для поиска
+        :param key: имя столбца первичного ключа таблицы
+        :param parent: родительский объект
+        """
+        QObject.__init__(self, parent)  # явный вызов конструктора родительского класса
+        self.model = model
+        table = model.tableName()
+        self.key = f'{table}.{key}'  # имя с таблицей - у связанных таблиц могут быть столбцы с тем же именем
+        self.column = f'{table}.{column}'
+        self.sql = f"SELECT {key} FROM {table} WHERE {column} LIKE ? ESCAPE '\\' ORDER BY {key}"
+        self.database = model.database().databaseName()
+        self.text = ''
+        self.generation = 0  # номер последнего запроса, результаты других запросов отбрасываются
+        self.timer = QTimer(self)  # таймер паузы в наборе текста
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(DEBOUNCE_INTERVAL)
+        self.timer.timeout.connect(self.start)
+        self.pool = QThreadPool(self)  # собственный пул из одного потока - запросы выполняются по очереди
+        self.pool.setMaxThreadCount(1)
+
+    def set_text(self, s: str) -> None:
+        """
+        Метод ресивер (слот) на изменение строки поиска: перезапуск таймера паузы
+        :param s: str - содержимое строки поиска
+        :return: None
+        """
+        self.text = s
+        self.generation += 1  # выполняемый запрос устаревает сразу, не дожидаясь паузы
+        self.timer.start()
+
+    def start(self) -> None:
+        """
+        Метод запуска поиска по истечении паузы
+        :return: None
+        """
+        self.generation += 1
+        if not self.text:  # пустая строка поиска - показ всей таблицы
+            self.model.setFilter('')
+            return
+        pattern = self.text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        # символы шаблона LIKE в строке поиска ищутся как обычные символы
+        generation = self.generation
+        job = SearchJob(self.database, self.sql, self.key, self.column, pattern, generation,
+                        lambda: generation != self.generation)
+        job.signals.result.connect(self.apply)
+        self.pool.start(job)
+
+    def apply(self, generation: int, condition: str) -> None:
+        """
+        Метод ресивер (слот) результата поиска: передача в модель условия фильтра, составленного рабочим потоком
+        :param generation: номер запроса
+        :param condition: условие фильтра
+        :return: None
+        """
+        if generation != self.generation:  # строка поиска изменилась, пока результат передавался
+            return
+        self.model.setFilter(condition)
+
+    def wait(self) -> None:
+        """
+        Метод прерывания поиска и ожидания завершения рабочего потока (например, при закрытии окна)
+        :return: None
+        """
+        self.timer.stop()
+        self.generation += 1
+        self.pool.waitForDone()
@@ -0,0 +1,281 @@
+"""
+Модуль модели таблицы базы данных с постраничной выборкой строк (используется примером 15_tableview_paged_model.py).
+Модели QSqlTableModel и QSqlQueryModel выбирают строки порциями по мере прокрутки (fetchMore), и чтобы показать
+конец большой таблицы, им нужно прочитать и хранить все строки до него. Здесь:
+- количество строк определяется запросом count(*), и полоса прокрутки сразу имеет полную длину;
+- строки выбираются страницами по PAGE_ROWS строк запросом по ключу (WHERE key >= ? ORDER BY key LIMIT n),
+  который находит начало страницы по индексу, без OFFSET и без чтения предыдущих строк;
+- ключ первой строки страницы (якорь) находится от ближайшего известного якоря или от конца таблицы запросом
+  с OFFSET только по столбцу ключа (по индексу, без чтения строк), а запрос страницы дополнительно возвращает
+  якорь следующей страницы;
+- загруженные страницы хранятся в кэше ограниченного размера (LRU), давно не показанные страницы удаляются.
+Переход к любой позиции полосы прокрутки загружает только видимые страницы.
+Запуск модуля как скрипта выполняет сравнение с QSqlTableModel на копии базы данных chinook, увеличенной до
+миллионов строк: python paged_sql_model.py
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import OrderedDict
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QPersistentModelIndex
+from PySide6.QtSql import QSqlDatabase, QSqlQuery, QSqlTableModel
+from PySide6.QtWidgets import QApplication
+
+"""
+Модули os, random, shutil, sys, tempfile и time для замера производительности на копии базы данных.
+Импорт из модуля collections упорядоченного словаря OrderedDict, на основе которого построен кэш LRU.
+Импорт из модула PySide6.QtCore абстрактного класса QAbstractTableModel, классов индексов QModelIndex
+и QPersistentModelIndex, класса Qt с идентификаторами, используемыми в библиотеке Qt.
+Импорт из модуля PySide6.QtSql класса соединения с базой данных QSqlDatabase, класса запросов QSqlQuery,
+класса модели таблиц QSqlTableModel (для сравнения).
+"""
+
+PAGE_ROWS = 256  # количество строк в странице
+CACHE_PAGES = 64  # максимальное количество страниц в кэше
+DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole  # роли и ориентация в переменных модуля - обращение к атрибутам
+EDIT_ROLE = Qt.ItemDataRole.EditRole  # пространства имен Qt занимает микросекунды
+HORIZONTAL = Qt.Orientation.Horizontal
+
+
+class PagedSqlModel(QAbstractTableModel):
+    """
+    Подкласс модели таблицы базы данных только для чтения от супер-класса абстрактной модели таблиц.
+    Строки упорядочены по ключу - столбцу с уникальными значениями (обычно первичному ключу)
+    """
+
+    def __init__(self, db: QSqlDatabase, table: str, key: str, columns: list = None, parent=None) -> None:
+        """
+        Конструктор модели
+        :param db: соединение с базой данных
+        :param table: имя таблицы
+        :param key: имя столбца ключа, по которому упорядочены строки
+        :param columns: имена отображаемых столбцов, по умолчанию - все столбцы таблицы
+        :param parent: родительский объект
+        """
+        QAbstractTableModel.__init__(self, parent)  # явный вызов конструктора родительского класса
+        self.db = db
+        self.table = table
+        self.key = key
+        record = db.record(table)
+        self.columns = columns or [record.fieldName(i) for i in range(record.count())]
+        self._filter = ''  # условие WHERE без ключевого слова, как в QSqlTableModel.setFilter()
+        self._rows = 0  # количество строк
+        self._anchors = {}  # известные ключи первых строк страниц {номер страницы: ключ}
+        self._cache = OrderedDict()  # кэш страниц {номер страницы: список строк (кортежей значений)}
+        self._page_query = self._after_query = self._from_end_query = None  # запросы, подготавливаются в select()
+
+    def setFilter(self, condition: str) -> None:
+        """
+        Метод установки условия отбора строк и повторной выборки модели
+        :param condition: условие в синтаксисе SQL после WHERE, пустая строка - все строки
+        :return: None
+        """
+        self._filter = condition
+        self.select()
+
+    def filter(self) -> str:
+        """
+        Метод, возвращающий условие отбора строк
+        :return: str - условие
+        """
+        return self._filter
+
+    def select(self) -> bool:
+        """
+        Метод выборки модели: подсчет строк и подготовка запросов. Сами строки выбираются при отображении
+        :return: True, если запросы выполнены
+        """
+        self.beginResetModel()
+        where = f'WHERE {self._filter}' if self._filter else ''
+        and_filter = f'AND ({self._filter})' if self._filter else ''
+        query = QSqlQuery(self.db)
+        ok = query.exec(f'SELECT count(*) FROM {self.table} {where}') and query.next()
+        self._rows = query.value(0) if ok else 0
+        self._anchors = {}
+        self._cache.clear()
+        self._page_query = QSqlQuery(self.db)  # запрос страницы с первой строкой следующей страницы
+        self._page_query.setForwardOnly(True)  # строки читаются один раз, без кэширования в запросе
+        self._page_query.prepare(f'SELECT {self.key}, {", ".join(self.columns)} FROM {self.table} '
+                                 f'WHERE {self.key} >= ? {and_filter} ORDER BY {self.key} LIMIT {PAGE_ROWS + 1}')
+        self._after_query = QSqlQuery(self.db)  # ключ, отстоящий на заданное число строк от известного ключа
+        self._after_query.prepare(f'SELECT {self.key} FROM {self.table} WHERE {self.key} >= ? {and_filter} '
+                                  f'ORDER BY {self.key} LIMIT 1 OFFSET ?')
+        self._from_end_query = QSqlQuery(self.db)  # ключ, отстоящий на заданное число строк от конца таблицы
+        self._from_end_query.prepare(f'SELECT {self.key} FROM {self.table} {where} '
+                                     f'ORDER BY {self.key} DESC LIMIT 1 OFFSET ?')
+        if self._rows:
+            query.exec(f'SELECT min({self.key}) FROM {self.table} {where}')
+            query.next()
+            self._anchors[0] = query.value(0)  # якорь первой страницы
+        self.endResetModel()
+        return ok
+
+    def _anchor(self, page: int):
+        """
+        Метод, возвращающий ключ первой строки страницы. Неизвестный ключ находится от ближайшей предыдущей
+        страницы с известным якорем или от конца таблицы, смотря что ближе
+        :param page: номер страницы
+        :return: ключ
+        """
+        key = self._anchors.get(page)
+        if key is not None:
+            return key
+        known = max(p for p in self._anchors if p < page)  # ближайшая предыдущая страница с известным якорем
+        ahead = (page - known) * PAGE_ROWS  # строк от ее якоря
+        behind = self._rows - 1 - page * PAGE_ROWS  # строк от последней строки таблицы
+        if ahead <= behind:
+            query = self._after_query
+            query.addBindValue(self._anchors[known])
+            query.addBindValue(ahead)
+        else:
+            query = self._from_end_query
+            query.addBindValue(behind)
+        query.exec()
+        query.next()
+        key = self._anchors[page] = query.value(0)
+        query.finish()
+        return key
+
+    def _page(self, page: int) -> list:
+        """
+        Метод, возвращающий страницу из кэша или выбирающий ее из базы данных
+        :param page: номер страницы
+        :return: список строк страницы
+        """
+        rows = self._cache.get(page)
+        if rows is not None:
+            self._cache.move_to_end(page)  # страница использована последней
+            return rows
+        query = self._page_query
+        query.addBindValue(self._anchor(page))
+        query.exec()
+        n = len(self.columns) + 1
+        rows = []
+        while query.next():
+            rows.append(tuple(query.value(i) for i in range(1, n)))
+            if len(rows) > PAGE_ROWS:  # первая строка следующей страницы - ее якорь
+                self._anchors[page + 1] = query.value(0)
+                rows.pop()
+        query.finish()  # освобождение ресурсов запроса до следующей страницы
+        self._cache[page] = rows
+        if len(self._cache) > CACHE_PAGES:
+            self._cache.popitem(last=False)  # удаление давно не показанной страницы
+        return rows
+
+    def cached_rows(self) -> int:
+        """
+        Метод, возвращающий количество строк, хранящихся в кэше
+        :return: int - количество строк
+        """
+        return sum(len(rows) for rows in self._cache.values())
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = DISPLAY_ROLE):
+        """
+        Метод, возвращающий значение ячейки для отображения и редактирования, для других ролей - None
+        :param index: индекс ячейки
+        :param role: роль
+        :return: значение ячейки
+        """
+        if role == DISPLAY_ROLE or role == EDIT_ROLE:
+            row = index.row()
+            rows = self._page(row // PAGE_ROWS)
+            offset = row % PAGE_ROWS
+            if offset < len(rows):  # строки могли быть удалены из таблицы после выборки модели
+                return rows[offset][index.column()]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = DISPLAY_ROLE):
+        """
+        Метод, возвращающий имена столбцов и номера строк
+        :param section: номер столбца или строки
+        :param orientation: ориентация заголовка
+        :param role: роль
+        :return: заголовок
+        """
+        if role == DISPLAY_ROLE:
+            return self.columns[section] if orientation == HORIZONTAL else section + 1
+        return None
+
+    def rowCount(self, index: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        """
+        Метод, возвращающий количество строк
+        :param index: индекс родителя, у таблицы строки есть только у корневого индекса
+        :return: int - количество строк
+        """
+        return 0 if index.isValid() else self._rows
+
+    def columnCount(self, index: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        """
+        Метод, возвращающий количество столбцов
+        :param index: индекс родителя
+        :return: int - количество столбцов
+        """
+        return 0 if index.isValid() else len(self.columns)
+
+
+def benchmark(copies: int = 600) -> None:
+    """
+    Функция сравнения с QSqlTableModel на копии базы данных, в которой таблица Track увеличена в copies раз:
+    время выборки модели, время перехода в конец таблицы и к случайным позициям и количество хранимых строк
+    :param copies: количество копий строк таблицы Track
+    :return: None
+    """
+    app = QApplication.instance() or QApplication(sys.argv)
+    folder = tempfile.mkdtemp()
+    path = os.path.join(folder, 'chinook_big.sqlite')
+    shutil.copy(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'chinook.sqlite'), path)
+    db = QSqlDatabase.addDatabase('QSQLITE', 'benchmark')
+    db.setDatabaseName(path)
+    db.open()
+    query = QSqlQuery(db)
+    query.exec(f"INSERT INTO Track (Name, AlbumId, MediaTypeId, GenreId, Composer, Milliseconds, Bytes, UnitPrice) "
+               f"WITH RECURSIVE copy(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM copy WHERE n < {copies - 1}) "
+               f"SELECT Name || ' ' || n, AlbumId, MediaTypeId, GenreId, Composer || ' ' || n, "
+               f"Milliseconds, Bytes, UnitPrice FROM Track, copy")
+    query.clear()
+
+    model = PagedSqlModel(db, 'Track', 'TrackId')
+    start = time.perf_counter()
+    model.select()
+    selected = time.perf_counter() - start
+    rows = model.rowCount()
+    start = time.perf_counter()
+    model.data(model.index(rows - 1, 1))  # переход в конец таблицы
+    last = time.perf_counter() - start
+    rng = random.Random(0)
+    start = time.perf_counter()
+    for _ in range(1000):  # переходы к случайным позициям полосы прокрутки, видимы 40 строк
+        top = rng.randrange(rows - 40)
+        for row in range(top, top + 40):
+            model.data(model.index(row, 1))
+    jump = (time.perf_counter() - start) / 1000
+    print(f'Track: {rows:,} rows')
+    print(f'PagedSqlModel: select {selected * 1000:.0f} ms, jump to last row {last * 1000:.1f} ms, '
+          f'random jump {jump * 1000:.2f} ms, rows held {model.cached_rows():,}')
+
+    table = QSqlTableModel(db=db)
+    table.setTable('Track')
+    start = time.perf_counter()
+    table.select()
+    selected = time.perf_counter() - start
+    start = time.perf_counter()
+    while table.canFetchMore():  # переход в конец таблицы - выборка всех строк до нее
+        table.fetchMore()
+    table.data(table.index(table.rowCount() - 1, 1))
+    last = time.perf_counter() - start
+    print(f'QSqlTableModel: select {selected * 1000:.0f} ms, jump to last row {last * 1000:.0f} ms, '
+          f'rows held {table.rowCount():,}')
+    table.clear()
+    del model, table
+    db.close()
+    del db
+    QSqlDatabase.removeDatabase('benchmark')
+    shutil.rmtree(folder)
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,227 @@
+"""
+Модуль кэша связанных таблиц для модели таблицы базы данных (используется примером 16_tableview_relation_cache.py).
+QSqlRelationalTableModel из примеров 8 и 9 подставляет значения из связанных таблиц соединением (JOIN) в запросе
+модели, поэтому каждый вызов select() и setFilter() соединяет таблицу со всеми связанными таблицами, а делегат
+QSqlRelationalDelegate заполняет выпадающие списки через модели связанных таблиц. Здесь:
+- каждая связанная таблица читается один раз в словарь {ключ: отображаемое значение};
+- модель CachedRelationalModel выбирает только строки основной таблицы (фильтр работает с ее столбцами без
+  неоднозначных имен), а в столбцах связей показывает значения из словаря;
+- делегат CachedRelationDelegate заполняет выпадающий список из общей для всех редакторов модели списка кэша;
+- кэш сбрасывается при записи в связанную таблицу через это соединение (уведомления драйвера базы данных)
+  или вызовом invalidate().
+"""
+from PySide6.QtCore import Qt, QObject, QModelIndex, QPersistentModelIndex
+from PySide6.QtGui import QStandardItem, QStandardItemModel
+from PySide6.QtSql import QSqlDatabase, QSqlQuery, QSqlRelation, QSqlTableModel
+from PySide6.QtWidgets import QComboBox, QStyledItemDelegate
+
+"""
+Импорт из модуля PySide6.QtCore класса Qt с идентификаторами, используемыми в библиотеке Qt, базового класса
+объектов Qt QObject, классов индексов QModelIndex и QPersistentModelIndex.
+Импорт из модуля PySide6.QtGui классов стандартной модели QStandardItemModel и ее элемента QStandardItem.
+Импорт из модуля PySide6.QtSql класса соединения с базой данных QSqlDatabase, класса запросов QSqlQuery,
+класса описания связи QSqlRelation, класса модели таблиц QSqlTableModel.
+Импорт из модуля PySide6.QtWidgets класса выпадающего списка QComboBox, класса делегата QStyledItemDelegate.
+"""
+
+DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole  # роли в переменных модуля - обращение к атрибутам
+EDIT_ROLE = Qt.ItemDataRole.EditRole  # пространства имен Qt занимает микросекунды
+KEY_ROLE = Qt.ItemDataRole.UserRole  # роль ключа в модели списка выпадающего списка
+
+
+class RelationCache(QObject):
+    """
+    Класс кэша связанной таблицы: словарь ключей и отображаемых значений и модель списка для редакторов.
+    Таблица читается при первом обращении после создания или сброса кэша
+    """
+
+    def __init__(self, db: QSqlDatabase, relation: QSqlRelation, parent: QObject = None) -> None:
+        """
+        Конструктор кэша
+        :param db: соединение с базой данных
+        :param relation: связь - таблица, столбец ключа, столбец отображаемого значения
+        :param parent: родительский объект
+        """
+        QObject.__init__(self, parent)  # явный вызов конструктора родительского класса
+        self.db = db
+        self.table = relation.tableName()
+        self.key = relation.indexColumn()
+        self.display = relation.displayColumn()
+        self._texts = None  # словарь {ключ: отображаемое значение}, None - кэш не загружен
+        self._model = QStandardItemModel(self)  # модель списка для выпадающих списков
+
+    def _load(self) -> dict:
+        """
+        Метод чтения связанной таблицы в словарь и модель списка (значения упорядочены по алфавиту)
+        :return: dict - словарь {ключ: отображаемое значение}
+        """
+        query = QSqlQuery(self.db)
+        query.setForwardOnly(True)
+        query.exec(f'SELECT {self.key}, {self.display} FROM {self.table} ORDER BY {self.display}')
+        self._texts = {}
+        self._model.clear()
+        while query.next():
+            key, text = query.value(0), query.value(1)
+            self._texts[key] = text
+            item = QStandardItem(text)
+            item.setData(key, KEY_ROLE)
+            self._model.appendRow(item)
+        return self._texts
+
+    def text(self, key):
+        """
+        Метод, возвращающий отображаемое значение по ключу
+        :param key: ключ
+        :return: отображаемое значение или сам ключ, если его нет в связанной таблице
+        """
+        texts = self._texts if self._texts is not None else self._load()
+        return texts.get(key, key)
+
+    def model(self) -> QStandardItemModel:
+        """
+        Метод, возвращающий модель списка значений связанной таблицы для выпадающих списков
+        :return: QStandardItemModel - модель списка, элементы хранят ключ в роли KEY_ROLE
+        """
+        if self._texts is None:
+            self._load()
+        return self._model
+
+    def invalidate(self) -> None:
+        """
+        Метод сброса кэша - таблица будет прочитана заново при следующем обращении
+        :return: None
+        """
+        self._texts = None
+
+
+class CachedRelationalModel(QSqlTableModel):
+    """
+    Подкласс модели таблицы от супер класса модели таблиц базы данных, показывающий в столбцах связей
+    значения из кэша связанных таблиц. Интерфейс связей повторяет QSqlRelationalTableModel
+    """
+
+    def __init__(self, parent: QObject = None, db: QSqlDatabase = QSqlDatabase()) -> None:
+        """
+        Конструктор модели
+        :param parent: родительский объект
+        :param db: соединение с базой данных
+        """
+        QSqlTableModel.__init__(self, parent, db)  # явный вызов конструктора родительского класса
+        self._relations = {}  # {номер столбца: QSqlRelation}
+        self._caches = {}  # {номер столбца: RelationCache}
+        self.database().driver().notification.connect(self.on_notification)  # уведомления о записи в таблицы
+
+    def setRelation(self, column: int, relation: QSqlRelation) -> None:
+        """
+        Метод установки связи столбца с другой таблицей
+        :param column: номер столбца
+        :param relation: связь
+        :return: None
+        """
+        self._relations[column] = relation
+        shared = next((c for c in self._caches.values() if c.table == relation.tableName()
+                       and c.key == relation.indexColumn() and c.display == relation.displayColumn()), None)
+        self._caches[column] = shared or RelationCache(self.database(), relation, self)  # одна таблица - один кэш
+        self.database().driver().subscribeToNotification(relation.tableName())
+
+    def relation(self, column: int) -> QSqlRelation:
+        """
+        Метод, возвращающий связь столбца
+        :param column: номер столбца
+        :return: QSqlRelation - связь (пустая, если столбец не связан)
+        """
+        return self._relations.get(column, QSqlRelation())
+
+    def relationCache(self, column: int) -> RelationCache | None:
+        """
+        Метод, возвращающий кэш связанной таблицы столбца
+        :param column: номер столбца
+        :return: RelationCache или None, если столбец не связан
+        """
+        return self._caches.get(column)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = DISPLAY_ROLE):
+        """
+        Метод, возвращающий значение ячейки: для отображения в столбцах связей - значение из кэша,
+        для редактирования - ключ из основной таблицы
+        :param index: индекс ячейки
+        :param role: роль
+        :return: значение ячейки
+        """
+        if role == DISPLAY_ROLE:
+            cache = self._caches.get(index.column())
+            if cache is not None:
+                return cache.text(QSqlTableModel.data(self, index, role))
+        return QSqlTableModel.data(self, index, role)
+
+    def on_notification(self, name: str, *args) -> None:
+        """
+        Метод ресивер (слот) уведомления драйвера о записи в таблицу: сброс кэшей этой таблицы
+        и обновление отображения столбцов, связанных с ней
+        :param name: имя таблицы
+        :param args: источник уведомления и данные (не используются)
+        :return: None
+        """
+        for column, cache in self._caches.items():
+            if cache.table == name:
+                cache.invalidate()
+                if self.rowCount():
+                    self.dataChanged.emit(self.index(0, column), self.index(self.rowCount() - 1, column),
+                                          [DISPLAY_ROLE])
+
+
+class CachedRelationDelegate(QStyledItemDelegate):
+    """
+    Подкласс делегата элемента модели от супер класса стандартных делегатов: для столбцов связей модели
+    CachedRelationalModel создает выпадающий список значений связанной таблицы из кэша
+    """
+
+    def createEditor(self, parent, option, index: QModelIndex):
+        """
+        Метод создания редактора ячейки
+        :param parent: родительский виджет редактора
+        :param option: параметры отображения
+        :param index: индекс ячейки
+        :return: редактор
+        """
+        cache = self._cache(index)
+        if cache is None:
+            return QStyledItemDelegate.createEditor(self, parent, option, index)
+        editor = QComboBox(parent)
+        editor.setModel(cache.model())  # модель списка общая для всех редакторов, таблица не читается заново
+        return editor
+
+    def setEditorData(self, editor, index: QModelIndex) -> None:
+        """
+        Метод передачи значения ячейки в редактор: выбор в списке элемента с ключом ячейки
+        :param editor: редактор
+        :param index: индекс ячейки
+        :return: None
+        """
+        if isinstance(editor, QComboBox) and self._cache(index) is not None:
+            editor.setCurrentIndex(editor.findData(index.data(EDIT_ROLE), KEY_ROLE))
+        else:
+            QStyledItemDelegate.setEditorData(self, editor, index)
+
+    def setModelData(self, editor, model, index: QModelIndex) -> None:
+        """
+        Метод передачи значения из редактора в модель: в основную таблицу записывается ключ выбранного элемента
+        :param editor: редактор
+        :param model: модель
+        :param index: индекс ячейки
+        :return: None
+        """
+        if isinstance(editor, QComboBox) and self._cache(index) is not None:
+            model.setData(index, editor.currentData(KEY_ROLE), EDIT_ROLE)
+        else:
+            QStyledItemDelegate.setModelData(self, editor, model, index)
+
+    @staticmethod
+    def _cache(index: QModelIndex) -> RelationCache | None:
+        """
+        Метод, возвращающий кэш связанной таблицы для столбца ячейки
+        :param index: индекс ячейки
+        :return: RelationCache или None, если модель не CachedRelationalModel или столбец не связан
+        """
+        model = index.model()
+        return model.relationCache(index.column()) if isinstance(model, CachedRelationalModel) else None
@@ -2,21 +2,26 @@
 Пример создания простого приложения для рисования.
 """
 import sys
-from PySide6.QtWidgets import QApplication, QMainWindow, QLabel, QPushButton, QWidget, QVBoxLayout, QHBoxLayout
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QPixmap, QPainter, QColor
+from PySide6.QtWidgets import (QApplication, QMainWindow, QPushButton, QWidget, QVBoxLayout, QHBoxLayout,
+                               QScrollArea, QFrame)
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QColor, QAction, QKeySequence
+
+from tiled_canvas import TiledCanvas  # импорт класса холста с плиточным хранением рисунка
 
 """
 Модуль sys нужен для доступа к аргументам командной строки. Если использование аргументов
 командной строки не предполагается, то импорт можно не выполнять. При этом, при создании
 приложения в класс QApplication([]) в качестве аргумента передается пустой список.
-Импорт из модуля PySide6.QtCore и класса Qt - содержит различные идентификаторы, используемые
-в библиотеке Qt, класса размеров QSize.
+Импорт из модуля PySide6.QtCore класса размеров QSize.
 Импорт из модуля PySide6.QtWidgets класса для управления приложением QApplication и
-класса основного окна QMainWindow, класса виджета ярлыка QLabel, класса нажимаемой кнопки QPushButton,
-класса базового виджета QWidget, слоев виджетов QVBoxLayout, QHBoxLayout.
-Импорт из модуля PySide6.QtGui класса поверхности для графических изображений QPixmap,
-класса виджета для рисования QPainter, класс объекта цветов QColor.  
+класса основного окна QMainWindow, класса нажимаемой кнопки QPushButton,
+класса базового виджета QWidget, слоев виджетов QVBoxLayout, QHBoxLayout, класса области прокрутки QScrollArea,
+класса виджета с рамкой QFrame.
+Импорт из модуля PySide6.QtGui класс объекта цветов QColor, класса команд QAction,
+класса сочетаний клавиш QKeySequence.
+Импорт из модуля tiled_canvas класса холста, который хранит рисунок по плиткам и перерисовывает только
+измененные области (холст на QLabel с QPixmap копировал и перерисовывал все изображение после каждого отрезка).
 Другие виджеты можно найти по ссылке https://doc.qt.io/qt-5/widget-classes.html#basic-widget-classes
 """
 
@@ -42,6 +47,9 @@ COLORS = [  # коды цветов для цветовой палитры
     "#ffffff"
 ]
 
+CANVAS_SIZE = QSize(800, 600)  # размер холста, холст размером до 8192x8192 прокручивается в окне
+MAX_VIEW = QSize(1200, 800)  # размер видимой области большого холста
+
 
 class MainWindow(QMainWindow):
     """
@@ -53,16 +61,25 @@ class MainWindow(QMainWindow):
         Конструктор главного окна приложения
         """
         QMainWindow.__init__(self)  # явный вызов конструктора родительского класса
-        self.canvas = Canvas()  # создание экземпляра класса холста
+        self.canvas = Canvas(CANVAS_SIZE.width(), CANVAS_SIZE.height())  # создание экземпляра класса холста
+        scroll = QScrollArea()  # создание области прокрутки для больших холстов
+        scroll.setWidget(self.canvas)  # размещение холста в области прокрутки
+        scroll.setFrameShape(QFrame.NoFrame)  # область прокрутки без рамки
+        scroll.setMinimumSize(self.canvas.size().boundedTo(MAX_VIEW))  # холст виден целиком, если помещается
+        scroll.setMaximumSize(self.canvas.size())  # область прокрутки не больше холста
         w = QWidget()  # создание контейнера для слоев виджетов
         l = QVBoxLayout()  # создание экземпляра слоя с вертикальной организацией виджетов
         w.setLayout(l)  # размещение в контейнере слоя для виджетов
-        l.addWidget(self.canvas)  # добавление на слой холста для рисования
+        l.addWidget(scroll)  # добавление на слой холста для рисования
         palette = QHBoxLayout()  # создание слоя для размещения элементов палитры
         self.add_palette_buttons(palette)  # вызов метода для создания элементов палитры
         # с передачей ему ссылки на слой для их размещения
         l.addLayout(palette)
         self.setCentralWidget(w)
+        undo = QAction('Undo', self)  # создание команды отмены последнего штриха
+        undo.setShortcut(QKeySequence.Undo)  # сочетание клавиш отмены, принятое в системе (Ctrl+Z)
+        undo.triggered.connect(self.canvas.undo)
+        self.addAction(undo)  # команда доступна в окне без размещения в меню
 
     def add_palette_buttons(self, layout: QHBoxLayout) -> None:
         """
@@ -91,19 +108,18 @@ class QPaletteButton(QPushButton):
         self.setStyleSheet(f'background-color: {color}')  # установка цвета фона для элемента палитры
 
 
-class Canvas(QLabel):
+class Canvas(TiledCanvas):
     """
-    Подкласс холста для рисования от супер класса ярлыка
+    Подкласс холста для рисования от супер класса холста с плиточным хранением рисунка
     """
 
-    def __init__(self) -> None:
+    def __init__(self, width: int, height: int) -> None:
         """
-        Конструктор главного окна приложения
+        Конструктор холста
+        :param width: ширина холста в пикселях
+        :param height: высота холста в пикселях
         """
-        QLabel.__init__(self)  # явный вызов конструктора родительского класса
-        self._pixmap = QPixmap(800, 600)  # создание поверхности для графической информации - холста для рисования
-        self._pixmap.fill(Qt.white)  # заполнение холста белым цветом
-        self.setPixmap(self._pixmap)  # привязка холста для отображения содержимого
+        TiledCanvas.__init__(self, width, height)  # явный вызов конструктора родительского класса
         self.last_x, self.last_y = None, None  # вводим атрибуты за хранения координат предыдущей точки
         self.pen_color = QColor('#000000')  # создание атрибута для хранения цвета пера
 
@@ -113,6 +129,14 @@ class Canvas(QLabel):
         """
         self.pen_color = QColor(c)
 
+    def mousePressEvent(self, e) -> None:
+        """
+        Обработчика нажатия клавиши мыши
+        :param e: event из PySide6.QtGui.QMouseEvent содержит события с мыши
+        :return: None
+        """
+        self.begin_stroke()  # все изменения до отпускания кнопки отменяются как один штрих
+
     def mouseMoveEvent(self, e) -> None:
         """
         Обработчик событий движения курсора мышки
@@ -121,21 +145,15 @@ class Canvas(QLabel):
         :param e: event из PySide6.QtGui.QMouseEvent содержит события с мыши
         :return: None
         """
+        x, y = e.position().toPoint().toTuple()  # координаты курсора
         if self.last_x is None:  # первое событие или нет
-            self.last_x = e.x()  # извлечение координаты и помещение ее в атрибут для последней координаты
-            self.last_y = e.y()
+            self.last_x = x  # извлечение координаты и помещение ее в атрибут для последней координаты
+            self.last_y = y
             return
-        painter = QPainter(self._pixmap)  # создание экземпляра класса виджета для рисования
-        p = painter.pen()  # создание пера для рисования
-        p.setWidth(4)  # установка толщины линии
-        p.setColor(self.pen_color)  # установка цвети пера
-        painter.setPen(p)  # применение настроек пера к рисовальщику
-        painter.drawLine(self.last_x, self.last_y, e.x(), e.y())  # рисование линии по координатам,
-        # извлекаемым из события мыши
-        painter.end()  # подача команды на завершение рисования, закрытие рисовальщика и сохранения изменений
-        self.setPixmap(self._pixmap)  # после завершения рисования холст должен быть передан на отображение
-        self.last_x = e.x()  # извлечение координаты и помещение ее в атрибут для последней координаты
-        self.last_y = e.y()
+        self.paint_line(self.last_x, self.last_y, x, y, self.pen_color, 4)  # рисование линии по координатам,
+        # извлекаемым из события мыши, на плитках, которых она касается (перерисовка - не чаще раза за кадр)
+        self.last_x = x  # извлечение координаты и помещение ее в атрибут для последней координаты
+        self.last_y = y
 
     def mouseReleaseEvent(self, e) -> None:
         """
@@ -145,6 +163,8 @@ class Canvas(QLabel):
         """
         self.last_x = None
         self.last_y = None
+        if not e.buttons():  # штрих завершается после отпускания последней нажатой кнопки
+            self.end_stroke()  # сохранение штриха в историю отмены
 
 
 def main() -> None:
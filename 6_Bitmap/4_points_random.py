@@ -3,16 +3,18 @@
 Пример рисования точки с использованием настроек пера (размер и цвет).
 """
 import sys
-from random import randint
+import numpy as np
 from PySide6.QtWidgets import QApplication, QMainWindow, QLabel
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap, QPainter, QPen, QColor
 
+from bulk_points import points_polygon  # импорт функции массового рисования точек
+
 """
 Модуль sys нужен для доступа к аргументам командной строки. Если использование аргументов
 командной строки не предполагается, то импорт можно не выполнять. При этом, при создании
 приложения в класс QApplication([]) в качестве аргумента передается пустой список.
-Импорт из модуля random класса случайного целого randint.
+Импорт пакета NumPy для генерации массивов случайных координат.
 Импорт из модуля PySide6.QtCore класса Qt - содержит различные идентификаторы, используемые
 в библиотеке Qt.
 Импорт из модуля PySide6.QtWidgets класса для управления приложением QApplication и
@@ -21,6 +23,8 @@ from PySide6.QtGui import QPixmap, QPainter, QPen, QColor
 класса виджета для рисования QPainter, класс для установки размера пера (толщины линии)
 и цвета для рисования QPen, класс объекта цветов QColor.  
 Другие виджеты можно найти по ссылке https://doc.qt.io/qt-5/widget-classes.html#basic-widget-classes
+Импорт из модуля bulk_points функции points_polygon, которая рисует все точки из массивов NumPy
+одним вызовом drawPoints() вместо вызова drawPoint() для каждой точки.
 """
 
 
@@ -51,8 +55,10 @@ class MainWindow(QMainWindow):
         pen.setWidth(3)  # установка размера пера
         pen.setColor(QColor('red'))  # установка цвета
         painter.setPen(pen)  # установка настроек пера в рисовальщик
-        for n in range(10000):  # цикл для рисования точек по случайным координатам
-            painter.drawPoint(200 + randint(-100, 100), 150 + randint(-100, 100))
+        rng = np.random.default_rng()  # генератор случайных чисел
+        xs = 200 + rng.integers(-100, 101, 10000)  # массивы случайных координат всех точек
+        ys = 150 + rng.integers(-100, 101, 10000)
+        painter.drawPoints(points_polygon(xs, ys))  # рисование всех точек одним вызовом
         painter.end()  # подача команды на завершение рисования, закрытие рисовальщика и сохранения изменений
         self.label.setPixmap(self.canvas)  # после завершения рисования холст должен быть передан на отображение
 
@@ -3,24 +3,28 @@
 Пример рисования точки с использованием настроек пера (размер и цвет).
 """
 import sys
-from random import choice, randint
+import numpy as np
 from PySide6.QtWidgets import QApplication, QMainWindow, QLabel
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap, QPainter, QPen, QColor
+from PySide6.QtGui import QPixmap, QPainter, QPen
+
+from bulk_points import draw_points  # импорт функции массового рисования точек
 
 """
 Модуль sys нужен для доступа к аргументам командной строки. Если использование аргументов
 командной строки не предполагается, то импорт можно не выполнять. При этом, при создании
 приложения в класс QApplication([]) в качестве аргумента передается пустой список.
-Импорт из модуля random класса случайного выбора choice и класса случайного целого randint.
+Импорт пакета NumPy для генерации массивов случайных координат.
 Импорт из модуля PySide6.QtCore и класса Qt - содержит различные идентификаторы, используемые
 в библиотеке Qt.
 Импорт из модуля PySide6.QtWidgets класса для управления приложением QApplication и
 класса основного окна QMainWindow, класса виджета ярлыка QLabel.
 Импорт из модуля PySide6.QtGui класса поверхности для графических изображений QPixmap,
 класса виджета для рисования QPainter, класс для установки размера пера (толщины линии)
-и цвета для рисования QPen, класс объекта цветов QColor.  
+и цвета для рисования QPen.
 Другие виджеты можно найти по ссылке https://doc.qt.io/qt-5/widget-classes.html#basic-widget-classes
+Импорт из модуля bulk_points функции draw_points, которая рисует все точки из массивов NumPy
+одним вызовом drawPoints() на каждый цвет вместо смены пера и вызова drawPoint() для каждой точки.
 """
 
 
@@ -52,10 +56,11 @@ class MainWindow(QMainWindow):
         pen = QPen()  # создание экземпляра класса пера для рисования
         pen.setWidth(3)  # установка размера пера
         painter.setPen(pen)  # установка настроек пера в рисовальщик
-        for n in range(10000):  # цикл для рисования точек по случайным координатам
-            pen.setColor(QColor(choice(colors)))  # установка цвета случайным выбором
-            painter.setPen(pen)  # установка настроек пера в рисовальщик
-            painter.drawPoint(200 + randint(-100, 100), 150 + randint(-100, 100))
+        rng = np.random.default_rng()  # генератор случайных чисел
+        xs = 200 + rng.integers(-100, 101, 10000)  # массивы случайных координат всех точек
+        ys = 150 + rng.integers(-100, 101, 10000)
+        color_index = rng.integers(0, len(colors), 10000)  # случайный выбор номера цвета для каждой точки
+        draw_points(painter, pen, xs, ys, color_index, colors)  # рисование точек - один вызов на каждый цвет
         painter.end()  # подача команды на завершение рисования, закрытие рисовальщика и сохранения изменений
         self.label.setPixmap(self.canvas)  # после завершения рисования холст должен быть передан на отображение
         # активным может быть только одно перо
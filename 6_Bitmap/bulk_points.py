@@ -0,0 +1,145 @@
+"""
+Модуль массового рисования точек, заданных массивами NumPy (используется примерами 4_points_random.py
+и 5_points_color_random.py).
+Рисование по одной точке требует на каждую точку нескольких вызовов из Python в Qt (создание цвета, установка пера,
+рисование), поэтому время растет линейно с большим коэффициентом. Здесь предложены два способа:
+- points_polygon() и draw_points() - координаты записываются в QPolygonF без создания объектов QPointF,
+  точки группируются по цвету, и для каждого цвета выполняется один вызов drawPoints();
+- rasterize_points() - точки записываются в массив пикселей ARGB32 средствами NumPy,
+  а массив оборачивается в QImage без копирования.
+Запуск модуля как скрипта выполняет замер производительности от 10 тысяч до 10 миллионов точек:
+python bulk_points.py
+"""
+import sys
+import time
+
+import numpy as np
+import shiboken6
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QPainter, QPen, QColor, QPolygonF
+
+"""
+Импорт пакета NumPy для работы с массивами координат и пикселей.
+Импорт модуля shiboken6 (входит в состав PySide6) для доступа к памяти объекта QPolygonF.
+Импорт из модуля PySide6.QtGui класса изображения с доступом к пикселям QImage, класса виджета
+для рисования QPainter, класса пера QPen, класса цветов QColor, класса многоугольника (списка точек) QPolygonF.
+"""
+
+
+def points_polygon(xs: np.ndarray, ys: np.ndarray) -> QPolygonF:
+    """
+    Функция создания списка точек QPolygonF из массивов координат. Память многоугольника представляется
+    массивом NumPy (пары чисел double), и координаты записываются в нее одной операцией
+    :param xs: массив координат по горизонтали
+    :param ys: массив координат по вертикали
+    :return: QPolygonF - список точек
+    """
+    n = len(xs)
+    polygon = QPolygonF()
+    polygon.resize(n)
+    if n:
+        memory = shiboken6.VoidPtr(polygon.data(), n * 16, True)  # 16 байт на точку - две координаты double
+        points = np.frombuffer(memory, np.float64).reshape(n, 2)
+        points[:, 0] = xs
+        points[:, 1] = ys
+    return polygon
+
+
+def draw_points(painter: QPainter, pen: QPen, xs: np.ndarray, ys: np.ndarray,
+                color_index: np.ndarray, colors: list) -> None:
+    """
+    Функция рисования точек, сгруппированных по цвету: один вызов drawPoints() на цвет.
+    Точки одного цвета рисуются вместе, поэтому при наложении точек сверху оказывается цвет
+    с большим номером, а не точка, нарисованная позже
+    :param painter: рисовальщик
+    :param pen: перо с настроенной толщиной, цвет пера устанавливается функцией
+    :param xs: массив координат по горизонтали
+    :param ys: массив координат по вертикали
+    :param color_index: массив номеров цветов точек в списке colors
+    :param colors: список цветов (QColor или строки с кодом цвета)
+    :return: None
+    """
+    order = np.argsort(color_index, kind='stable')  # номера точек, упорядоченные по цвету
+    bounds = np.cumsum(np.bincount(color_index, minlength=len(colors)))  # границы групп цветов
+    start = 0
+    for color, end in zip(colors, bounds.tolist()):
+        if end > start:
+            group = order[start:end]
+            pen.setColor(QColor(color))
+            painter.setPen(pen)
+            painter.drawPoints(points_polygon(xs[group], ys[group]))
+        start = end
+
+
+def rasterize_points(xs: np.ndarray, ys: np.ndarray, color_index: np.ndarray, colors: list,
+                     width: int, height: int, size: int = 1,
+                     background: QColor = QColor(Qt.white)) -> tuple:
+    """
+    Функция растеризации точек в массив пикселей ARGB32. Точка толщиной size рисуется квадратом size x size
+    с центром в точке, как точка пером такой толщины. Изображение QImage использует память массива без копирования,
+    поэтому массив должен существовать, пока используется изображение
+    :param xs: массив целых координат по горизонтали
+    :param ys: массив целых координат по вертикали
+    :param color_index: массив номеров цветов точек в списке colors
+    :param colors: список цветов (QColor или строки с кодом цвета)
+    :param width: ширина изображения
+    :param height: высота изображения
+    :param size: толщина точки в пикселях
+    :param background: цвет фона
+    :return: (QImage, массив пикселей)
+    """
+    pixels = np.full((height, width), QColor(background).rgba(), dtype=np.uint32)
+    palette = np.array([QColor(color).rgba() for color in colors], dtype=np.uint32)
+    values = palette[color_index]  # цвет каждой точки
+    for dy in range(-(size // 2), size - size // 2):  # квадрат точки записывается сдвигами
+        for dx in range(-(size // 2), size - size // 2):
+            x, y = xs + dx, ys + dy
+            inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+            pixels[y[inside], x[inside]] = values[inside]  # при совпадении побеждает последняя точка
+    image = QImage(pixels.data, width, height, width * 4, QImage.Format_ARGB32)  # изображение поверх массива
+    return image, pixels
+
+
+def benchmark() -> None:
+    """
+    Функция замера времени рисования точек толщиной 3 пикселя пятью цветами на изображении 1000x1000
+    по одной точке (как в примере 5, только до 100 тысяч точек), группами drawPoints() и растеризацией NumPy
+    :return: None
+    """
+    app = QApplication.instance() or QApplication(sys.argv)
+    colors = ['#FFD141', '#376F9F', '#0D1F2D', '#E9EBEF', '#EB5160']
+    qcolors = [QColor(color) for color in colors]
+    rng = np.random.default_rng(0)
+    print(f'{"points":>10} {"per point, s":>13} {"drawPoints, s":>14} {"NumPy, s":>9}')
+    for n in (10_000, 100_000, 1_000_000, 10_000_000):
+        xs = rng.integers(0, 1000, n, dtype=np.int32)
+        ys = rng.integers(0, 1000, n, dtype=np.int32)
+        color_index = rng.integers(0, len(colors), n, dtype=np.int32)
+        image = QImage(1000, 1000, QImage.Format_ARGB32)
+        image.fill(Qt.white)
+        pen = QPen()
+        pen.setWidth(3)
+        single = '-'
+        if n <= 100_000:
+            start = time.perf_counter()
+            painter = QPainter(image)
+            for x, y, c in zip(xs.tolist(), ys.tolist(), color_index.tolist()):
+                pen.setColor(qcolors[c])
+                painter.setPen(pen)
+                painter.drawPoint(x, y)
+            painter.end()
+            single = f'{time.perf_counter() - start:.3f}'
+        start = time.perf_counter()
+        painter = QPainter(image)
+        draw_points(painter, pen, xs, ys, color_index, qcolors)
+        painter.end()
+        grouped = time.perf_counter() - start
+        start = time.perf_counter()
+        rasterize_points(xs, ys, color_index, qcolors, 1000, 1000, size=3)
+        raster = time.perf_counter() - start
+        print(f'{n:>10} {single:>13} {grouped:>14.3f} {raster:>9.3f}')
+
+
+if __name__ == '__main__':
+    benchmark()
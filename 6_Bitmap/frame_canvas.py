@@ -0,0 +1,77 @@
+"""
+Модуль холста для рисования с перерисовкой не чаще одного раза за кадр (используется модулем tiled_canvas.py).
+Холст на QLabel с QPixmap после каждого изменения передает изображение на отображение вызовом setPixmap(),
+поэтому Qt копирует и перерисовывает все изображение, даже если изменилось несколько пикселей. Здесь:
+♦ класс FrameCanvas накапливает измененные области и передает их на перерисовку по таймеру не чаще одного раза
+  за кадр (FRAME_INTERVAL), а отображение перерисовывает только накопленную область;
+♦ функция image_pixels() открывает доступ к пикселям изображения QImage как к массиву NumPy,
+  поэтому все точки одного события (например, частицы спрея) записываются одной операцией.
+"""
+import numpy as np
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QRect, QTimer
+from PySide6.QtGui import QImage, QColor
+
+"""
+Импорт пакета NumPy для доступа к пикселям изображения.
+Импорт из модуля PySide6.QtWidgets класса базового виджета QWidget.
+Импорт из модуля PySide6.QtCore класса Qt - содержит различные идентификаторы, используемые в библиотеке Qt,
+класса прямоугольника QRect, класса таймера QTimer.
+Импорт из модуля PySide6.QtGui класса изображения с доступом к пикселям QImage, класс объекта цветов QColor.
+"""
+
+FRAME_INTERVAL = 16  # минимальный интервал между перерисовками холста в мсек (около 60 кадров в секунду)
+
+
+def image_pixels(image: QImage) -> np.ndarray:
+    """
+    Функция доступа к пикселям изображения формата RGB32 как к массиву NumPy без копирования
+    :param image: изображение
+    :return: массив пикселей (строки, столбцы) типа uint32
+    """
+    return np.ndarray((image.height(), image.bytesPerLine() // 4), dtype=np.uint32,
+                      buffer=image.bits())[:, :image.width()]
+
+
+class FrameCanvas(QWidget):
+    """
+    Подкласс холста для рисования от супер класса базового виджета.
+    Измененные области накапливаются методом mark_dirty() и передаются на перерисовку по таймеру
+    не чаще одного раза за кадр. Хранение рисунка и его отрисовку в paintEvent() выполняют подклассы
+    """
+
+    def __init__(self, width: int, height: int, background: QColor = QColor(Qt.white)) -> None:
+        """
+        Конструктор холста
+        :param width: ширина холста в пикселях
+        :param height: высота холста в пикселях
+        :param background: цвет фона
+        """
+        QWidget.__init__(self)  # явный вызов конструктора родительского класса
+        self.setFixedSize(width, height)  # размер виджета равен размеру холста
+        self.setAttribute(Qt.WA_OpaquePaintEvent)  # виджет сам закрашивает всю перерисовываемую область
+        self._background = QColor(background)
+        self._dirty = QRect()  # область, измененная после последней перерисовки
+        self._frame = QTimer(self)  # таймер кадров
+        self._frame.setSingleShot(True)
+        self._frame.setInterval(FRAME_INTERVAL)
+        self._frame.timeout.connect(self.flush)
+
+    def mark_dirty(self, rect: QRect) -> None:
+        """
+        Метод добавления измененной области холста и запуска таймера кадра, если он не запущен
+        :param rect: измененная область
+        :return: None
+        """
+        self._dirty = self._dirty.united(rect)
+        if not self._frame.isActive():
+            self._frame.start()
+
+    def flush(self) -> None:
+        """
+        Метод передачи накопленной измененной области на перерисовку
+        :return: None
+        """
+        self.update(self._dirty)  # перерисовка только измененной области
+        self._dirty = QRect()
+
@@ -0,0 +1,241 @@
+"""
+Модуль холста для рисования с хранением рисунка по плиткам (используется примерами 13_paint.py и 14_spraypaint.py).
+Рисунок разбит на квадратные плитки QImage размером TILE_SIZE, плитки создаются при первом рисовании на них,
+поэтому пустой холст 8192x8192 не занимает памяти. Штрих изменяет и перерисовывает только плитки, которых он
+касается, а перерисовка виджета выполняется не чаще одного раза за кадр и только в измененной области
+(класс FrameCanvas из модуля frame_canvas).
+Для отмены штриха хранятся копии только измененных им плиток, а не всего рисунка.
+Запуск модуля как скрипта выполняет замер производительности на холсте 8192x8192: python tiled_canvas.py
+"""
+import sys
+import time
+from collections import deque
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import Qt, QRect, QPoint
+from PySide6.QtGui import QImage, QPainter, QColor
+
+from frame_canvas import FrameCanvas, image_pixels  # импорт класса холста с перерисовкой не чаще одного раза
+# за кадр и функции доступа к пикселям изображения
+
+"""
+Импорт пакета NumPy для записи точек в пиксели плиток.
+Импорт из модуля collections очереди deque с ограниченной длиной для истории отмены.
+Импорт из модуля PySide6.QtCore класса Qt - содержит различные идентификаторы, используемые в библиотеке Qt,
+класса прямоугольника QRect, класса точки QPoint.
+Импорт из модуля PySide6.QtWidgets класса для управления приложением QApplication.
+Импорт из модуля PySide6.QtGui класса изображения с доступом к пикселям QImage,
+класса виджета для рисования QPainter, класс объекта цветов QColor.
+"""
+
+TILE_SIZE = 256  # размер плитки в пикселях
+UNDO_LIMIT = 50  # количество штрихов, которые можно отменить
+
+
+class TiledCanvas(FrameCanvas):
+    """
+    Подкласс холста для рисования с плиточным хранением рисунка от супер класса холста
+    с перерисовкой не чаще одного раза за кадр.
+    Рисование выполняется методами paint_line() и paint_points() между вызовами begin_stroke() и end_stroke(),
+    один штрих отменяется методом undo()
+    """
+
+    def __init__(self, width: int, height: int, background: QColor = QColor(Qt.white)) -> None:
+        """
+        Конструктор холста
+        :param width: ширина холста в пикселях
+        :param height: высота холста в пикселях
+        :param background: цвет фона
+        """
+        FrameCanvas.__init__(self, width, height, background)  # явный вызов конструктора родительского класса
+        self._tiles = {}  # словарь плиток {(столбец, строка): QImage}, пустые плитки не хранятся
+        self._stroke = None  # исходные состояния плиток, измененных текущим штрихом {(столбец, строка): QImage | None}
+        self._undo = deque(maxlen=UNDO_LIMIT)  # история штрихов для отмены
+
+    def tile_keys(self, rect: QRect) -> list:
+        """
+        Метод, возвращающий ключи плиток, пересекающихся с прямоугольником
+        :param rect: прямоугольник в координатах холста
+        :return: список ключей (столбец, строка)
+        """
+        rect = rect.intersected(self.rect())  # часть прямоугольника в пределах холста
+        if rect.isEmpty():
+            return []
+        return [(tx, ty)
+                for ty in range(rect.top() // TILE_SIZE, rect.bottom() // TILE_SIZE + 1)
+                for tx in range(rect.left() // TILE_SIZE, rect.right() // TILE_SIZE + 1)]
+
+    def _writable_tile(self, key: tuple) -> QImage:
+        """
+        Метод, возвращающий плитку для рисования. Перед первым изменением плитки в штрихе
+        сохраняется ее копия для отмены, отсутствующая плитка создается залитой цветом фона
+        :param key: ключ плитки (столбец, строка)
+        :return: QImage - плитка
+        """
+        tile = self._tiles.get(key)
+        if self._stroke is not None and key not in self._stroke:
+            self._stroke[key] = tile.copy() if tile is not None else None  # копия исходного состояния плитки
+        if tile is None:
+            tile = QImage(TILE_SIZE, TILE_SIZE, QImage.Format_RGB32)
+            tile.fill(self._background)
+            self._tiles[key] = tile
+        return tile
+
+    def begin_stroke(self) -> None:
+        """
+        Метод начала штриха: изменения до вызова end_stroke() отменяются одним вызовом undo().
+        Вызов во время уже начатого штриха (нажатие второй кнопки мыши) продолжает этот штрих,
+        иначе были бы потеряны исходные состояния уже измененных плиток
+        :return: None
+        """
+        if self._stroke is None:
+            self._stroke = {}
+
+    def end_stroke(self) -> None:
+        """
+        Метод завершения штриха с сохранением исходных состояний измененных плиток в историю отмены
+        :return: None
+        """
+        if self._stroke:
+            self._undo.append(self._stroke)
+        self._stroke = None
+
+    def undo(self) -> None:
+        """
+        Метод отмены последнего штриха: измененные им плитки возвращаются в исходное состояние.
+        Во время штриха (кнопка мыши нажата) отмена не выполняется: штрих уже сохранил копии плиток,
+        и после отмены его собственная запись в истории вернула бы отмененные изменения
+        :return: None
+        """
+        if self._stroke is not None or not self._undo:
+            return
+        for key, tile in self._undo.pop().items():
+            if tile is None:
+                self._tiles.pop(key, None)  # плитка до штриха была пустой
+            else:
+                self._tiles[key] = tile
+            self.mark_dirty(QRect(key[0] * TILE_SIZE, key[1] * TILE_SIZE, TILE_SIZE, TILE_SIZE))
+
+    def paint_line(self, x0: int, y0: int, x1: int, y1: int, color: QColor, width: int) -> None:
+        """
+        Метод рисования отрезка на всех плитках, которых он касается
+        :param x0: координата начала по горизонтали
+        :param y0: координата начала по вертикали
+        :param x1: координата конца по горизонтали
+        :param y1: координата конца по вертикали
+        :param color: цвет пера
+        :param width: толщина пера
+        :return: None
+        """
+        rect = QRect(QPoint(x0, y0), QPoint(x1, y1)).normalized().adjusted(-width, -width, width, width)
+        # прямоугольник отрезка с запасом на толщину пера
+        for key in self.tile_keys(rect):
+            painter = QPainter(self._writable_tile(key))  # создание экземпляра класса виджета для рисования
+            painter.translate(-key[0] * TILE_SIZE, -key[1] * TILE_SIZE)  # переход к координатам холста
+            p = painter.pen()  # создание пера для рисования
+            p.setWidth(width)  # установка толщины линии
+            p.setColor(color)  # установка цвети пера
+            painter.setPen(p)  # применение настроек пера к рисовальщику
+            painter.drawLine(x0, y0, x1, y1)  # рисование линии по координатам
+            painter.end()  # завершение рисования
+        self.mark_dirty(rect)
+
+    def paint_points(self, xs: np.ndarray, ys: np.ndarray, color: QColor) -> None:
+        """
+        Метод записи точек одного цвета прямо в пиксели плиток. Точки группируются по плиткам,
+        для каждой плитки выполняется одна операция записи в массив NumPy
+        :param xs: массив координат точек по горизонтали
+        :param ys: массив координат точек по вертикали
+        :param color: цвет точек
+        :return: None
+        """
+        inside = (xs >= 0) & (xs < self.width()) & (ys >= 0) & (ys < self.height())  # точки за пределами
+        xs, ys = xs[inside], ys[inside]  # холста отбрасываются
+        if not len(xs):
+            return
+        rgb = color.rgb()
+        tx, ty = xs // TILE_SIZE, ys // TILE_SIZE
+        ids = ty * (self.width() // TILE_SIZE + 1) + tx  # номер плитки каждой точки
+        for tile_id in np.unique(ids).tolist():
+            mask = ids == tile_id
+            key = (int(tx[mask][0]), int(ty[mask][0]))
+            tile = self._writable_tile(key)
+            image_pixels(tile)[ys[mask] - key[1] * TILE_SIZE, xs[mask] - key[0] * TILE_SIZE] = rgb
+        self.mark_dirty(QRect(QPoint(int(xs.min()), int(ys.min())), QPoint(int(xs.max()), int(ys.max()))))
+
+    def paintEvent(self, e) -> None:
+        """
+        Обработчик событий отрисовки: на виджет копируются только части плиток,
+        попавшие в перерисовываемую область, пустые плитки закрашиваются цветом фона
+        :param e: event из PySide6.QtGui.QPaintEvent
+        :return: None
+        """
+        painter = QPainter(self)
+        for key in self.tile_keys(e.rect()):
+            tile_rect = QRect(key[0] * TILE_SIZE, key[1] * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+            target = tile_rect.intersected(e.rect())
+            tile = self._tiles.get(key)
+            if tile is None:
+                painter.fillRect(target, self._background)
+            else:
+                painter.drawImage(target, tile, target.translated(-tile_rect.topLeft()))
+        painter.end()
+
+    def to_image(self) -> QImage:
+        """
+        Метод сборки всего рисунка в одно изображение (например, для сохранения в файл)
+        :return: QImage - рисунок
+        """
+        image = QImage(self.width(), self.height(), QImage.Format_RGB32)
+        image.fill(self._background)
+        painter = QPainter(image)
+        for (tx, ty), tile in self._tiles.items():
+            painter.drawImage(tx * TILE_SIZE, ty * TILE_SIZE, tile)
+        painter.end()
+        return image
+
+
+def benchmark() -> None:
+    """
+    Функция замера производительности на холсте 8192x8192: штрихи из отрезков и точек,
+    отрисовка видимой области окна 1200x800 и отмена штрихов
+    :return: None
+    """
+    app = QApplication.instance() or QApplication(sys.argv)
+    canvas = TiledCanvas(8192, 8192)
+    rng = np.random.default_rng(0)
+    color = QColor('#3a7fa7')
+    start = time.perf_counter()
+    segments = 0
+    for stroke in range(50):  # штрихи из 100 отрезков, проходящие через случайные места холста
+        canvas.begin_stroke()
+        x, y = rng.integers(0, 8192, 2).tolist()
+        for _ in range(100):
+            dx, dy = rng.integers(-20, 21, 2).tolist()
+            canvas.paint_line(x, y, x + dx, y + dy, color, 4)
+            x, y = x + dx, y + dy
+            segments += 1
+        canvas.end_stroke()
+    lines = (time.perf_counter() - start) / segments
+    start = time.perf_counter()
+    for _ in range(1000):  # события спрея по 100 частиц
+        x, y = rng.integers(0, 8192, 2)
+        canvas.paint_points(np.rint(rng.normal(x, 10, 100)).astype(np.intp),
+                            np.rint(rng.normal(y, 10, 100)).astype(np.intp), color)
+    points = (time.perf_counter() - start) / 1000
+    view = QImage(1200, 800, QImage.Format_RGB32)  # видимая область окна
+    start = time.perf_counter()
+    for n in range(50):  # прокрутка по диагонали
+        canvas.render(view, QPoint(), QRect(n * 100, n * 100, 1200, 800))
+    frame = (time.perf_counter() - start) / 50
+    start = time.perf_counter()
+    for _ in range(50):
+        canvas.undo()
+    undo = (time.perf_counter() - start) / 50
+    print(f'8192x8192 canvas, {len(canvas._tiles)} tiles allocated: line segment {lines * 1e6:.0f} us, '
+          f'spray event {points * 1e6:.0f} us, 1200x800 frame {frame * 1e3:.1f} ms, undo {undo * 1e3:.2f} ms')
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -14,12 +14,13 @@ from PySide6.QtWidgets import (QApplication,
                                QLabel,
                                QVBoxLayout,
                                QMainWindow,
-                               QPlainTextEdit,
                                QPushButton,
                                QWidget,
                                )
 from PySide6.QtCore import QRunnable, Slot, QThreadPool, Signal, QObject, QTimer
 
+from log_console import LogConsole  # импорт класса журнала с пакетным добавлением строк
+
 """
 Модуль request для работы с запросам по интернету.
 Модуль sys нужен для доступа к аргументам командной строки. Если использование аргументов
@@ -27,8 +28,7 @@ from PySide6.QtCore import QRunnable, Slot, QThreadPool, Signal, QObject, QTimer
 приложения в класс QApplication([]) в качестве аргумента передается пустой список.
 Импорт из модуля PySide6.QtWidgets класса для управления приложением QApplication и класса слоев
 для виджетов с вертикальной организацией QVBoxLayout, класса виджета кнопки QPushButton,
-класс однострочного текстового поля ярлыка QLabel, класс виджета многострочного редактируемого,
-текстового поля QPlainTextEdit класса базового виджета QWidget.
+класс однострочного текстового поля ярлыка QLabel, класса базового виджета QWidget.
 Импорт из модуля PySide6.QtCore класса таймера для измерения времени QTimer, класс контейнера для
 исполняемого кода QRunnable, класс менеджера потоков QThreadPool, класс декоратора Slot,
 класс сигнала Signal, класс базового объекта QObject, класс таймера для измерения времени QTimer. 
@@ -39,7 +39,7 @@ from PySide6.QtCore import QRunnable, Slot, QThreadPool, Signal, QObject, QTimer
 class WorkerSignals(QObject):
     """
     Класс сигналов рабочего потока, определяющий набор сигналов
-    data - кортеж данных вида (идентификатор, данные)
+    data - кортеж данных вида (идентификатор, список строк ответа)
     """
     data = Signal(tuple)
 
@@ -68,8 +68,8 @@ class Worker(QRunnable):
         Код, который необходимо выполнить помещаем в метод с именем run()
         """
         r = requests.get(self.url)  # отправка запроса на удаленные сервер и сохранение ответа в переменную r
-        for line in r.text.splitlines():  # извлечение из ответа сервера отдельных строк
-            self.signals.data.emit((self.id, line))  # передача кортежа данных объекту сигналов рабочего потока
+        self.signals.data.emit((self.id, r.text.splitlines()))  # передача всех строк ответа одним сигналом,
+        # а не сигналом на каждую строку
 
 
 class MainWindow(QMainWindow):
@@ -89,9 +89,7 @@ class MainWindow(QMainWindow):
             "https://www.udemy.com/create-simple-gui-applicationswith-python-and-qt / ",
         ]
         layout = QVBoxLayout()  # создание экземпляра слоев для размещения виджетов
-        self.text = QPlainTextEdit()  # создание экземпляра класса виджета многострочного
-        # редактируемого текстового поля
-        self.text.setReadOnly(True)  # установка запрета на запись в текстовое поле
+        self.text = LogConsole()  # создание журнала, добавляющего строки в текстовое поле пакетами раз в кадр
         button = QPushButton('Послать запрос')  # создание кнопки с надписью
         button.pressed.connect(self.execute)  # создание сигнала на нажатие кнопки с привязкой метода ресивера
         layout.addWidget(self.text)  # размещение текстового поля в слое для виджетов
@@ -121,8 +119,9 @@ class MainWindow(QMainWindow):
         :param data: tuple - данные ответа от сервера для отображения
         :return: None
         """
-        id, s = data
-        self.text.appendPlainText(f'WORKER {id}: {s}')
+        id, lines = data
+        self.text.append_lines([f'WORKER {id}: {s}' for s in lines])  # строки будут добавлены в текстовое поле
+        # одной правкой вместе со строками других рабочих потоков
 
 
 def main() -> None:
@@ -9,9 +9,14 @@ QThreadPool - менеджер рабочих потоков.
 объекты сигналов рабочего потока и передавать им данные в процессе
 своего выполнения (callback).
 """
+import os
 import sys
 import time
+import uuid
+import threading
 import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, Future
 
 from PySide6.QtWidgets import (QApplication,
                                QLabel,
@@ -25,6 +30,10 @@ from PySide6.QtCore import QRunnable, Slot, QThreadPool, Signal, QObject, QTimer
 """
 Модуль time для работы со временем.
 Модуль traceback для работы с трассировками стека программы.
+Модуль os для определения количества ядер процессора, модуль uuid для генерации уникальных
+идентификаторов, модуль threading для потока чтения прогресса,
+модуль multiprocessing для очереди между процессами, класс пула процессов ProcessPoolExecutor и
+класс результата асинхронного выполнения Future из модуля concurrent.futures.
 Модуль sys нужен для доступа к аргументам командной строки. Если использование аргументов
 командной строки не предполагается, то импорт можно не выполнять. При этом, при создании
 приложения в класс QApplication([]) в качестве аргумента передается пустой список.
@@ -60,6 +69,23 @@ def execute_this_fn(**kwargs) -> str:
     return 'Done.'
 
 
+def count_primes(n: int, **kwargs) -> int:
+    """
+    Функция, нагружающая процессор - подсчет простых чисел меньше n перебором делителей.
+    В потоке такая функция блокирует GIL, поэтому ее нужно выполнять в пуле процессов
+    :param n: верхняя граница
+    :return: int - количество простых чисел
+    """
+    count = 0  # счетчик простых чисел
+    step = max(1, n // 20)  # шаг передачи прогресса - 20 раз за время выполнения
+    for i in range(2, n):
+        if all(i % d for d in range(2, int(i ** 0.5) + 1)):
+            count += 1
+        if i % step == 0:
+            kwargs['signals'].progress.emit(i * 100 // n)
+    return count
+
+
 class WorkerSignals(QObject):
     """
     Класс сигналов рабочего потока, определяющий набор сигналов
@@ -114,6 +140,164 @@ class Worker(QRunnable):
             self.signals.finished.emit()  # возврат сигнала о завершении выполнения функции
 
 
+class ProcessProgress:
+    """
+    Класс сигнала прогресса для функции, выполняемой в отдельном процессе.
+    Объект передается в процесс через pickle, поэтому хранит только идентификатор задания.
+    Метод emit повторяет интерфейс сигнала Signal: значение записывается в очередь (канал pipe),
+    общую для всех процессов пула, а в главном процессе передается настоящему сигналу рабочего потока
+    """
+
+    def __init__(self, job_id: str) -> None:
+        """
+        Конструктор сигнала прогресса
+        :param job_id: уникальный идентификатор задания
+        """
+        self.job_id = job_id
+
+    def emit(self, value: int) -> None:
+        """
+        Метод передачи значения прогресса из процесса пула в главный процесс
+        :param value: процент выполнения
+        :return: None
+        """
+        _progress_queue.put((self.job_id, value))
+
+
+class ProcessSignals:
+    """
+    Класс набора сигналов, передаваемый функции в процесс пула вместо WorkerSignals.
+    Поддерживается только сигнал progress, результат и ошибка передаются возвратом из функции
+    """
+
+    def __init__(self, job_id: str) -> None:
+        """
+        Конструктор набора сигналов
+        :param job_id: уникальный идентификатор задания
+        """
+        self.progress = ProcessProgress(job_id)
+
+
+_progress_queue = None  # очередь прогресса в процессе пула, устанавливается при запуске процесса
+
+
+def _init_process(queue: multiprocessing.Queue) -> None:
+    """
+    Функция инициализации процесса пула - сохранение общей очереди прогресса в глобальной переменной
+    :param queue: очередь для передачи прогресса в главный процесс
+    :return: None
+    """
+    global _progress_queue
+    _progress_queue = queue
+
+
+class ProcessWorker:
+    """
+    Рабочее задание для выполнения функции в отдельном процессе.
+    Интерфейс повторяет рабочий поток Worker: функция, аргументы и объект сигналов WorkerSignals.
+    Функция и аргументы должны поддерживать pickle (функция должна быть объявлена на уровне модуля)
+    """
+
+    def __init__(self, fn, *args, **kwargs) -> None:
+        """
+        Конструктор рабочего задания.
+        :param fn: функция для выполнения
+        :param args: аргументы для выполняемой функции
+        :param kwargs: ключевые аргументы для выполняемой функции
+        """
+        self.fn = fn  # сохранение объекта функции для выполнения
+        self.args = args  # сохранение аргументов для функции
+        self.kwargs = kwargs  # сохранение ключевых аргументов для функции
+        self.job_id = uuid.uuid4().hex  # генерация уникального идентификатора задания
+        self.signals = WorkerSignals()  # создание экземпляра класса сигналов в главном потоке
+        kwargs['signals'] = ProcessSignals(self.job_id)  # функция получает сигналы, работающие в процессе
+
+
+class ProcessPool:
+    """
+    Менеджер процессов для выполнения заданий, нагружающих процессор.
+    Потоки QThreadPool выполняют код Python по очереди из-за глобальной блокировки интерпретатора (GIL),
+    процессы ProcessPoolExecutor выполняются на всех ядрах одновременно.
+    Прогресс из процессов передается через общую очередь multiprocessing.Queue, которую
+    в главном процессе читает отдельный поток и передает значения сигналам заданий.
+    Результат, ошибка и завершение передаются сигналам из обратного вызова объекта Future
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """
+        Конструктор менеджера процессов
+        :param max_workers: количество процессов, по умолчанию - количество ядер процессора
+        """
+        self.max_workers = max_workers or os.cpu_count()  # сохранение количества процессов
+        context = multiprocessing.get_context('spawn')  # процессы запускаются заново, а не копируются (fork)
+        # из многопоточного процесса Qt, в копии которого блокировки других потоков могут остаться захваченными
+        self._queue = context.Queue()  # создание очереди прогресса
+        self._executor = ProcessPoolExecutor(self.max_workers, mp_context=context,
+                                             initializer=_init_process, initargs=(self._queue,))
+        self._jobs = {}  # словарь выполняющихся заданий {идентификатор: рабочее задание}
+        self._relay = threading.Thread(target=self._relay_progress, daemon=True)  # поток чтения прогресса
+        self._relay.start()
+
+    def maxThreadCount(self) -> int:
+        """
+        Метод, возвращающий количество процессов (название как у QThreadPool)
+        :return: количество процессов пула
+        """
+        return self.max_workers
+
+    def start(self, worker: ProcessWorker) -> None:
+        """
+        Метод для передачи задания на выполнение в пул процессов
+        :param worker: рабочее задание
+        :return: None
+        """
+        self._jobs[worker.job_id] = worker  # сохранение ссылки на задание до его завершения
+        future = self._executor.submit(worker.fn, *worker.args, **worker.kwargs)  # передача функции в процесс
+        future.add_done_callback(lambda f: self._done(worker, f))  # привязка обработчика завершения
+
+    def _done(self, worker: ProcessWorker, future: Future) -> None:
+        """
+        Метод обработки завершения задания, вызывается во вспомогательном потоке ProcessPoolExecutor.
+        Сигналы передаются в главный поток через очередь событий
+        :param worker: рабочее задание
+        :param future: объект с результатом выполнения функции
+        :return: None
+        """
+        try:
+            result = future.result()  # получение результата или повторное возбуждение исключения из процесса
+        except BaseException as e:
+            tb = ''.join(traceback.format_exception(e))  # трассировка из процесса передается как причина
+            worker.signals.error.emit((type(e), e, tb))  # возврат сигнала с сообщением об ошибке
+        else:
+            worker.signals.result.emit(result)  # возврат результата работы функции
+        finally:
+            worker.signals.finished.emit()  # возврат сигнала о завершении выполнения функции
+            self._jobs.pop(worker.job_id, None)
+
+    def _relay_progress(self) -> None:
+        """
+        Метод потока чтения очереди прогресса: значения передаются сигналам progress заданий.
+        Значение None в очереди завершает поток
+        :return: None
+        """
+        while (item := self._queue.get()) is not None:
+            job_id, value = item
+            worker = self._jobs.get(job_id)
+            if worker is not None:  # задание могло уже завершиться
+                worker.signals.progress.emit(value)
+
+    def shutdown(self) -> None:
+        """
+        Метод для остановки пула процессов и потока чтения прогресса с ожиданием их завершения
+        :return: None
+        """
+        self._executor.shutdown(cancel_futures=True)
+        self._queue.put(None)  # значение None завершает поток чтения прогресса
+        self._relay.join()  # ожидание потока до завершения интерпретатора
+        self._queue.close()
+        self._queue.join_thread()  # ожидание передачи данных из буфера очереди в канал
+
+
 class MainWindow(QMainWindow):
     """
     Подкласс главного окна приложения от супер класса главных окон
@@ -129,14 +313,21 @@ class MainWindow(QMainWindow):
         self.label = QLabel('Start')  # создание ярлыка с надписью
         button = QPushButton('DANGER!')  # создание кнопки с надписью
         button.pressed.connect(self.oh_no)  # создание сигнала на нажатие кнопки с привязкой метода ресивера
+        button_cpu = QPushButton('CPU bound x 16')  # создание кнопки запуска заданий в пуле процессов
+        button_cpu.pressed.connect(self.run_cpu_bound)  # создание сигнала на нажатие кнопки
+        # с привязкой метода ресивера
         layout.addWidget(self.label)  # размещение текстового поля в слое для виджетов
         layout.addWidget(button)  # размещение кнопки в слое для виджетов
+        layout.addWidget(button_cpu)  # размещение кнопки в слое для виджетов
         container = QWidget()  # создание контейнера для слоев с виджетами
         container.setLayout(layout)  # размещение в контейнере слоя для виджетов
         self.setCentralWidget(container)  # размещение контейнера в главном окне приложения
         self.threadpool = QThreadPool()  # создание экземпляра класса менеджера потоков
         print(f'Multithreading with maximum {self.threadpool.maxThreadCount()}')
         # вывод максимального количества доступных потоков
+        self.processpool = ProcessPool()  # создание экземпляра менеджера процессов
+        print(f'Multiprocessing with maximum {self.processpool.maxThreadCount()}')
+        # вывод количества процессов
         self.timer = QTimer()  # создание экземпляра таймера
         self.timer.setInterval(1000)  # установка интервала таймера
         self.timer.timeout.connect(self.recurring_timer)  # создание сигнала о завершении таймера
@@ -184,6 +375,28 @@ class MainWindow(QMainWindow):
         # с привязкой метода ресивера, выводящего прогресс выполнения
         self.threadpool.start(worker)  # запуск рабочего потока на выполнение
 
+    def run_cpu_bound(self) -> None:
+        """
+        Функция ресивер (слот), запускающая 16 заданий, нагружающих процессор, в пуле процессов.
+        Подключение сигналов такое же, как для рабочего потока
+        :return: None
+        """
+        for _ in range(16):
+            worker = ProcessWorker(count_primes, 200_000)  # создание задания с функцией и аргументом
+            worker.signals.result.connect(self.print_output)  # создание сигнала на получение результата
+            worker.signals.finished.connect(self.thread_complete)  # создание сигнала на завершение
+            worker.signals.progress.connect(self.progress_fn)  # создание сигнала для отображения хода выполнения
+            self.processpool.start(worker)  # запуск задания на выполнение в пуле процессов
+
+    def closeEvent(self, event) -> None:
+        """
+        Метод обработки закрытия окна - остановка пула процессов
+        :param event: событие закрытия окна
+        :return: None
+        """
+        self.processpool.shutdown()
+        QMainWindow.closeEvent(self, event)
+
     def recurring_timer(self) -> None:
         """
         Метод ресивер (слот) для подсчета количества отработанных интервалов таймера
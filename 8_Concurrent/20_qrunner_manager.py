@@ -11,6 +11,8 @@ import time
 import uuid
 import random
 
+from job_scheduler import JobScheduler, PRIORITY_NORMAL  # импорт планировщика рабочих потоков
+# и константы обычного приоритета
 from PySide6.QtWidgets import (QApplication,
                                QListView,
                                QPlainTextEdit,
@@ -18,7 +20,8 @@ from PySide6.QtWidgets import (QApplication,
                                QMainWindow,
                                QPushButton,
                                QWidget,
-                               QStyledItemDelegate
+                               QStyledItemDelegate,
+                               QStyleOptionViewItem,
                                )
 from PySide6.QtCore import (QRunnable,
                             Qt,
@@ -29,8 +32,11 @@ from PySide6.QtCore import (QRunnable,
                             QAbstractListModel,
                             QTimer,
                             QRect,
+                            QModelIndex,
+                            QMutex,
+                            QMutexLocker,
                             )
-from PySide6.QtGui import QPen, QColor, QBrush
+from PySide6.QtGui import QPen, QColor, QBrush, QImage, QPainter
 
 """
 Модуль для работы со случайностью random
@@ -42,13 +48,17 @@ from PySide6.QtGui import QPen, QColor, QBrush
 для виджетов с вертикальной организацией QVBoxLayout, класса виджета кнопки QPushButton,
 класс виджета многострочного редактируемого текстового поля QLineEdit, класс базового виджета QWidget,
 класс отображения списка для модели списка QListView, класс QStyledItemDelegate предоставляет
-средства отображения и редактирования элементов данных из модели.
+средства отображения и редактирования элементов данных из модели, класс параметров отрисовки
+элемента списка QStyleOptionViewItem.
 Импорт из модуля PySide6.QtCore класс контейнера для исполняемого кода QRunnable,
 класс менеджера потоков QThreadPool, класс декоратора Slot, класс сигнала Signal, класс базового объекта QObject,
-класса для работы с таймером QTimer, абстрактный класс модели списка QAbstractListModel, класс прямоугольника QRect
+класса для работы с таймером QTimer, абстрактный класс модели списка QAbstractListModel, класс прямоугольника QRect,
+класс индекса модели QModelIndex,
+класс блокировщика ресурса QMutex и класс автоблокировщика QMutexLocker
 Qt - содержит различные идентификаторы, используемые в библиотеке Qt
 Импорт из модуля PySide6.QtGui класс для установки размера пера (толщины линии)
-и цвета для рисования QPen, класс объекта цветов QColor, класса кисти QBrush для закрашивания.
+и цвета для рисования QPen, класс объекта цветов QColor, класса кисти QBrush для закрашивания,
+класс изображения QImage и класс рисовальщика QPainter (используются в замере производительности).
 Другие виджеты можно найти по ссылке https://doc.qt.io/qt-5/widget-classes.html#basic-widget-classes
 """
 
@@ -101,6 +111,7 @@ class Worker(QRunnable):
         self.job_id = str(uuid.uuid4())  # создание уникального идентификатора рабочего потока
         self.args = args  # сохранение аргументов в аттрибуте рабочего потока
         self.kwargs = kwargs  # сохранение ключевых аргументов в аттрибуте рабочего потока
+        self.aggregator = None  # ссылка на агрегатор прогресса, устанавливается менеджером потоков
         self.signals.status.emit(self.job_id, STATUS_WAITING)  # передача данных рабочего потока при его создании
         # сигналу получения статуса. При создании рабочему потоку присваивается статус Ожидает
 
@@ -121,8 +132,7 @@ class Worker(QRunnable):
                 value = value / y  # вычисление некоего значения, при y=0 будет сгенерировано исключение
                 y -= 1
                 result.append(value)  # сохранение вычисленного значения в списке результатов
-                self.signals.progress.emit(self.job_id, n + 1)  # передача данных о прогрессе выполнения
-                # сигналу о его изменении
+                self.report_progress(n + 1)  # передача данных о прогрессе выполнения
                 time.sleep(delay)  # запуск задержки выполнения
         except Exception as e:  # перехват исключения
             print(e)  # вывод текста ошибки
@@ -138,6 +148,71 @@ class Worker(QRunnable):
         self.signals.finished.emit(self.job_id)  # передача идентификатора рабочего потока сигналу
         # о завершении его выполнения
 
+    def report_progress(self, progress: int) -> None:
+        """
+        Метод для передачи прогресса выполнения. Если рабочий поток поставлен в очередь менеджером,
+        значение записывается в агрегатор без отправки сигнала, иначе передается сигналу о прогрессе
+        :param progress: прогресс выполнения рабочего потока
+        :return: None
+        """
+        if self.aggregator is not None:
+            self.aggregator.report(self.job_id, progress)
+        else:
+            self.signals.progress.emit(self.job_id, progress)
+
+
+class ProgressAggregator(QObject):
+    """
+    Класс агрегатора прогресса рабочих потоков.
+    Рабочие потоки не отправляют сигнал на каждый шаг цикла (каждый такой сигнал - это отдельное
+    событие в очереди главного потока), а записывают значение в словарь под блокировкой.
+    В словаре хранится только последнее значение для каждого идентификатора. Таймер в главном потоке
+    с заданной частотой забирает накопленные значения и передает их одним сигналом.
+    """
+    flushed = Signal(dict)  # создание сигнала с накопленным словарем {идентификатор: прогресс}
+
+    def __init__(self, interval: int = 16) -> None:
+        """
+        Конструктор агрегатора прогресса
+        :param interval: интервал передачи накопленных значений в миллисекундах (16 мс - примерно один кадр)
+        """
+        QObject.__init__(self)  # явный вызов конструктора родительского класса
+        self._mutex = QMutex()  # создание блокировщика для доступа к словарю из разных потоков
+        self._pending = {}  # создание словаря для хранения последних значений прогресса
+        self.timer = QTimer()  # создание таймера передачи накопленных значений
+        self.timer.setInterval(interval)  # установка частоты передачи
+        self.timer.timeout.connect(self.flush)  # привязка метода передачи к истечению интервала таймера
+        self.timer.start()  # запуск таймера
+
+    def set_interval(self, interval: int) -> None:
+        """
+        Метод для изменения частоты передачи накопленных значений
+        :param interval: интервал передачи в миллисекундах
+        :return: None
+        """
+        self.timer.setInterval(interval)
+
+    def report(self, job_id: str, progress: int) -> None:
+        """
+        Метод для сохранения прогресса рабочего потока, вызывается из рабочего потока.
+        Предыдущее непереданное значение для того же идентификатора перезаписывается
+        :param job_id: уникальный идентификатор рабочего потока
+        :param progress: прогресс выполнения рабочего потока
+        :return: None
+        """
+        with QMutexLocker(self._mutex):  # блокировка словаря на время записи
+            self._pending[job_id] = progress
+
+    def flush(self) -> None:
+        """
+        Метод для передачи всех накопленных значений одним сигналом, вызывается таймером в главном потоке
+        :return: None
+        """
+        with QMutexLocker(self._mutex):  # блокировка словаря на время подмены
+            pending, self._pending = self._pending, {}  # забираем накопленное и оставляем пустой словарь
+        if pending:  # сигнал передается, только если есть изменения
+            self.flushed.emit(pending)
+
 
 class WorkerManager(QAbstractListModel):
     """
@@ -148,51 +223,85 @@ class WorkerManager(QAbstractListModel):
     """
     _workers = {}  # создание словаря для хранения ссылок на рабочие потоки
     _state = {}  # создание словаря для хранения состояний рабочих потоков
+    _job_ids = []  # создание списка идентификаторов рабочих потоков в порядке строк модели
+    _rows = {}  # создание словаря для быстрого поиска номера строки по идентификатору рабочего потока
     status = Signal(str)  # создание сигнала рабочего потока о его состоянии
 
-    def __init__(self):
+    def __init__(self, progress_interval: int = 16):
         """
         Конструктор менеджера потоков и модели данных
+        :param progress_interval: интервал обновления прогресса рабочих потоков в миллисекундах
         """
         QAbstractListModel.__init__(self)  # явный вызов конструктора родительского класса
         self.threadpool = QThreadPool()  # создание экземпляра менеджера рабочих потоков
         self.max_threads = self.threadpool.maxThreadCount()  # получение информации о
         # максимально возможном количестве рабочих потоков для конкретной системы
         print(f'Multithreading with maximum {self.max_threads} threads')  # вывод числа потоков
+        self.scheduler = JobScheduler(self.threadpool)  # создание планировщика рабочих потоков
         self.status_timer = QTimer()  # создание таймера статуса для менеджера потоков
         self.status_timer.setInterval(100)  # установка интервала вывода состояния потоков (загрузки системы)
         self.status_timer.timeout.connect(self.notify_status)  # создание сигнала на истечение
         # таймера статуса потоков и привязка метода для его передачи сигналу на вывод
         self.status_timer.start()  # запуск таймера опроса статуса потоков (загрузки системы)
+        self.aggregator = ProgressAggregator(progress_interval)  # создание агрегатора прогресса
+        self.aggregator.flushed.connect(self.receive_progress_batch)  # привязка метода пакетного
+        # обновления модели к сигналу агрегатора
 
     def notify_status(self) -> None:
         """
         Метод для формирования и передачи состояния потоков по загрузке рабочими потоками
         :return: None
         """
-        n_workers = len(self._workers)  # определение общего количества рабочих потоков, переданных менеджеру
-        running = min(n_workers, self.max_threads)  # вычисление количества выполняющихся потоков
-        waiting = max(0, n_workers - self.max_threads)  # вычисление количества потоков, ожидающих в очереди
+        running = self.scheduler.running  # количество выполняющихся потоков по данным планировщика
+        waiting = self.scheduler.waiting  # количество потоков, ожидающих в очереди планировщика
         self.status.emit(f'{running} running, {waiting} waiting, {self.max_threads} threads')
         # передача данных о состоянии потоков (загрузки системы) сигналу рабочего потока
 
-    def enqueue(self, worker: QRunnable) -> None:
+    def enqueue(self, worker: QRunnable, priority: int = PRIORITY_NORMAL, category: str = 'default') -> None:
         """
         Метод для постановки рабочего потока в очередь на выполнение
-        путем передачи его менеджеру потоков QThreadPoll
+        путем передачи его планировщику поверх менеджера потоков QThreadPoll
         :param worker: объект рабочего потока
+        :param priority: приоритет рабочего потока (PRIORITY_LOW, PRIORITY_NORMAL, PRIORITY_HIGH)
+        :param category: категория рабочего потока для ограничения одновременного выполнения
         :return: None
         """
         worker.signals.error.connect(self.receive_error)  # создание сигнала об ошибке с привязкой метода ресивера
         worker.signals.status.connect(self.receive_status)  # создание сигнала о статусе с привязкой метода ресивера
         worker.signals.progress.connect(self.receive_progress)  # создание сигнала о прогрессе выполнения
         # с привязкой метода ресивера
+        worker.aggregator = self.aggregator  # прогресс рабочего потока передается через агрегатор
         worker.signals.finished.connect(self.done)  # создание сигнала о завершении потока с привязкой метода ресивера
-        self.threadpool.start(worker)  # запуск рабочего потока на выполнение
         self._workers[worker.job_id] = worker  # сохранение ссылки на рабочий поток
-        self._state[worker.job_id] = DEFAULT_STATE.copy()  # установка статуса по умолчания
+        self.add_job(worker.job_id)  # добавление строки рабочего потока в модель
+        self.scheduler.submit(worker, priority, category)  # постановка рабочего потока в очередь планировщика
+
+    def add_job(self, job_id: str) -> None:
+        """
+        Метод для добавления строки рабочего потока в конец модели со статусом по умолчанию.
+        Вместо обновления всей модели через layoutChanged отображению сообщается только о вставке одной строки
+        :param job_id: уникальный идентификатор рабочего потока
+        :return: None
+        """
+        row = len(self._job_ids)  # номер новой строки - в конце списка
+        self.beginInsertRows(QModelIndex(), row, row)  # уведомление отображения о начале вставки строки
+        self._job_ids.append(job_id)  # сохранение идентификатора в списке строк
+        self._rows[job_id] = row  # сохранение номера строки для идентификатора
+        self._state[job_id] = DEFAULT_STATE.copy()  # установка статуса по умолчания
         # при постановке рабочего потока в очередь
-        self.layoutChanged.emit()  # передача данных для сигнала на обновление отображения модели
+        self.endInsertRows()  # уведомление отображения о завершении вставки строки
+
+    def job_changed(self, job_id: str) -> None:
+        """
+        Метод для уведомления отображения об изменении данных одной строки рабочего потока.
+        Номер строки извлекается из словаря за O(1), перерисовывается только эта строка
+        :param job_id: уникальный идентификатор рабочего потока
+        :return: None
+        """
+        row = self._rows.get(job_id)  # поиск номера строки по идентификатору
+        if row is not None:  # строка могла быть уже удалена при очистке списка
+            index = self.index(row)  # создание индекса модели для строки
+            self.dataChanged.emit(index, index, [Qt.DisplayRole])  # передача сигнала на обновление строки
 
     def receive_status(self, job_id: str, status: str) -> None:
         """
@@ -201,8 +310,9 @@ class WorkerManager(QAbstractListModel):
         :param status: - статус рабочего потока
         :return: None
         """
-        self._state[job_id]['status'] = status  # сохранение информации о состоянии потока
-        self.layoutChanged.emit()  # передача данных для сигнала на обновление отображения модели
+        if job_id in self._state:  # строка могла быть уже удалена при очистке списка
+            self._state[job_id]['status'] = status  # сохранение информации о состоянии потока
+            self.job_changed(job_id)  # передача сигнала на обновление строки рабочего потока
 
     def receive_progress(self, job_id: str, progress: int) -> None:
         """
@@ -211,8 +321,24 @@ class WorkerManager(QAbstractListModel):
         :param progress: - прогресс выполнения рабочего потока
         :return: None
         """
-        self._state[job_id]['progress'] = progress  # сохранение информации о состоянии потока
-        self.layoutChanged.emit()  # передача данных для сигнала на обновление отображения модели
+        if job_id in self._state:  # строка могла быть уже удалена при очистке списка
+            self._state[job_id]['progress'] = progress  # сохранение информации о состоянии потока
+            self.job_changed(job_id)  # передача сигнала на обновление строки рабочего потока
+
+    def receive_progress_batch(self, updates: dict) -> None:
+        """
+        Метод для пакетного сохранения прогресса нескольких рабочих потоков, полученного от агрегатора.
+        Отображению передается один сигнал dataChanged на диапазон затронутых строк
+        :param updates: словарь {идентификатор рабочего потока: прогресс}
+        :return: None
+        """
+        rows = []  # список номеров измененных строк
+        for job_id, progress in updates.items():
+            if job_id in self._state:  # строка могла быть уже удалена при очистке списка
+                self._state[job_id]['progress'] = progress  # сохранение информации о состоянии потока
+                rows.append(self._rows[job_id])
+        if rows:
+            self.dataChanged.emit(self.index(min(rows)), self.index(max(rows)), [Qt.DisplayRole])
 
     @staticmethod
     def receive_error(job_id: str, message: str) -> None:
@@ -232,18 +358,33 @@ class WorkerManager(QAbstractListModel):
         :param job_id: уникальный идентификатор рабочего потока
         :return: None
         """
-        del self._workers[job_id]
-        self.layoutChanged.emit()  # передача данных для сигнала на обновление отображения модели
+        del self._workers[job_id]  # данные строки при этом не меняются, обновлять отображение не нужно
+        self.scheduler.release(job_id)  # освобождение места в планировщике для следующего рабочего потока
 
     def cleanup(self) -> None:
         """
         Метод для удаления всех выполненных или сбойных рабочих потоков из словаря состояний
         :return:
         """
-        for job_id, s in list(self._state.items()):
-            if s['status'] in (STATUS_COMPLETE, STATUS_ERROR):
-                del self._state[job_id]
-        self.layoutChanged.emit()  # передача данных для сигнала на обновление отображения модели
+        rows = [row for row, job_id in enumerate(self._job_ids)
+                if self._state[job_id]['status'] in (STATUS_COMPLETE, STATUS_ERROR)]  # номера удаляемых строк
+        if not rows:  # удалять нечего
+            return
+        ranges = []  # список непрерывных диапазонов удаляемых строк вида [первая, последняя]
+        for row in rows:  # объединение соседних строк в диапазоны
+            if ranges and ranges[-1][1] == row - 1:
+                ranges[-1][1] = row
+            else:
+                ranges.append([row, row])
+        for first, last in reversed(ranges):  # удаление с конца, чтобы номера оставшихся диапазонов не сдвигались
+            self.beginRemoveRows(QModelIndex(), first, last)  # уведомление отображения о начале удаления строк
+            for job_id in self._job_ids[first:last + 1]:
+                del self._state[job_id]  # удаление состояния рабочего потока
+                del self._rows[job_id]  # удаление номера строки рабочего потока
+            del self._job_ids[first:last + 1]  # удаление идентификаторов из списка строк
+            self.endRemoveRows()  # уведомление отображения о завершении удаления строк
+        self._rows.clear()  # пересчет номеров оставшихся строк за один проход
+        self._rows.update((job_id, row) for row, job_id in enumerate(self._job_ids))
 
     def data(self, index, role: int) -> str | tuple:
         """
@@ -253,8 +394,7 @@ class WorkerManager(QAbstractListModel):
         :return: str
         """
         if role == Qt.DisplayRole:  # проверка наличия роли отображения
-            job_ids = list(self._state.keys())  # создание списка идентификаторов рабочих процессов
-            job_id = job_ids[index.row()]
+            job_id = self._job_ids[index.row()]  # получение идентификатора по номеру строки без создания списка
             return job_id, self._state[job_id]
 
     def rowCount(self, index) -> int:
@@ -263,7 +403,7 @@ class WorkerManager(QAbstractListModel):
         :param index: QModelIndex или QPersistentModelIndex объект индексации модели данных
         :return: - количество строк
         """
-        return len(self._state)
+        return len(self._job_ids)
 
 
 class ProgressBarDelegate(QStyledItemDelegate):
@@ -350,6 +490,48 @@ class MainWindow(QMainWindow):
         self.text.appendPlainText(f'WORKER {job_id}: {data}')
 
 
+def benchmark() -> None:
+    """
+    Функция замера стоимости отрисовки видимой области списка в зависимости от числа рабочих потоков.
+    Запуск: python 20_qrunner_manager.py --benchmark
+    Для каждого размера модели рисуется одно и то же окно из VISIBLE строк в конце списка
+    и обновляется прогресс одного потока. Время на строку должно оставаться постоянным.
+    :return: None
+    """
+    app = QApplication.instance() or QApplication(sys.argv)  # приложение нужно для рисования текста
+    visible = 50  # количество строк, помещающихся в видимую область списка
+    repeats = 20  # количество повторов отрисовки для усреднения
+    delegate = ProgressBarDelegate()  # делегат, рисующий строки списка
+    image = QImage(400, 20 * visible, QImage.Format_ARGB32)  # поверхность для рисования вместо окна
+    print(f'{"jobs":>8} {"paint, us/row":>14} {"update, us":>11}')
+    for n_jobs in (1_000, 10_000, 100_000):
+        manager = WorkerManager()  # новая модель для каждого размера
+        manager.status_timer.stop()  # таймер статуса в замере не нужен
+        manager._job_ids.clear()  # словари и списки модели являются атрибутами класса, очищаем их
+        manager._rows.clear()
+        manager._state.clear()
+        for _ in range(n_jobs):  # заполнение модели строками без запуска рабочих потоков
+            manager.add_job(str(uuid.uuid4()))
+        for job_id in manager._job_ids:  # заполнение прогресса, чтобы делегат рисовал индикатор
+            manager._state[job_id].update(progress=random.randint(1, 100), status=STATUS_RUNNING)
+        option = QStyleOptionViewItem()  # параметры отрисовки строки
+        painter = QPainter(image)  # рисовальщик на поверхности изображения
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for i, row in enumerate(range(n_jobs - visible, n_jobs)):  # отрисовка последних видимых строк
+                option.rect = QRect(0, i * 20, 400, 20)
+                delegate.paint(painter, option, manager.index(row))
+        paint = (time.perf_counter() - start) / (repeats * visible) * 1e6
+        painter.end()  # завершение рисования
+        job_id = manager._job_ids[-1]  # поток, прогресс которого обновляется
+        start = time.perf_counter()
+        for n in range(1000):
+            manager.receive_progress(job_id, n % 100 + 1)  # обновление прогресса с отправкой dataChanged
+        update = (time.perf_counter() - start) / 1000 * 1e6
+        print(f'{n_jobs:>8} {paint:>14.2f} {update:>11.2f}')
+    app.quit()
+
+
 def main() -> None:
     """
     Функция запуска кода приложения верхнего уровня
@@ -364,4 +546,7 @@ def main() -> None:
 
 if __name__ == '__main__':  # данная конструкция предотвращает запуск кода верхнего уровня
     # при импортировании данного файла как модуля
-    main()  # вызов функции запуска кода верхнего уровня приложения
+    if '--benchmark' in sys.argv:  # запуск замера производительности вместо приложения
+        benchmark()
+    else:
+        main()  # вызов функции запуска кода верхнего уровня приложения
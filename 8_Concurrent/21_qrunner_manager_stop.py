@@ -11,6 +11,8 @@ import time
 import uuid
 import random
 
+from job_scheduler import JobScheduler, PRIORITY_NORMAL, PRIORITY_HIGH  # импорт планировщика рабочих потоков
+# и констант приоритетов
 from PySide6.QtWidgets import (QApplication,
                                QListView,
                                QPlainTextEdit,
@@ -30,6 +32,9 @@ from PySide6.QtCore import (QRunnable,
                             QAbstractListModel,
                             QTimer,
                             QRect,
+                            QModelIndex,
+                            QMutex,
+                            QMutexLocker,
                             )
 from PySide6.QtGui import QPen, QColor, QBrush
 
@@ -46,7 +51,9 @@ from PySide6.QtGui import QPen, QColor, QBrush
 средства отображения и редактирования элементов данных из модели, абстрактный класс базового стиля QStyle.
 Импорт из модуля PySide6.QtCore класс контейнера для исполняемого кода QRunnable,
 класс менеджера потоков QThreadPool, класс декоратора Slot, класс сигнала Signal, класс базового объекта QObject,
-класса для работы с таймером QTimer, абстрактный класс модели списка QAbstractListModel, класс прямоугольника QRect
+класса для работы с таймером QTimer, абстрактный класс модели списка QAbstractListModel, класс прямоугольника QRect,
+класс индекса модели QModelIndex,
+класс блокировщика ресурса QMutex и класс автоблокировщика QMutexLocker
 Qt - содержит различные идентификаторы, используемые в библиотеке Qt
 Импорт из модуля PySide6.QtGui класс для установки размера пера (толщины линии)
 и цвета для рисования QPen, класс объекта цветов QColor, класса кисти QBrush для закрашивания.
@@ -68,7 +75,6 @@ STATUS_COLORS = {
 
 DEFAULT_STATE = {'progress': 0, 'status': STATUS_WAITING}
 
-
 class WorkerSignals(QObject):
     """
     Класс сигналов рабочего потока, определяющий набор сигналов
@@ -108,6 +114,7 @@ class Worker(QRunnable):
         self.job_id = str(uuid.uuid4())  # создание уникального идентификатора рабочего потока
         self.args = args  # сохранение аргументов в аттрибуте рабочего потока
         self.kwargs = kwargs  # сохранение ключевых аргументов в аттрибуте рабочего потока
+        self.aggregator = None  # ссылка на агрегатор прогресса, устанавливается менеджером потоков
         self.signals.status.emit(self.job_id, STATUS_WAITING)  # передача данных рабочего потока при его создании
         # сигналу получения статуса. При создании рабочему потоку присваивается статус Ожидает
         self.is_killed = False
@@ -129,8 +136,7 @@ class Worker(QRunnable):
                 value = value / y  # вычисление некоего значения, при y=0 будет сгенерировано исключение
                 y -= 1
                 result.append(value)  # сохранение вычисленного значения в списке результатов
-                self.signals.progress.emit(self.job_id, n + 1)  # передача данных о прогрессе выполнения
-                # сигналу о его изменении
+                self.report_progress(n + 1)  # передача данных о прогрессе выполнения
                 time.sleep(delay)  # запуск задержки выполнения
                 if self.is_killed:
                     raise WorkerKilledException
@@ -157,6 +163,71 @@ class Worker(QRunnable):
         """
         self.is_killed = True
 
+    def report_progress(self, progress: int) -> None:
+        """
+        Метод для передачи прогресса выполнения. Если рабочий поток поставлен в очередь менеджером,
+        значение записывается в агрегатор без отправки сигнала, иначе передается сигналу о прогрессе
+        :param progress: прогресс выполнения рабочего потока
+        :return: None
+        """
+        if self.aggregator is not None:
+            self.aggregator.report(self.job_id, progress)
+        else:
+            self.signals.progress.emit(self.job_id, progress)
+
+
+class ProgressAggregator(QObject):
+    """
+    Класс агрегатора прогресса рабочих потоков.
+    Рабочие потоки не отправляют сигнал на каждый шаг цикла (каждый такой сигнал - это отдельное
+    событие в очереди главного потока), а записывают значение в словарь под блокировкой.
+    В словаре хранится только последнее значение для каждого идентификатора. Таймер в главном потоке
+    с заданной частотой забирает накопленные значения и передает их одним сигналом.
+    """
+    flushed = Signal(dict)  # создание сигнала с накопленным словарем {идентификатор: прогресс}
+
+    def __init__(self, interval: int = 16) -> None:
+        """
+        Конструктор агрегатора прогресса
+        :param interval: интервал передачи накопленных значений в миллисекундах (16 мс - примерно один кадр)
+        """
+        QObject.__init__(self)  # явный вызов конструктора родительского класса
+        self._mutex = QMutex()  # создание блокировщика для доступа к словарю из разных потоков
+        self._pending = {}  # создание словаря для хранения последних значений прогресса
+        self.timer = QTimer()  # создание таймера передачи накопленных значений
+        self.timer.setInterval(interval)  # установка частоты передачи
+        self.timer.timeout.connect(self.flush)  # привязка метода передачи к истечению интервала таймера
+        self.timer.start()  # запуск таймера
+
+    def set_interval(self, interval: int) -> None:
+        """
+        Метод для изменения частоты передачи накопленных значений
+        :param interval: интервал передачи в миллисекундах
+        :return: None
+        """
+        self.timer.setInterval(interval)
+
+    def report(self, job_id: str, progress: int) -> None:
+        """
+        Метод для сохранения прогресса рабочего потока, вызывается из рабочего потока.
+        Предыдущее непереданное значение для того же идентификатора перезаписывается
+        :param job_id: уникальный идентификатор рабочего потока
+        :param progress: прогресс выполнения рабочего потока
+        :return: None
+        """
+        with QMutexLocker(self._mutex):  # блокировка словаря на время записи
+            self._pending[job_id] = progress
+
+    def flush(self) -> None:
+        """
+        Метод для передачи всех накопленных значений одним сигналом, вызывается таймером в главном потоке
+        :return: None
+        """
+        with QMutexLocker(self._mutex):  # блокировка словаря на время подмены
+            pending, self._pending = self._pending, {}  # забираем накопленное и оставляем пустой словарь
+        if pending:  # сигнал передается, только если есть изменения
+            self.flushed.emit(pending)
+
 
 class WorkerManager(QAbstractListModel):
     """
@@ -167,51 +238,85 @@ class WorkerManager(QAbstractListModel):
     """
     _workers = {}  # создание словаря для хранения ссылок на рабочие потоки
     _state = {}  # создание словаря для хранения состояний рабочих потоков
+    _job_ids = []  # создание списка идентификаторов рабочих потоков в порядке строк модели
+    _rows = {}  # создание словаря для быстрого поиска номера строки по идентификатору рабочего потока
     status = Signal(str)  # создание сигнала рабочего потока о его состоянии
 
-    def __init__(self):
+    def __init__(self, progress_interval: int = 16):
         """
         Конструктор менеджера потоков и модели данных
+        :param progress_interval: интервал обновления прогресса рабочих потоков в миллисекундах
         """
         QAbstractListModel.__init__(self)  # явный вызов конструктора родительского класса
         self.threadpool = QThreadPool()  # создание экземпляра менеджера рабочих потоков
         self.max_threads = self.threadpool.maxThreadCount()  # получение информации о
         # максимально возможном количестве рабочих потоков для конкретной системы
         print(f'Multithreading with maximum {self.max_threads} threads')  # вывод числа потоков
+        self.scheduler = JobScheduler(self.threadpool)  # создание планировщика рабочих потоков
         self.status_timer = QTimer()  # создание таймера статуса для менеджера потоков
         self.status_timer.setInterval(100)  # установка интервала вывода состояния потоков (загрузки системы)
         self.status_timer.timeout.connect(self.notify_status)  # создание сигнала на истечение
         # таймера статуса потоков и привязка метода для его передачи сигналу на вывод
         self.status_timer.start()  # запуск таймера опроса статуса потоков (загрузки системы)
+        self.aggregator = ProgressAggregator(progress_interval)  # создание агрегатора прогресса
+        self.aggregator.flushed.connect(self.receive_progress_batch)  # привязка метода пакетного
+        # обновления модели к сигналу агрегатора
 
     def notify_status(self) -> None:
         """
         Метод для формирования и передачи состояния потоков по загрузке рабочими потоками
         :return: None
         """
-        n_workers = len(self._workers)  # определение общего количества рабочих потоков, переданных менеджеру
-        running = min(n_workers, self.max_threads)  # вычисление количества выполняющихся потоков
-        waiting = max(0, n_workers - self.max_threads)  # вычисление количества потоков, ожидающих в очереди
+        running = self.scheduler.running  # количество выполняющихся потоков по данным планировщика
+        waiting = self.scheduler.waiting  # количество потоков, ожидающих в очереди планировщика
         self.status.emit(f'{running} running, {waiting} waiting, {self.max_threads} threads')
         # передача данных о состоянии потоков (загрузки системы) сигналу рабочего потока
 
-    def enqueue(self, worker: QRunnable) -> None:
+    def enqueue(self, worker: QRunnable, priority: int = PRIORITY_NORMAL, category: str = 'default') -> None:
         """
         Метод для постановки рабочего потока в очередь на выполнение
-        путем передачи его менеджеру потоков QThreadPoll
+        путем передачи его планировщику поверх менеджера потоков QThreadPoll
         :param worker: объект рабочего потока
+        :param priority: приоритет рабочего потока (PRIORITY_LOW, PRIORITY_NORMAL, PRIORITY_HIGH)
+        :param category: категория рабочего потока для ограничения одновременного выполнения
         :return: None
         """
         worker.signals.error.connect(self.receive_error)  # создание сигнала об ошибке с привязкой метода ресивера
         worker.signals.status.connect(self.receive_status)  # создание сигнала о статусе с привязкой метода ресивера
         worker.signals.progress.connect(self.receive_progress)  # создание сигнала о прогрессе выполнения
         # с привязкой метода ресивера
+        worker.aggregator = self.aggregator  # прогресс рабочего потока передается через агрегатор
         worker.signals.finished.connect(self.done)  # создание сигнала о завершении потока с привязкой метода ресивера
-        self.threadpool.start(worker)  # запуск рабочего потока на выполнение
         self._workers[worker.job_id] = worker  # сохранение ссылки на рабочий поток
-        self._state[worker.job_id] = DEFAULT_STATE.copy()  # установка статуса по умолчания
+        self.add_job(worker.job_id)  # добавление строки рабочего потока в модель
+        self.scheduler.submit(worker, priority, category)  # постановка рабочего потока в очередь планировщика
+
+    def add_job(self, job_id: str) -> None:
+        """
+        Метод для добавления строки рабочего потока в конец модели со статусом по умолчанию.
+        Вместо обновления всей модели через layoutChanged отображению сообщается только о вставке одной строки
+        :param job_id: уникальный идентификатор рабочего потока
+        :return: None
+        """
+        row = len(self._job_ids)  # номер новой строки - в конце списка
+        self.beginInsertRows(QModelIndex(), row, row)  # уведомление отображения о начале вставки строки
+        self._job_ids.append(job_id)  # сохранение идентификатора в списке строк
+        self._rows[job_id] = row  # сохранение номера строки для идентификатора
+        self._state[job_id] = DEFAULT_STATE.copy()  # установка статуса по умолчания
         # при постановке рабочего потока в очередь
-        self.layoutChanged.emit()  # передача данных для сигнала на обновление отображения модели
+        self.endInsertRows()  # уведомление отображения о завершении вставки строки
+
+    def job_changed(self, job_id: str) -> None:
+        """
+        Метод для уведомления отображения об изменении данных одной строки рабочего потока.
+        Номер строки извлекается из словаря за O(1), перерисовывается только эта строка
+        :param job_id: уникальный идентификатор рабочего потока
+        :return: None
+        """
+        row = self._rows.get(job_id)  # поиск номера строки по идентификатору
+        if row is not None:  # строка могла быть уже удалена при очистке списка
+            index = self.index(row)  # создание индекса модели для строки
+            self.dataChanged.emit(index, index, [Qt.DisplayRole])  # передача сигнала на обновление строки
 
     def receive_status(self, job_id: str, status: str) -> None:
         """
@@ -220,8 +325,9 @@ class WorkerManager(QAbstractListModel):
         :param status: - статус рабочего потока
         :return: None
         """
-        self._state[job_id]['status'] = status  # сохранение информации о состоянии потока
-        self.layoutChanged.emit()  # передача данных для сигнала на обновление отображения модели
+        if job_id in self._state:  # строка могла быть уже удалена при очистке списка
+            self._state[job_id]['status'] = status  # сохранение информации о состоянии потока
+            self.job_changed(job_id)  # передача сигнала на обновление строки рабочего потока
 
     def receive_progress(self, job_id: str, progress: int) -> None:
         """
@@ -230,8 +336,24 @@ class WorkerManager(QAbstractListModel):
         :param progress: - прогресс выполнения рабочего потока
         :return: None
         """
-        self._state[job_id]['progress'] = progress  # сохранение информации о состоянии потока
-        self.layoutChanged.emit()  # передача данных для сигнала на обновление отображения модели
+        if job_id in self._state:  # строка могла быть уже удалена при очистке списка
+            self._state[job_id]['progress'] = progress  # сохранение информации о состоянии потока
+            self.job_changed(job_id)  # передача сигнала на обновление строки рабочего потока
+
+    def receive_progress_batch(self, updates: dict) -> None:
+        """
+        Метод для пакетного сохранения прогресса нескольких рабочих потоков, полученного от агрегатора.
+        Отображению передается один сигнал dataChanged на диапазон затронутых строк
+        :param updates: словарь {идентификатор рабочего потока: прогресс}
+        :return: None
+        """
+        rows = []  # список номеров измененных строк
+        for job_id, progress in updates.items():
+            if job_id in self._state:  # строка могла быть уже удалена при очистке списка
+                self._state[job_id]['progress'] = progress  # сохранение информации о состоянии потока
+                rows.append(self._rows[job_id])
+        if rows:
+            self.dataChanged.emit(self.index(min(rows)), self.index(max(rows)), [Qt.DisplayRole])
 
     @staticmethod
     def receive_error(job_id: str, message: str) -> None:
@@ -251,24 +373,60 @@ class WorkerManager(QAbstractListModel):
         :param job_id: уникальный идентификатор рабочего потока
         :return: None
         """
-        del self._workers[job_id]
-        self.layoutChanged.emit()  # передача данных для сигнала на обновление отображения модели
+        del self._workers[job_id]  # данные строки при этом не меняются, обновлять отображение не нужно
+        self.scheduler.release(job_id)  # освобождение места в планировщике для следующего рабочего потока
 
     def cleanup(self) -> None:
         """
         Метод для удаления всех выполненных или сбойных рабочих потоков из словаря состояний
         :return:
         """
-        for job_id, s in list(self._state.items()):
-            if s['status'] in (STATUS_COMPLETE, STATUS_ERROR, STATUS_STOPPED):
-                del self._state[job_id]
-        self.layoutChanged.emit()  # передача данных для сигнала на обновление отображения модели
+        rows = [row for row, job_id in enumerate(self._job_ids)
+                if self._state[job_id]['status'] in (STATUS_COMPLETE, STATUS_ERROR, STATUS_STOPPED)]  # номера удаляемых строк
+        if not rows:  # удалять нечего
+            return
+        ranges = []  # список непрерывных диапазонов удаляемых строк вида [первая, последняя]
+        for row in rows:  # объединение соседних строк в диапазоны
+            if ranges and ranges[-1][1] == row - 1:
+                ranges[-1][1] = row
+            else:
+                ranges.append([row, row])
+        for first, last in reversed(ranges):  # удаление с конца, чтобы номера оставшихся диапазонов не сдвигались
+            self.beginRemoveRows(QModelIndex(), first, last)  # уведомление отображения о начале удаления строк
+            for job_id in self._job_ids[first:last + 1]:
+                del self._state[job_id]  # удаление состояния рабочего потока
+                del self._rows[job_id]  # удаление номера строки рабочего потока
+            del self._job_ids[first:last + 1]  # удаление идентификаторов из списка строк
+            self.endRemoveRows()  # уведомление отображения о завершении удаления строк
+        self._rows.clear()  # пересчет номеров оставшихся строк за один проход
+        self._rows.update((job_id, row) for row, job_id in enumerate(self._job_ids))
+
+    def remove_job(self, job_id: str) -> None:
+        """
+        Метод для удаления строки одного рабочего потока из модели
+        :param job_id: уникальный идентификатор рабочего потока
+        :return: None
+        """
+        row = self._rows.get(job_id)  # поиск номера строки по идентификатору
+        if row is None:  # строка могла быть уже удалена при очистке списка
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)  # уведомление отображения о начале удаления строки
+        del self._job_ids[row]  # удаление идентификатора из списка строк
+        del self._state[job_id]  # удаление состояния рабочего потока
+        del self._rows[job_id]  # удаление номера строки рабочего потока
+        for shifted_row in range(row, len(self._job_ids)):  # сдвиг номеров следующих строк
+            self._rows[self._job_ids[shifted_row]] = shifted_row
+        self.endRemoveRows()  # уведомление отображения о завершении удаления строки
 
     def kill(self, job_id: str) -> None:
         """
-        Метод удаления рабочего потока
+        Метод удаления рабочего потока. Ожидающий в очереди поток снимается с очереди планировщика,
+        выполняющемуся потоку устанавливается флаг завершения
         """
-        if job_id in self._workers:  # проверка идентификатора на членство в списке рабочих потоков
+        if self.scheduler.cancel(job_id):  # поток еще не запущен и снят с очереди
+            del self._workers[job_id]  # поток не будет запущен и не передаст сигнал о завершении
+            self.remove_job(job_id)  # строка потока удаляется сразу: поток не дойдет до done() и очистки
+        elif job_id in self._workers:  # проверка идентификатора на членство в списке рабочих потоков
             self._workers[job_id].kill()  # удаление рабочего потока
 
     def data(self, index, role: int) -> str | tuple:
@@ -279,8 +437,7 @@ class WorkerManager(QAbstractListModel):
         :return: str
         """
         if role == Qt.DisplayRole:  # проверка наличия роли отображения
-            job_ids = list(self._state.keys())  # создание списка идентификаторов рабочих процессов
-            job_id = job_ids[index.row()]
+            job_id = self._job_ids[index.row()]  # получение идентификатора по номеру строки без создания списка
             return job_id, self._state[job_id]
 
     def rowCount(self, index) -> int:
@@ -289,7 +446,7 @@ class WorkerManager(QAbstractListModel):
         :param index: QModelIndex или QPersistentModelIndex объект индексации модели данных
         :return: - количество строк
         """
-        return len(self._state)
+        return len(self._job_ids)
 
 
 class ProgressBarDelegate(QStyledItemDelegate):
@@ -347,6 +504,10 @@ class MainWindow(QMainWindow):
         start = QPushButton('Start a worker')  # создание кнопки на запуск рабочего потока
         start.pressed.connect(self.start_worker)  # создание сигнала на нажатие кнопки запуска рабочего потока
         # с привязкой метода ресивера
+        urgent = QPushButton('Start an urgent worker')  # создание кнопки на запуск срочного рабочего потока
+        urgent.pressed.connect(self.start_urgent_worker)  # создание сигнала на нажатие кнопки
+        # с привязкой метода ресивера
+        self.workers.scheduler.set_category_limit('urgent', 2)  # не более двух срочных потоков одновременно
         clear = QPushButton('Clear')  # создание кнопки на очистку списка рабочих потоков
         clear.pressed.connect(self.workers.cleanup)  # создание сигнала на нажатие кнопки на очистку
         # с привязкой метода ресивера
@@ -355,16 +516,19 @@ class MainWindow(QMainWindow):
         # и привязка метода ресивера
         layout.addWidget(self.text)  # размещение в слое текстового поля для результатов
         layout.addWidget(start)  # размещение в слое кнопки на запуск рабочих потоков
+        layout.addWidget(urgent)  # размещение в слое кнопки на запуск срочных рабочих потоков
         layout.addWidget(clear)  # размещение в слое кнопки на очистку списка рабочих потоков
         layout.addWidget(stop)  # размещение в слое кнопки на остановку рабочего потока
         container = QWidget()  # создание контейнера для слоев из супер-класса базового пустого виджета
         container.setLayout(layout)  # размещение слоя в контейнере
         self.setCentralWidget(container)  # размещение контейнера в главном окне приложения
 
-    def start_worker(self) -> None:
+    def start_worker(self, priority: int = PRIORITY_NORMAL, category: str = 'default') -> None:
         """
         Метод ресивер, который создает рабочий поток и ставит его в очередь, вызывая соответствующий метод
         класса рабочего потока
+        :param priority: приоритет рабочего потока
+        :param category: категория рабочего потока
         """
         x = random.randint(0, 1000)  # генерация случайной величины
         y = random.randint(0, 1000)  # генерация случайной величины
@@ -373,7 +537,13 @@ class MainWindow(QMainWindow):
         # с привязкой метода ресивера
         worker.signals.error.connect(self.display_result)  # создание сигнала на вывод ошибки
         # с привязкой метода ресивера
-        self.workers.enqueue(worker)  # постановка рабочего потока в очередь
+        self.workers.enqueue(worker, priority, category)  # постановка рабочего потока в очередь
+
+    def start_urgent_worker(self) -> None:
+        """
+        Метод ресивер, который ставит в очередь рабочий поток с высоким приоритетом в категории срочных
+        """
+        self.start_worker(PRIORITY_HIGH, 'urgent')
 
     def stop_worker(self):
         """
@@ -381,8 +551,9 @@ class MainWindow(QMainWindow):
         """
         selected = self.progress.selectedIndexes()  # сохранение ссылки на выбранный (можно выбрать несколько)
         # в списке рабочий поток
-        for idx in selected:  # цикл по выбранным рабочим потокам
-            job_id, _ = self.workers.data(idx, Qt.DisplayRole)  # извлечение идентификатора рабочего потока
+        job_ids = [self.workers.data(idx, Qt.DisplayRole)[0] for idx in selected]  # извлечение идентификаторов
+        # до удаления: снятие с очереди удаляет строку и сдвигает номера следующих строк
+        for job_id in job_ids:  # цикл по выбранным рабочим потокам
             self.workers.kill(job_id)  # удаление рабочего потока
 
     def display_result(self, job_id: str, data: object) -> None:
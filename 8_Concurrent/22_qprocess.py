@@ -8,7 +8,6 @@ import re
 
 from PySide6.QtWidgets import (QApplication,
                                QMainWindow,
-                               QPlainTextEdit,
                                QProgressBar,
                                QPushButton,
                                QVBoxLayout,
@@ -17,6 +16,8 @@ from PySide6.QtWidgets import (QApplication,
 
 from PySide6.QtCore import QProcess
 
+from log_console import LogConsole  # импорт класса журнала с пакетным добавлением строк
+
 """
 Модуль re для работы с регулярными выражениями.
 Модуль sys нужен для доступа к аргументам командной строки. Если использование аргументов
@@ -24,8 +25,7 @@ from PySide6.QtCore import QProcess
 приложения в класс QApplication([]) в качестве аргумента передается пустой список.
 Импорт из модуля PySide6.QtWidgets класса для управления приложением QApplication и класса слоев
 для виджетов с вертикальной организацией QVBoxLayout, класса виджета кнопки QPushButton,
-класс виджета индикатора прогресса QProgressBar, класс виджета многострочного редактируемого
-текстового поля QPlainTextEdit, класс базового виджета QWidget.
+класс виджета индикатора прогресса QProgressBar, класс базового виджета QWidget.
 Импорт из модуля PySide6.QtCore класса для запуска внешних процессов и управления ими QProcess.
 Qt - содержит различные идентификаторы, используемые в библиотеке Qt
 Другие виджеты можно найти по ссылке https://doc.qt.io/qt-5/widget-classes.html#basic-widget-classes
@@ -77,8 +77,7 @@ class MainWindow(QMainWindow):
         QMainWindow.__init__(self)  # явный вызов конструктора родительского класса
         self.p = None  # создание аттрибута для хранения ссылки на внешний процесс
         layout = QVBoxLayout()  # создание экземпляра класса слоев для виджетов
-        self.text = QPlainTextEdit()  # создание экземпляра класса многострочного
-        # редактируемого текстового поля.
+        self.text = LogConsole()  # создание журнала, добавляющего строки в текстовое поле пакетами раз в кадр
         self.progress = QProgressBar()  # создание экземпляра виджета индикатора прогресса
 
         btn_run = QPushButton('Execut')  # создание кнопки с надписью
@@ -121,7 +120,7 @@ class MainWindow(QMainWindow):
         """
         result = bytes(self.p.readAllStandardOutput()).decode("utf8")  # декодирование строки вывода из процесса
         data = extract_vars(result)  # извлечение результатов работ из строки вывода
-        self.text.appendPlainText(str(data))  # запись результатов в тестовое поле
+        self.text.append_line(str(data))  # постановка результатов в очередь на запись в текстовое поле
 
     def handle_state(self, state) -> None:
         """
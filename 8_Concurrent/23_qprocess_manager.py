@@ -4,14 +4,19 @@
 QProcess - класс для запуска внешних процессов
 В данном примере реализован менеджер внешних процессов
 """
+import os
 import sys
 import re
+import time
+import codecs
+import tempfile
+import json
 import uuid
+from collections import deque
 
 from PySide6.QtWidgets import (QApplication,
                                QListView,
                                QMainWindow,
-                               QPlainTextEdit,
                                QStyledItemDelegate,
                                QPushButton,
                                QVBoxLayout,
@@ -23,37 +28,47 @@ from PySide6.QtCore import (QProcess,
                             QRect,
                             Qt,
                             QTimer,
+                            QThread,
                             Signal
                             )
 from PySide6.QtGui import QPen, QColor, QBrush
 
+from log_console import LogConsole  # импорт класса журнала с пакетным добавлением строк
+
 """
 Модуль re для работы с регулярными выражениями.
+Модуль codecs для инкрементального декодирования вывода процессов, модули time и tempfile
+используются в замере производительности.
+Модуль os для работы с путями к файлам, модуль json для передачи заданий интерпретаторам пула,
+класс двусторонней очереди deque из модуля collections для очереди заданий.
 Модуль для работы с уникальными идентификаторами uuid.
 Модуль sys нужен для доступа к аргументам командной строки. Если использование аргументов
 командной строки не предполагается, то импорт можно не выполнять. При этом, при создании
 приложения в класс QApplication([]) в качестве аргумента передается пустой список.
 Импорт из модуля PySide6.QtWidgets класса для управления приложением QApplication и класса слоев
 для виджетов с вертикальной организацией QVBoxLayout, класса виджета кнопки QPushButton,
-класс виджета индикатора прогресса QProgressBar, класс виджета многострочного редактируемого
-текстового поля QPlainTextEdit, класс базового виджета QWidget, класс отображения списка для модели списка QListView,
+класс виджета индикатора прогресса QProgressBar, класс базового виджета QWidget, класс отображения списка для модели списка QListView,
 класс QStyledItemDelegate предоставляет средства отображения и редактирования элементов данных из модели.
 Импорт из модуля PySide6.QtCore класса для запуска внешних процессов и управления ими QProcess,
 абстрактный класс модели списка QAbstractListModel, класс прямоугольника QRect, класса для работы с таймером QTimer,
-класс сигнала Signal.
+класс сигнала Signal, класс потока QThread для определения количества ядер процессора.
 Qt - содержит различные идентификаторы, используемые в библиотеке Qt
 Импорт из модуля PySide6.QtGui класс для установки размера пера (толщины линии)
 и цвета для рисования QPen, класс объекта цветов QColor, класса кисти QBrush для закрашивания.
 Другие виджеты можно найти по ссылке https://doc.qt.io/qt-5/widget-classes.html#basic-widget-classes
 """
 
+STATUS_QUEUED = 'queued'  # состояние задания, ожидающего запуска в очереди менеджера
+
 STATUS_COLORS = {  # словарь цветов для обозначения состояний
+    STATUS_QUEUED: '#cccccc',
     QProcess.NotRunning: '#b2df8a',
     QProcess.Starting: '#fbdf6f',
     QProcess.Running: '#33a02c'
 }
 
 STATES = {  # словарь состояний процессов
+    STATUS_QUEUED: "Queued",
     QProcess.NotRunning: "Not running",
     QProcess.Starting: "Starting...",
     QProcess.Running: "Running..."
@@ -61,13 +76,16 @@ STATES = {  # словарь состояний процессов
 
 DEFAULT_STATE = {'progress': 0, 'status': QProcess.Starting}  # статус по умолчанию
 
+POOL_WORKER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pool_worker.py')  # скрипт интерпретатора
+JOB_DONE_MARKER = '\x1ejob-done'  # маркер завершения задания в выводе интерпретатора (см. pool_worker.py)
+
 progress_re = re.compile('Total complete: (\d+)%', re.M)
 
 
 def simple_percent_parser(output: str) -> int:
     """
     Функция парсер для извлечения значения процента выполнения из строки статуса
-    :param output:
+    :param output: строка вывода рабочего процесса
     """
     m = progress_re.search(output)  # поиск в строке статуса процента выполнения
     if m:
@@ -89,12 +107,65 @@ def extract_vars(l):
     return data
 
 
+class LineBuffer:
+    """
+    Класс буфера строк для одного потока вывода процесса.
+    Байты декодируются инкрементальным декодером, поэтому символ UTF-8, разрезанный между порциями
+    данных, собирается правильно. Неполная последняя строка хранится частями до прихода ее окончания,
+    поэтому каждая порция просматривается один раз, сколько бы ни продолжалась строка без перевода строки
+    """
+
+    def __init__(self) -> None:
+        """
+        Конструктор буфера строк
+        """
+        self._decoder = codecs.getincrementaldecoder('utf8')(errors='replace')  # создание декодера
+        self._tail = []  # части неполной последней строки
+
+    def feed(self, data: bytes) -> list:
+        """
+        Метод добавления порции данных
+        :param data: байты, прочитанные из процесса
+        :return: список полных строк без символов перевода строки
+        """
+        if not data:
+            return []
+        text = self._decoder.decode(data)
+        if '\n' not in text:  # продолжение неполной строки
+            if text:
+                self._tail.append(text)
+            return []
+        lines = text.split('\n')  # разбиение на строки только новой порции
+        if self._tail:
+            self._tail.append(lines[0])
+            lines[0] = ''.join(self._tail)  # первая строка порции завершает неполную строку
+        tail = lines.pop()  # последний элемент - неполная строка (или пустая строка)
+        self._tail = [tail] if tail else []
+        return lines
+
+    def flush(self) -> list:
+        """
+        Метод получения остатка буфера при завершении процесса
+        :return: список из последней неполной строки или пустой список
+        """
+        tail = ''.join(self._tail) + self._decoder.decode(b'', final=True)
+        self._tail = []
+        return [tail] if tail else []
+
+
 class JobManager(QAbstractListModel):
     """
     Класс менеджера внешних процессов для обработки активных процессов, вывода результатов и ошибок,
-    а также результатов работы парсера прогресса
+    а также результатов работы парсера прогресса.
+    Одновременно выполняется не более max_processes процессов, остальные задания ждут в очереди.
+    В режиме пула (pooled=True) задания выполняются долгоживущими интерпретаторами pool_worker.py,
+    которые получают задания через стандартный ввод, поэтому запуск Python не повторяется для каждого задания.
+    Задания одного интерпретатора не изолированы друг от друга: состояние модулей, sys.modules и другие
+    глобальные данные интерпретатора сохраняются между заданиями. Режим пула подходит только для скриптов,
+    которые не зависят от такого состояния, по умолчанию каждое задание выполняется отдельным процессом
     """
-    _jobs = {}  # создаем словарь для хранения ссылок на внешние рабочие процессы
+    _jobs = {}  # создаем словарь для хранения ссылок на выполняющиеся внешние рабочие процессы
+    # (в режиме пула - ссылок на интерпретаторы, выполняющие задания)
     _state = {}  # создаем словарь для хранения состояний рабочих процессов
     _parsers = {}  # создаем словарь для хранения имен функций парсеров
 
@@ -102,11 +173,23 @@ class JobManager(QAbstractListModel):
     result = Signal(str, object)  # создание сигнала рабочего процесса с результатами его работы
     progress = Signal(str, int)  # создание сигнала рабочего процесса с прогрессом выполнения
 
-    def __init__(self) -> None:
+    def __init__(self, max_processes: int = 0, pooled: bool = False) -> None:
         """
         Конструктор менеджера внешних рабочих процессов
+        :param max_processes: максимальное количество одновременно выполняющихся процессов,
+                              0 - по количеству ядер процессора
+        :param pooled: режим пула долгоживущих интерпретаторов
         """
         QAbstractListModel.__init__(self)  # явный вызов конструктора родительского класса
+        self.max_processes = max_processes or QThread.idealThreadCount()  # ограничение количества процессов
+        self.pooled = pooled  # сохранение режима работы
+        self._queue = deque()  # создание очереди заданий вида (идентификатор, команда, аргументы)
+        self._interpreters = []  # создание списка интерпретаторов пула
+        self._idle = deque()  # создание очереди свободных интерпретаторов пула
+        self._assigned = {}  # создание словаря заданий, выполняемых интерпретаторами {интерпретатор: идентификатор}
+        self._buffers = {}  # создание словаря буферов строк интерпретаторов {интерпретатор: LineBuffer}
+        self._job_buffers = {}  # создание словаря буферов строк отдельных процессов
+        # {идентификатор: (LineBuffer потока ошибок, LineBuffer потока вывода)}
         self.status_timer = QTimer()  # создание таймера опроса статусов рабочих процессов
         self.status_timer.setInterval(100)  # установка длительности таймера
         self.status_timer.timeout.connect(self.notify_status)  # создание сигнала на истечение времени таймера
@@ -120,20 +203,49 @@ class JobManager(QAbstractListModel):
         Метод ресивер для сигнала об истечении таймера опроса статусов рабочих процессов
         :return: None
         """
-        n_jobs = len(self._jobs)  # определение количества рабочих процессов
-        self.status.emit(f'{n_jobs} jobs')  # передача данных о количестве рабочих процессов
+        n_jobs = len(self._jobs)  # определение количества выполняющихся рабочих процессов
+        n_queued = len(self._queue)  # определение количества заданий в очереди
+        self.status.emit(f'{n_jobs} jobs, {n_queued} queued, {self.max_processes} max')  # передача данных
         # сигналу на отображение количества рабочих процессов
 
     def execute(self, command: str, arguments: list, parsers=None) -> None:
         """
-        Метод для запуска рабочих процессов
+        Метод для постановки рабочих процессов в очередь на запуск
         :param command: команда запуска интерпретатора python
-        :param arguments: список файлов с кодом для исполнения
+        :param arguments: список файлов с кодом для исполнения (в режиме пула - скрипт и его аргументы)
         :param parsers: список парсеров, каждый парсер представляется в виде кортежа
                         (имя_функции, "наименование_сигнала")
         :return: None
         """
         job_id = uuid.uuid4().hex  # создание уникального идентификатора для внешнего процесса
+        self._parsers[job_id] = parsers or []  # сохранение списка парсеров в словаре под ключом идентификатора процесса
+        self._state[job_id] = DEFAULT_STATE.copy()  # сохранение состояния по умолчанию в словаре состояний под ключом
+        # идентификатора процесса
+        self._state[job_id]['status'] = STATUS_QUEUED  # задание ожидает в очереди
+        self._queue.append((job_id, command, arguments))  # постановка задания в очередь
+        self.layoutChanged.emit()  # передача данных для сигнала на обновление отображения модели
+        self.start_queued()  # запуск заданий, если есть свободные места
+
+    def start_queued(self) -> None:
+        """
+        Метод для запуска заданий из очереди, пока количество выполняющихся процессов меньше ограничения
+        :return: None
+        """
+        while self._queue and len(self._jobs) < self.max_processes:
+            job_id, command, arguments = self._queue.popleft()  # извлечение первого задания из очереди
+            if self.pooled:
+                self.run_in_pool(job_id, command, arguments)
+            else:
+                self.start_process(job_id, command, arguments)
+
+    def start_process(self, job_id: str, command: str, arguments: list) -> None:
+        """
+        Метод для запуска задания в отдельном внешнем процессе
+        :param job_id: идентификатор задания
+        :param command: команда запуска интерпретатора python
+        :param arguments: список файлов с кодом для исполнения
+        :return: None
+        """
 
         def fwd_signal(target):
             """
@@ -146,9 +258,6 @@ class JobManager(QAbstractListModel):
             """
             return lambda *args: target(job_id, *args)  # возвращение подписанного обработчика через анонимную функцию
 
-        self._parsers[job_id] = parsers or []  # сохранение списка парсеров в словаре под ключом идентификатора процесса
-        self._state[job_id] = DEFAULT_STATE.copy()  # сохранение состояния по умолчанию в словаре состояний под ключом
-        # идентификатора процесса
         p = QProcess()  # создание объекта рабочего процесса
         p.readyReadStandardOutput.connect(fwd_signal(self.handle_output))  # создание сигнала стандартного вывода
         # результата с привязкой обработчика, который подписывается идентификатором процесса
@@ -159,27 +268,147 @@ class JobManager(QAbstractListModel):
         p.finished.connect(fwd_signal(self.done))  # создание сигнала на завершение выполнения рабочего процесса
         # с привязкой обработчика, который подписывается идентификатором процесса
         self._jobs[job_id] = p  # сохранение ссылки на рабочий процесс в словаре под ключом идентификатора процесса
+        self._job_buffers[job_id] = (LineBuffer(), LineBuffer())  # создание буферов строк потоков ошибок и вывода
         p.start(command, arguments)  # запуск рабочего процесса на выполнение
+
+    def start_interpreter(self, command: str) -> QProcess:
+        """
+        Метод для запуска нового долгоживущего интерпретатора пула.
+        Стандартные потоки вывода и ошибок объединяются, чтобы вывод задания приходил до маркера его завершения
+        :param command: команда запуска интерпретатора python
+        :return: процесс интерпретатора
+        """
+        p = QProcess()  # создание объекта процесса интерпретатора
+        p.setProcessChannelMode(QProcess.MergedChannels)  # объединение потоков вывода и ошибок
+        p.readyReadStandardOutput.connect(lambda: self.handle_pool_output(p))  # привязка обработчика вывода
+        p.finished.connect(lambda *args: self.interpreter_finished(p))  # привязка обработчика завершения
+        self._interpreters.append(p)  # сохранение ссылки на интерпретатор
+        self._buffers[p] = LineBuffer()  # создание буфера строк вывода интерпретатора
+        p.start(command, [POOL_WORKER])  # запуск интерпретатора
+        return p
+
+    def run_in_pool(self, job_id: str, command: str, arguments: list) -> None:
+        """
+        Метод для передачи задания свободному интерпретатору пула (при необходимости запускается новый)
+        :param job_id: идентификатор задания
+        :param command: команда запуска интерпретатора python
+        :param arguments: скрипт и его аргументы
+        :return: None
+        """
+        p = self._idle.popleft() if self._idle else self.start_interpreter(command)  # выбор интерпретатора
+        self._assigned[p] = job_id  # закрепление задания за интерпретатором
+        self._jobs[job_id] = p  # сохранение ссылки на интерпретатор, выполняющий задание
+        self._state[job_id]['status'] = QProcess.Running  # задание выполняется
+        p.write((json.dumps([arguments[0], arguments[1:]]) + '\n').encode('utf8'))  # передача задания через
+        # стандартный ввод, QProcess буферизует запись, если интерпретатор еще запускается
+        self.layoutChanged.emit()  # передача данных для сигнала на обновление отображения модели
+
+    def handle_pool_output(self, p: QProcess) -> None:
+        """
+        Метод ресивер - обработчик вывода интерпретатора пула.
+        Полные строки до маркера завершения передаются парсерам текущего задания, маркер завершает задание
+        :param p: процесс интерпретатора
+        :return: None
+        """
+        lines = []  # строки текущего задания, накопленные до маркера
+        for line in self._buffers[p].feed(bytes(p.readAllStandardOutput())):  # цикл по полным строкам вывода
+            i = line.find(JOB_DONE_MARKER)  # поиск маркера завершения задания
+            if i == -1:
+                lines.append(line)
+                continue
+            if i > 0:  # последняя строка задания без перевода строки перед маркером
+                lines.append(line[:i])
+            job_id = self._assigned.get(p)  # задание, выполняемое интерпретатором
+            if job_id is not None:
+                self.parse_output(job_id, lines)  # передача парсерам всех строк задания одним вызовом
+            lines = []
+            self.pool_job_done(p)
+        job_id = self._assigned.get(p)
+        if lines and job_id is not None:  # строки задания, которое еще выполняется
+            self.parse_output(job_id, lines)
+
+    def pool_job_done(self, p: QProcess) -> None:
+        """
+        Метод обработки завершения задания в интерпретаторе пула - интерпретатор возвращается в число свободных
+        :param p: процесс интерпретатора
+        :return: None
+        """
+        job_id = self._assigned.pop(p)  # снятие задания с интерпретатора
+        del self._jobs[job_id]  # удаление задания из словаря выполняющихся
+        self._state[job_id]['status'] = QProcess.NotRunning  # задание завершено
+        if p in self._interpreters:  # завершившийся интерпретатор не получает новых заданий
+            self._idle.append(p)  # интерпретатор свободен для следующего задания
         self.layoutChanged.emit()  # передача данных для сигнала на обновление отображения модели
+        self.start_queued()  # запуск следующего задания из очереди
+
+    def interpreter_finished(self, p: QProcess) -> None:
+        """
+        Метод обработки завершения процесса интерпретатора (при остановке пула или аварийно).
+        Выполнявшееся задание считается завершенным, вместо интерпретатора при необходимости запускается новый
+        :param p: процесс интерпретатора
+        :return: None
+        """
+        self._interpreters.remove(p)  # удаление интерпретатора из пула
+        if p in self._idle:
+            self._idle.remove(p)
+        self.handle_pool_output(p)  # обработка вывода, полученного после последнего сигнала
+        tail = self._buffers.pop(p).flush()  # последняя строка без перевода строки
+        job_id = self._assigned.pop(p, None)  # задание, выполнявшееся интерпретатором
+        if job_id is not None:
+            if tail:
+                self.parse_output(job_id, tail)  # передача последней строки парсерам задания
+            del self._jobs[job_id]
+            self._state[job_id]['status'] = QProcess.NotRunning
+            self.layoutChanged.emit()  # передача данных для сигнала на обновление отображения модели
+        self.start_queued()  # задания из очереди будут запущены новым интерпретатором
+
+    def shutdown(self) -> None:
+        """
+        Метод остановки менеджера - очистка очереди и закрытие стандартного ввода интерпретаторов пула,
+        по которому они завершают работу
+        :return: None
+        """
+        self._queue.clear()  # задания из очереди больше не запускаются
+        for p in list(self._interpreters):
+            p.closeWriteChannel()  # закрытие стандартного ввода интерпретатора
+            p.waitForFinished(1000)  # ожидание завершения интерпретатора
 
     def handle_output(self, job_id: str) -> None:
         """
-        Метод ресивер - обработчика стандартного вывода из рабочего процесса
+        Метод ресивер - обработчика стандартного вывода из рабочего процесса.
+        Каждый поток вывода проходит через свой буфер строк, парсерам передаются только полные строки
         :param job_id: идентификатор рабочего процесса
         :return: None
         """
         p = self._jobs[job_id]  # извлечение ссылки на рабочий процесс из словаря по его идентификатору
-        stderr = bytes(p.readAllStandardError()).decode('utf8')  # извлечение и декодирования текста ошибки
-        # из рабочего процесса
-        stdout = bytes(p.readAllStandardOutput()).decode('utf8')  # извлечение и декодирование текста вывода
-        # из рабочего процесса
-        output = stderr + stdout  # сборка полного вывода
+        stderr, stdout = self._job_buffers[job_id]  # извлечение буферов строк потоков ошибок и вывода
+        lines = stderr.feed(bytes(p.readAllStandardError()))  # полные строки из потока ошибок
+        lines += stdout.feed(bytes(p.readAllStandardOutput()))  # полные строки из потока вывода
+        self.parse_output(job_id, lines)
+
+    def parse_output(self, job_id: str, lines: list) -> None:
+        """
+        Метод передачи строк вывода рабочего процесса парсерам и передачи результатов их работы сигналам.
+        Каждая строка передается каждому парсеру ровно один раз. Прогресс - это состояние, поэтому
+        сигналу progress передается только последнее значение из порции строк
+        :param job_id: идентификатор рабочего процесса
+        :param lines: список полных строк вывода рабочего процесса
+        :return: None
+        """
         parsers = self._parsers.get(job_id)  # извлечение списка парсеров по идентификатору рабочего процесса
         for parser, signal_name in parsers:  # цикл по списку парсеров для использования одного за проход
-            result = parser(output)  # использование парсера на выводе и сохранение результата в переменной
-            if result:  # если результаты есть
-                signal = getattr(self, signal_name)  # извлечение имени сигнала из объекта менеджера процессов
-                signal.emit(job_id, result)  # передача данных для сигнала из списка сигналов по его имени
+            signal = getattr(self, signal_name)  # извлечение сигнала по имени из объекта менеджера процессов
+            latest = None  # последнее значение прогресса в порции строк
+            for line in lines:
+                result = parser(line)  # использование парсера на строке и сохранение результата в переменной
+                if not result:  # если результатов нет
+                    continue
+                if signal_name == 'progress':
+                    latest = result
+                else:
+                    signal.emit(job_id, result)  # передача данных для сигнала из списка сигналов по его имени
+            if latest is not None:
+                signal.emit(job_id, latest)
 
     def handle_progress(self, job_id: str, progress: int | str) -> None:
         """
@@ -209,8 +438,13 @@ class JobManager(QAbstractListModel):
         :param exit_status: состояние выхода
         :return: None
         """
+        self.handle_output(job_id)  # обработка вывода, полученного после последнего сигнала readyRead
+        stderr, stdout = self._job_buffers.pop(job_id)  # удаление буферов строк процесса
+        self.parse_output(job_id, stderr.flush() + stdout.flush())  # передача парсерам последних строк
+        # без перевода строки в конце
         del self._jobs[job_id]  # удаление рабочего процесса из словаря с ссылками по завершении выполнения
         self.layoutChanged.emit()  # передача данных для сигнала на обновление отображения модели
+        self.start_queued()  # запуск следующего задания из очереди
 
     def cleanup(self) -> None:
         """
@@ -281,7 +515,7 @@ class MainWindow(QMainWindow):
         Конструктор главного окна приложения
         """
         QMainWindow.__init__(self)  # явный вызов конструктора родительского класса
-        self.job = JobManager()  # создание экземпляра менеджера рабочих процессов
+        self.job = JobManager()  # создание экземпляра менеджера рабочих процессов (процесс на задание)
         self.job.status.connect(self.statusBar().showMessage)  # создание сигнала на вывод состояния рабочих процессов
         # в строку статуса главного окна приложения
         self.job.result.connect(self.display_result)  # создание сигнала результата с привязкой метода ресивера
@@ -291,14 +525,16 @@ class MainWindow(QMainWindow):
         delegate = ProgressBarDelegate()  # создание экземпляра класса индикатора прогресса
         self.progress.setItemDelegate(delegate)  # подключение делегата к модели
         layout.addWidget(self.progress)  # размещение представления в слое для виджетов
-        self.text = QPlainTextEdit()  # создание текстового многострочного поля
-        self.text.setReadOnly(True)  # установка поля в состояние только для чтения
+        self.text = LogConsole()  # создание журнала, добавляющего строки в текстовое поле пакетами раз в кадр
         button = QPushButton("Run a command")  # создание кнопки на запуск команды
         button.pressed.connect(self.run_command)  # создание сигнала на нажатие кнопки с привязкой ресивера
+        button_many = QPushButton("Run 50 commands")  # создание кнопки на запуск множества команд
+        button_many.pressed.connect(self.run_many_commands)  # создание сигнала на нажатие кнопки с привязкой ресивера
         clear = QPushButton("Clear")  # создание кнопки на очистку
         clear.pressed.connect(self.job.cleanup)  # создание сигнала на очистку с привязкой ресивера
         layout.addWidget(self.text)  # размещение текстового поля в слое для виджетов
         layout.addWidget(button)  # размещение кнопки в слое для виджетов
+        layout.addWidget(button_many)  # размещение кнопки в слое для виджетов
         layout.addWidget(clear)  # размещение кнопки в слое для виджетов
         w = QWidget()  # создание контейнера для слоев
         w.setLayout(layout)  # размещение слоя в контейнере
@@ -318,6 +554,23 @@ class MainWindow(QMainWindow):
             ],
         )
 
+    def run_many_commands(self) -> None:
+        """
+        Метод ресивер на постановку в очередь 50 команд, одновременно выполняется не более max_processes
+        :return: None
+        """
+        for _ in range(50):
+            self.run_command()
+
+    def closeEvent(self, event) -> None:
+        """
+        Метод обработки закрытия окна - остановка интерпретаторов пула
+        :param event: событие закрытия окна
+        :return: None
+        """
+        self.job.shutdown()
+        QMainWindow.closeEvent(self, event)
+
     def display_result(self, job_id: str, data: dict) -> None:
         """
         Метод ресивер на отображение результатов работы рабочего процесса
@@ -325,7 +578,66 @@ class MainWindow(QMainWindow):
         :param data:
         :return: None
         """
-        self.text.appendPlainText(f"WORKER {job_id}: {data}")
+        self.text.append_line(f"WORKER {job_id}: {data}")  # результаты всех процессов, полученные за кадр,
+        # записываются в текстовое поле одной правкой
+
+
+VERBOSE_SCRIPT = """
+import sys
+lines = []
+for i in range({n}):
+    lines.append(f'Total complete: {{i % 100}}%\\n' if i % 2 else f'name=Мартин{{i}} country=Nederland\\n')
+data = ''.join(lines).encode('utf8')
+for k in range(0, len(data), 4093):  # порции нечетного размера разрезают строки и символы UTF-8
+    sys.stdout.buffer.write(data[k:k + 4093])
+    sys.stdout.buffer.flush()
+"""
+
+
+def benchmark() -> None:
+    """
+    Функция замера пропускной способности разбора вывода процессов.
+    Запуск: python 23_qprocess_manager.py --benchmark
+    Процесс в стиле dummy_script.py пишет несколько мегабайт строк порциями, которые разрезают строки
+    и многобайтовые символы. Проверяется, что каждая строка с результатами передана ровно один раз
+    и последнее значение прогресса не потеряно (промежуточные значения прогресса объединяются)
+    :return: None
+    """
+    app = QApplication.instance() or QApplication(sys.argv)  # приложение нужно для цикла событий
+    n = 200_000  # количество строк вывода
+    with tempfile.NamedTemporaryFile('w', suffix='.py', delete=False, encoding='utf8') as f:
+        f.write(VERBOSE_SCRIPT.format(n=n))  # сохранение скрипта во временный файл
+    size = len(''.join(f'Total complete: {i % 100}%\n' if i % 2 else f'name=Мартин{i} country=Nederland\n'
+                       for i in range(n)).encode('utf8')) / 2 ** 20  # объем вывода в мегабайтах
+    print(f'{"mode":>8} {"MB":>6} {"MB/s":>7} {"progress":>9} {"results":>8}')
+    for pooled in (False, True):
+        manager = JobManager(max_processes=1, pooled=pooled)  # менеджер с одним процессом
+        counts = {'progress': 0, 'result': 0}  # счетчики сигналов парсеров
+        last = {'progress': 0}  # последнее полученное значение прогресса
+        valid = []  # признак правильного декодирования кириллицы
+
+        def on_result(job_id: str, data: dict) -> None:
+            counts['result'] += 1
+            valid.append(data['name'].startswith('Мартин'))
+
+        def on_progress(job_id: str, progress: int) -> None:
+            counts['progress'] += 1
+            last['progress'] = progress
+
+        manager.progress.connect(on_progress)
+        manager.result.connect(on_result)
+        start = time.perf_counter()
+        manager.execute(sys.executable, [f.name], parsers=[(simple_percent_parser, 'progress'),
+                                                           (extract_vars, 'result')])
+        while manager._jobs or manager._queue:  # обработка событий до завершения задания
+            app.processEvents()
+            QThread.msleep(1)
+        elapsed = time.perf_counter() - start
+        manager.shutdown()
+        ok = last['progress'] == 99 and counts['result'] == n - n // 2 and all(valid)
+        print(f'{"pooled" if pooled else "process":>8} {size:>6.1f} {size / elapsed:>7.1f} '
+              f'{counts["progress"]:>9} {counts["result"]:>8} {"ok" if ok else "MISMATCH"}')
+    os.remove(f.name)  # удаление временного файла
 
 
 def main() -> None:
@@ -342,4 +654,7 @@ def main() -> None:
 
 if __name__ == '__main__':  # данная конструкция предотвращает запуск кода верхнего уровня
     # при импортировании данного файла как модуля
-    main()  # вызов функции запуска кода верхнего уровня приложения
+    if '--benchmark' in sys.argv:  # запуск замера производительности вместо приложения
+        benchmark()
+    else:
+        main()  # вызов функции запуска кода верхнего уровня приложения
@@ -0,0 +1,128 @@
+"""
+Пример обработки ответов на запросы к удаленному серверу с помощью цикла событий asyncio
+(вариант примера 13_qrunner_io.py).
+В примере 13_qrunner_io.py каждый адрес загружается отдельным рабочим потоком QRunnable вызовом requests.get():
+каждый запрос заново устанавливает соединение и занимает поток пула на все время ожидания ответа.
+Здесь запросы выполняет загрузчик FetchEngine (модуль async_fetch): все запросы выполняются в одном фоновом
+потоке с циклом событий asyncio через общие открытые соединения с ограничением количества соединений
+с одним сервером, тайм-аутами и повторами. Результат передается сигналом data объекта сигналов, как и в
+примере 13_qrunner_io.py, и выводится в журнал LogConsole.
+"""
+import sys
+
+from PySide6.QtWidgets import (QApplication,
+                               QLabel,
+                               QVBoxLayout,
+                               QMainWindow,
+                               QPushButton,
+                               QWidget,
+                               )
+from PySide6.QtCore import Signal, QObject
+
+from async_fetch import FetchEngine  # импорт класса загрузчика страниц в цикле событий asyncio
+from log_console import LogConsole  # импорт класса журнала с пакетным добавлением строк
+
+"""
+Модуль sys нужен для доступа к аргументам командной строки. Если использование аргументов
+командной строки не предполагается, то импорт можно не выполнять. При этом, при создании
+приложения в класс QApplication([]) в качестве аргумента передается пустой список.
+Импорт из модуля PySide6.QtWidgets класса для управления приложением QApplication и класса слоев
+для виджетов с вертикальной организацией QVBoxLayout, класса виджета кнопки QPushButton,
+класс однострочного текстового поля ярлыка QLabel, класса базового виджета QWidget.
+Импорт из модуля PySide6.QtCore класса сигнала Signal, класса базового объекта QObject.
+Другие виджеты можно найти по ссылке https://doc.qt.io/qt-5/widget-classes.html#basic-widget-classes
+"""
+
+
+class WorkerSignals(QObject):
+    """
+    Класс сигналов рабочего потока, определяющий набор сигналов
+    data - кортеж данных вида (идентификатор, список строк ответа)
+    """
+    data = Signal(tuple)
+
+
+class MainWindow(QMainWindow):
+    """
+    Подкласс главного окна приложения от супер класса главных окон
+    """
+
+    def __init__(self) -> None:
+        """
+        Конструктор главного окна приложения
+        """
+        QMainWindow.__init__(self)  # явный вызов конструктора родительского класса
+        self.urls = [  # сохранение списка запросов в аттрибуте главного окна приложения
+            "https://www.pythonguis.com/",
+            "https://www.mfitzp.com/",
+            "https://www.google.com",
+            "https://www.udemy.com/create-simple-gui-applicationswith-python-and-qt / ",
+        ]
+        layout = QVBoxLayout()  # создание экземпляра слоев для размещения виджетов
+        self.text = LogConsole()  # создание журнала, добавляющего строки в текстовое поле пакетами раз в кадр
+        button = QPushButton('Послать запрос')  # создание кнопки с надписью
+        button.pressed.connect(self.execute)  # создание сигнала на нажатие кнопки с привязкой метода ресивера
+        layout.addWidget(self.text)  # размещение текстового поля в слое для виджетов
+        layout.addWidget(button)  # размещение кнопки в слое для виджетов
+        container = QWidget()  # создание контейнера для слоев с виджетами
+        container.setLayout(layout)  # размещение в контейнере слоя для виджетов
+        self.setCentralWidget(container)  # размещение контейнера в главном окне приложения
+        self.fetcher = FetchEngine(self)  # создание загрузчика с фоновым потоком и общими соединениями
+        self.fetcher.failed.connect(self.display_error)  # создание сигнала ошибки запроса с привязкой ресивера
+        self.signals = WorkerSignals()  # создание объекта сигналов, общего для всех запросов
+        self.signals.data.connect(self.display_output)  # создание сигнала на получение ответа
+        # от сервера и привязка метода ресивера для отображения ответа сервера
+
+    def execute(self) -> None:
+        """
+        Метод ресивер (слот) на нажатие кнопки, передающий запросы удаленным серверам загрузчику
+        :return: None
+        """
+        for n, url in enumerate(self.urls):  # цикл постановки запросов в очередь загрузчика
+            self.fetcher.fetch(n, url, self.signals, str.splitlines)  # ответ будет разбит на строки
+            # в фоновом потоке и передан сигналом data одним кортежем
+
+    def display_output(self, data: tuple) -> None:
+        """
+        Метод ресивер (слот) принимающий сигнал о поступлении ответа от сервера и выводящий его в текстовое поле
+        :param data: tuple - данные ответа от сервера для отображения
+        :return: None
+        """
+        id, lines = data
+        self.text.append_lines([f'WORKER {id}: {s}' for s in lines])  # строки будут добавлены в текстовое поле
+        # одной правкой вместе со строками других рабочих потоков
+
+    def display_error(self, id: int, url: str, message: str) -> None:
+        """
+        Метод ресивер (слот) принимающий сигнал об ошибке запроса и выводящий ее в текстовое поле
+        :param id: идентификатор запроса
+        :param url: адрес запроса
+        :param message: текст ошибки
+        :return: None
+        """
+        self.text.append_line(f'WORKER {id}: {url} - {message}')
+
+    def closeEvent(self, event) -> None:
+        """
+        Метод обработки закрытия окна - закрытие соединений и остановка фонового потока загрузчика
+        :param event: событие закрытия окна
+        :return: None
+        """
+        self.fetcher.close()
+        QMainWindow.closeEvent(self, event)
+
+
+def main() -> None:
+    """
+    Функция запуска кода приложения верхнего уровня
+    :return: None
+    """
+    app = QApplication(sys.argv)  # создание экземпляра класса основного цикла событий приложения
+    window = MainWindow()  # создание экземпляра класса главного окна приложения
+    window.show()  # установка видимости главного окна (по умолчанию окно спрятано)
+    app.exec()  # запуск основного цикла событий приложения
+
+
+if __name__ == '__main__':  # данная конструкция предотвращает запуск кода верхнего уровня
+    # при импортировании данного файла как модуля
+    main()  # вызов функции запуска кода верхнего уровня приложения
@@ -0,0 +1,431 @@
+"""
+Модуль загрузки страниц по HTTP в цикле событий asyncio (используется примерами 24_async_fetch.py
+и 25_async_fetch_parser.py).
+В примерах с QRunnable каждый рабочий поток вызывает requests.get(): для каждого адреса заново устанавливается
+соединение TCP (и TLS), а поток пула занят все время ожидания ответа. Класс FetchEngine:
+♦ выполняет все запросы в одном фоновом потоке с циклом событий asyncio - ожидание ответов не занимает потоки;
+♦ хранит открытые соединения (keep-alive) и использует их для следующих запросов к тому же серверу;
+♦ ограничивает количество одновременных запросов к одному серверу, ограничивает время запроса и повторяет
+  запрос после ошибки соединения, истечения времени или ответа 502, 503, 504;
+♦ передает результат в основной поток сигналом data объекта сигналов рабочего потока - кортежем
+  (идентификатор, данные), как рабочие потоки примеров. Ошибки передаются сигналом failed;
+♦ может передавать текст ответа получателю по частям и прекратить загрузку, когда получателю достаточно
+  полученного текста (см. модуль html_fields).
+Клиент HTTP/1.1 написан на потоках asyncio из стандартной библиотеки (поддерживаются Content-Length,
+chunked, gzip/deflate и перенаправления), дополнительные пакеты не нужны.
+Запуск модуля как скрипта выполняет сравнение с requests.get() в пуле потоков на локальном сервере:
+python async_fetch.py
+"""
+import asyncio
+import codecs
+import re
+import ssl
+import sys
+import threading
+import time
+import zlib
+from collections import defaultdict
+from urllib.parse import quote, urljoin, urlsplit
+
+from PySide6.QtCore import QObject, Signal
+
+"""
+Модуль asyncio для цикла событий и сетевых потоков, модуль zlib для распаковки ответов, модуль codecs для
+декодирования ответов по частям, модуль re для
+извлечения кодировки из заголовка, модуль ssl для соединений HTTPS, модуль threading для фонового потока цикла
+событий, функции quote, urljoin и urlsplit из модуля urllib.parse для разбора адресов.
+Класс словаря со значениями по умолчанию defaultdict из модуля collections для соединений и ограничений по серверам.
+Модули sys и time для замера производительности.
+Импорт из модуля PySide6.QtCore базового класса объектов Qt QObject и класса сигналов Signal.
+"""
+
+PER_HOST = 6  # наибольшее количество одновременных запросов (и открытых соединений) к одному серверу
+TIMEOUT = 15.0  # наибольшее время одного запроса в секундах
+RETRIES = 2  # количество повторов запроса после ошибки
+BACKOFF = 0.25  # пауза перед первым повтором в секундах, удваивается с каждым повтором
+MAX_REDIRECTS = 5  # наибольшее количество перенаправлений
+RETRY_STATUSES = {502, 503, 504}  # ответы сервера, после которых запрос повторяется
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+USER_AGENT = 'PySide6-examples/1.0'
+URL_SAFE = "/%:@!$&'()*+,;=~"  # символы адреса, которые не кодируются
+READ_SIZE = 65536  # наибольший размер части тела ответа в байтах
+
+charset_re = re.compile(r'charset=["\']?([\w-]+)', re.I)
+
+
+class HTTPError(Exception):
+    """
+    Класс исключения ответа сервера, который нельзя обработать (повторяемый код ответа после всех повторов,
+    слишком много перенаправлений, нарушение протокола)
+    """
+
+
+class TextDecoder:
+    """
+    Класс распаковки (gzip, deflate) и декодирования тела ответа по частям. Многобайтовый символ, разрезанный
+    между частями, декодируется после получения следующей части
+    """
+
+    def __init__(self, headers: dict) -> None:
+        """
+        Конструктор декодера
+        :param headers: заголовки ответа
+        """
+        encoding = headers.get('content-encoding', '').lower()
+        if encoding == 'gzip':
+            self._inflate = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == 'deflate':
+            self._inflate = zlib.decompressobj()
+        else:
+            self._inflate = None
+        m = charset_re.search(headers.get('content-type', ''))
+        try:
+            self._decoder = codecs.getincrementaldecoder(m.group(1) if m else 'utf-8')(errors='replace')
+        except LookupError:  # неизвестная кодировка
+            self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def decode(self, data: bytes, final: bool = False) -> str:
+        """
+        Метод распаковки и декодирования части тела ответа
+        :param data: часть тела ответа
+        :param final: признак последней части
+        :return: str - текст
+        """
+        if self._inflate is not None:
+            data = self._inflate.decompress(data) + (self._inflate.flush() if final else b'')
+        return self._decoder.decode(data, final)
+
+
+class FetchEngine(QObject):
+    """
+    Класс загрузки страниц в цикле событий asyncio, выполняемом в одном фоновом потоке
+    failed - сигнал ошибки: идентификатор, адрес и текст ошибки
+    """
+    failed = Signal(int, str, str)
+
+    def __init__(self, parent: QObject = None, per_host: int = PER_HOST, timeout: float = TIMEOUT,
+                 retries: int = RETRIES) -> None:
+        """
+        Конструктор загрузчика, запускающий фоновый поток с циклом событий
+        :param parent: родительский объект
+        :param per_host: наибольшее количество одновременных запросов к одному серверу
+        :param timeout: наибольшее время одного запроса в секундах
+        :param retries: количество повторов запроса после ошибки
+        """
+        QObject.__init__(self, parent)  # явный вызов конструктора родительского класса
+        self.per_host = per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.connections = 0  # количество установленных соединений (для замера производительности)
+        self.received = 0  # количество полученных байт тел ответов (для замера производительности)
+        self._idle = defaultdict(list)  # свободные соединения {(схема, сервер, порт): [(reader, writer), ...]}
+        self._limits = {}  # ограничения одновременных запросов {(схема, сервер, порт): asyncio.Semaphore}
+        self._ssl = None  # контекст TLS создается при первом запросе HTTPS
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def fetch(self, id: int, url: str, signals: QObject, parse=None, stream=None):
+        """
+        Метод постановки запроса в цикл событий, может вызываться из любого потока
+        :param id: идентификатор запроса
+        :param url: адрес страницы
+        :param signals: объект сигналов рабочего потока с сигналом data
+        :param parse: функция обработки текста страницы в фоновом потоке, результат передается вместо текста
+        :param stream: функция, создающая получателя текста ответа по частям (см. метод get()), результат
+        получателя передается вместо текста
+        :return: concurrent.futures.Future - результат запроса
+        """
+        return asyncio.run_coroutine_threadsafe(self._deliver(id, url, signals, parse, stream), self._loop)
+
+    def close(self) -> None:
+        """
+        Метод закрытия соединений и остановки фонового потока
+        :return: None
+        """
+        if not self._thread.is_alive():
+            return
+        asyncio.run_coroutine_threadsafe(self._close_all(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _deliver(self, id: int, url: str, signals: QObject, parse, stream) -> None:
+        """
+        Сопрограмма выполнения запроса и передачи результата сигналом
+        :param id: идентификатор запроса
+        :param url: адрес страницы
+        :param signals: объект сигналов рабочего потока
+        :param parse: функция обработки текста страницы или None
+        :param stream: функция, создающая получателя текста ответа по частям, или None
+        :return: None
+        """
+        try:
+            text = await self.get(url, stream)
+            signals.data.emit((id, parse(text) if parse else text))
+        except Exception as e:  # ошибка одного запроса не останавливает остальные
+            self.failed.emit(id, url, f'{type(e).__name__}: {e}' if str(e) else type(e).__name__)
+
+    async def get(self, url: str, stream=None):
+        """
+        Сопрограмма запроса GET с повторами и перенаправлениями.
+        Если задана функция stream, для каждой попытки запроса она создает получателя - объект с методами
+        feed(text) и result(). Текст ответа передается методу feed() по мере получения; если feed() вернул True,
+        остальная часть ответа не загружается (соединение закрывается)
+        :param url: адрес страницы
+        :param stream: функция, создающая получателя текста ответа, или None
+        :return: str - текст ответа или результат метода result() получателя
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            attempt = 0
+            while True:
+                try:
+                    status, headers, body = await self._request(url, stream() if stream else None)
+                    if status in RETRY_STATUSES:
+                        raise HTTPError(f'HTTP {status}')
+                    break
+                except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, HTTPError):
+                    if attempt >= self.retries:
+                        raise
+                    await asyncio.sleep(BACKOFF * 2 ** attempt)
+                    attempt += 1
+            if status in REDIRECT_STATUSES and 'location' in headers:
+                url = urljoin(url, headers['location'])
+                continue
+            return body.result() if stream else TextDecoder(headers).decode(body, final=True)
+        raise HTTPError(f'more than {MAX_REDIRECTS} redirects')
+
+    async def _request(self, url: str, sink=None) -> tuple:
+        """
+        Сопрограмма одного запроса GET с ограничением количества одновременных запросов к серверу
+        и времени запроса
+        :param url: адрес страницы
+        :param sink: получатель текста ответа по частям или None
+        :return: tuple - код ответа, словарь заголовков (имена в нижнем регистре), тело ответа или получатель
+        """
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        key = (parts.scheme, parts.hostname, port)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise HTTPError(f'unsupported URL {url!r}')
+        path = quote(parts.path or '/', safe=URL_SAFE) + (f'?{quote(parts.query, safe=URL_SAFE)}' if parts.query
+                                                          else '')  # пробелы и другие символы кодируются, как
+        # в requests
+        request = (f'GET {path} HTTP/1.1\r\nHost: {parts.netloc}\r\nUser-Agent: {USER_AGENT}\r\n'
+                   f'Accept-Encoding: gzip, deflate\r\nConnection: keep-alive\r\n\r\n').encode('ascii')
+        if key not in self._limits:
+            self._limits[key] = asyncio.Semaphore(self.per_host)
+        async with self._limits[key]:  # время ожидания в очереди к серверу не входит во время запроса
+            return await asyncio.wait_for(self._exchange(key, request, sink), self.timeout)
+
+    async def _exchange(self, key: tuple, request: bytes, sink=None) -> tuple:
+        """
+        Сопрограмма отправки запроса и чтения ответа через свободное или новое соединение. Если сервер закрыл
+        свободное соединение, запрос без повтора выполняется через новое соединение
+        :param key: схема, сервер, порт
+        :param request: запрос
+        :param sink: получатель текста ответа по частям или None
+        :return: tuple - код ответа, словарь заголовков (имена в нижнем регистре), тело ответа или получатель
+        """
+        while True:
+            reused = bool(self._idle[key])
+            reader, writer = self._idle[key].pop() if reused else await self._connect(key)
+            try:
+                writer.write(request)
+                await writer.drain()
+                status_line = await reader.readline()
+                if not status_line:
+                    raise ConnectionResetError('connection closed by server')
+                status, headers, keep = await self._read_head(status_line, reader)
+                chunks = self._read_body(reader, headers, status)
+                if sink is not None and status not in REDIRECT_STATUSES and status not in RETRY_STATUSES:
+                    body = sink
+                    decoder = TextDecoder(headers)
+                    async for chunk in chunks:
+                        if sink.feed(decoder.decode(chunk)):  # получателю не нужна остальная часть ответа
+                            await chunks.aclose()
+                            keep = False  # непрочитанная часть ответа осталась в соединении
+                            break
+                    else:
+                        sink.feed(decoder.decode(b'', final=True))
+                else:
+                    body = b''.join([chunk async for chunk in chunks])
+            except (OSError, asyncio.IncompleteReadError):
+                writer.close()
+                if reused:  # сервер закрыл соединение, пока оно было свободным
+                    continue
+                raise
+            except BaseException:  # отмена по времени - соединение в неизвестном состоянии
+                writer.close()
+                raise
+            if keep:
+                self._idle[key].append((reader, writer))
+            else:
+                writer.close()
+            return status, headers, body
+
+    async def _connect(self, key: tuple) -> tuple:
+        """
+        Сопрограмма установки нового соединения
+        :param key: схема, сервер, порт
+        :return: tuple - потоки чтения и записи
+        """
+        scheme, host, port = key
+        if scheme == 'https':
+            if self._ssl is None:
+                self._ssl = ssl.create_default_context()
+            connection = await asyncio.open_connection(host, port, ssl=self._ssl, server_hostname=host)
+        else:
+            connection = await asyncio.open_connection(host, port)
+        self.connections += 1
+        return connection
+
+    @staticmethod
+    async def _read_head(status_line: bytes, reader: asyncio.StreamReader) -> tuple:
+        """
+        Сопрограмма чтения заголовков ответа
+        :param status_line: строка состояния ответа
+        :param reader: поток чтения соединения
+        :return: tuple - код ответа, заголовки, признак возможности повторного использования соединения
+        """
+        version, status = status_line.split(None, 2)[:2]
+        status = int(status)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        keep = version == b'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+        if 'content-length' not in headers and headers.get('transfer-encoding', '').lower() != 'chunked' \
+                and not (status in (204, 304) or 100 <= status < 200):
+            keep = False  # тело до закрытия соединения
+        return status, headers, keep
+
+    async def _read_body(self, reader: asyncio.StreamReader, headers: dict, status: int):
+        """
+        Асинхронный генератор частей тела ответа по мере их получения
+        :param reader: поток чтения соединения
+        :param headers: заголовки ответа
+        :param status: код ответа
+        :return: bytes - часть тела ответа
+        """
+        if status in (204, 304) or 100 <= status < 200:
+            return
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            while True:
+                size = int((await reader.readline()).split(b';')[0], 16)
+                if not size:
+                    while (await reader.readline()) not in (b'\r\n', b'\n', b''):  # завершающие заголовки
+                        pass
+                    return
+                chunk = await reader.readexactly(size)
+                await reader.readexactly(2)  # \r\n после порции
+                self.received += len(chunk)
+                yield chunk
+        elif 'content-length' in headers:
+            remaining = int(headers['content-length'])
+            while remaining:
+                chunk = await reader.read(min(remaining, READ_SIZE))
+                if not chunk:
+                    raise asyncio.IncompleteReadError(b'', remaining)
+                remaining -= len(chunk)
+                self.received += len(chunk)
+                yield chunk
+        else:  # тело до закрытия соединения
+            while chunk := await reader.read(READ_SIZE):
+                self.received += len(chunk)
+                yield chunk
+
+    async def _close_all(self) -> None:
+        """
+        Сопрограмма отмены выполняющихся запросов и закрытия свободных соединений до остановки цикла событий
+        :return: None
+        """
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()  # запрос закрывает свое соединение при отмене
+        await asyncio.gather(*tasks, return_exceptions=True)
+        writers = [writer for connections in self._idle.values() for _, writer in connections]
+        self._idle.clear()
+        for writer in writers:
+            writer.close()
+        await asyncio.gather(*(writer.wait_closed() for writer in writers), return_exceptions=True)
+
+
+def benchmark(n: int = 2000) -> None:
+    """
+    Функция сравнения загрузки n адресов с локального сервера (с задержкой ответа 5 мсек): requests.get()
+    в рабочих потоках QThreadPool, как в примере 13_qrunner_io.py, и FetchEngine
+    :param n: количество адресов
+    :return: None
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    import requests
+    from PySide6.QtCore import QCoreApplication, QRunnable, QThreadPool
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # сервер поддерживает keep-alive
+        disable_nagle_algorithm = True  # заголовки и тело ответа отправляются без задержки
+        connections = 0
+
+        def setup(self) -> None:
+            BaseHTTPRequestHandler.setup(self)
+            Handler.connections += 1
+
+        def do_GET(self) -> None:
+            time.sleep(0.005)  # время обработки запроса сервером
+            body = f'<html><title>Page {self.path}</title><h1>Заголовок</h1></html>'.encode('utf8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    class Signals(QObject):
+        data = Signal(tuple)
+
+    class Worker(QRunnable):
+        def __init__(self, id: int, url: str, signals: Signals) -> None:
+            QRunnable.__init__(self)
+            self.id, self.url, self.signals = id, url, signals
+
+        def run(self) -> None:
+            self.signals.data.emit((self.id, requests.get(self.url).text))
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f'http://127.0.0.1:{server.server_port}/page/{i}' for i in range(n)]
+    pool = QThreadPool()
+    engine = FetchEngine()
+    for name in ('requests.get in QThreadPool', 'FetchEngine'):
+        signals = Signals()
+        received = []
+        signals.data.connect(received.append)
+        Handler.connections = 0
+        start = time.perf_counter()
+        for i, url in enumerate(urls):
+            if name == 'FetchEngine':
+                engine.fetch(i, url, signals)
+            else:
+                pool.start(Worker(i, url, signals))
+        while len(received) < n:
+            app.processEvents()
+            time.sleep(0.001)
+        elapsed = time.perf_counter() - start
+        assert sorted(i for i, _ in received) == list(range(n)) and all('Page /page/' in t for _, t in received)
+        print(f'{name:>28}: {n} URLs in {elapsed:.2f} s ({n / elapsed:,.0f} URLs/s), '
+              f'{Handler.connections} TCP connections, {pool.maxThreadCount() if name != "FetchEngine" else 1} '
+              f'threads')
+    engine.close()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    benchmark()
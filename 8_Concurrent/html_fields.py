@@ -0,0 +1,165 @@
+"""
+Модуль извлечения полей (текста первых элементов title, h1, h2 и т.п.) из страницы HTML по мере ее загрузки
+(используется примером 25_async_fetch_parser.py).
+Парсеры на регулярных выражениях ищут совпадения только в полностью загруженном тексте, и выражения вида
+<h2.*?>(.*?)</h2> с флагом re.S перебирают весь документ от каждого найденного начала элемента. Класс FieldExtractor
+получает текст частями от загрузчика FetchEngine (модуль async_fetch) и просматривает его один раз, находя теги
+по мере получения частей. Когда все поля найдены, метод feed() возвращает True и загрузчик закрывает
+соединение, не загружая остальную часть страницы.
+Запуск модуля как скрипта выполняет сравнение с загрузкой всей страницы и регулярными выражениями
+на локальном сервере: python html_fields.py
+"""
+import html
+import re
+import threading
+import time
+
+"""
+Модуль html для замены ссылок на символы (&amp; и т.п.), модуль re для поиска тегов.
+Модули threading и time для замера производительности.
+"""
+
+FIELDS = ('title', 'h1', 'h2')  # поля по умолчанию
+
+tag_re = re.compile(r'<[^>]*>')  # тег внутри текста поля
+
+
+class FieldExtractor:
+    """
+    Класс потокового извлечения текста первого элемента с каждым из заданных тегов. Текст просматривается один раз:
+    после каждой части поиск продолжается с места, на котором остановился, а в буфере остается только текст
+    собираемого элемента или начало тега, разрезанного между частями
+    """
+
+    def __init__(self, fields: tuple = FIELDS) -> None:
+        """
+        Конструктор разборщика
+        :param fields: теги элементов, текст которых нужно извлечь
+        """
+        self.fields = tuple(fields)
+        self.found = {}  # извлеченные поля {тег: текст}
+        self._start = re.compile(r'<(%s)\b[^>]*>' % '|'.join(map(re.escape, self.fields)), re.I)  # открывающий тег
+        self._end = None  # выражение закрывающего тега собираемого элемента или None
+        self._tag = None  # тег собираемого элемента
+        self._buffer = ''  # необработанный остаток текста
+        self._scan = 0  # позиция в буфере, с которой продолжается поиск закрывающего тега
+
+    def feed(self, text: str) -> bool:
+        """
+        Метод разбора очередной части страницы
+        :param text: часть текста страницы
+        :return: bool - True, если все поля найдены и остальная часть страницы не нужна
+        """
+        buffer = self._buffer + text
+        pos = 0
+        while len(self.found) < len(self.fields):
+            if self._end is None:  # поиск открывающего тега
+                m = self._start.search(buffer, pos)
+                if m is None:
+                    cut = buffer.rfind('<', pos)  # начало тега может быть разрезано между частями
+                    pos = cut if cut >= 0 and '>' not in buffer[cut:] else len(buffer)
+                    break
+                pos = m.end()
+                tag = m.group(1).lower()
+                if tag not in self.found:
+                    self._tag, self._end = tag, re.compile(rf'</{tag}\s*>', re.I)
+                    self._scan = pos
+            else:  # поиск закрывающего тега собираемого элемента
+                m = self._end.search(buffer, self._scan)
+                if m is None:
+                    self._scan = max(pos, len(buffer) - len(self._tag) - 8)  # закрывающий тег может быть разрезан
+                    break
+                self.found[self._tag] = html.unescape(tag_re.sub('', buffer[pos:m.start()])).strip()
+                self._end = None
+                pos = m.end()
+        self._buffer = buffer[pos:]
+        self._scan -= pos
+        return len(self.found) == len(self.fields)
+
+    def result(self) -> dict:
+        """
+        Метод, возвращающий извлеченные поля в порядке их перечисления
+        :return: dict - словарь {тег: текст}, ненайденные поля отсутствуют
+        """
+        return {tag: self.found[tag] for tag in self.fields if tag in self.found}
+
+
+def benchmark(size: int = 4 * 2 ** 20, rate: int = 20 * 2 ** 20, n: int = 5) -> None:
+    """
+    Функция сравнения загрузки всей страницы с поиском регулярными выражениями (как в примере 14 до потоковой
+    обработки) и потокового извлечения полей. Локальный сервер отдает страницы размером size байт
+    со скоростью rate байт в секунду: страницу со всеми полями в начале и страницу без элемента h2
+    :param size: размер страницы в байтах
+    :param rate: скорость передачи в байтах в секунду
+    :param n: количество загрузок каждой страницы
+    :return: None
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    import asyncio
+    from async_fetch import FetchEngine
+
+    paragraph = '<p>Текст абзаца <b>страницы</b> с <a href="#">ссылкой</a> и <h3>подзаголовком</h3>.</p>\n'
+    head = '<html><head><title> Заголовок страницы </title></head><body><h1>Первый заголовок</h1>'
+    pages = {
+        '/top': (head + '<h2>Второй заголовок</h2>' + paragraph * (size // len(paragraph.encode()))).encode(),
+        '/no-h2': (head + paragraph * (size // len(paragraph.encode()))).encode(),
+    }
+    step = 65536  # порция передачи сервера
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            body = pages[self.path]
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            try:
+                for k in range(0, len(body), step):
+                    self.wfile.write(body[k:k + step])
+                    time.sleep(step / rate)  # ограничение скорости передачи
+            except (BrokenPipeError, ConnectionResetError):  # клиент закрыл соединение
+                self.close_connection = True
+
+        def log_message(self, *args) -> None:
+            pass
+
+    parsers = {  # парсеры примера 14 на регулярных выражениях
+        'title': re.compile(r'<title.*?>(.*?)<\/title>', re.M | re.S),
+        'h1': re.compile(r'<h1.*?>(.*?)<\/h1>', re.M | re.S),
+        'h2': re.compile(r'<h2.*?>(.*?)<\/h2>', re.M | re.S)
+    }
+
+    def regex_parse(text: str) -> dict:
+        return {name: m.group(1).strip() for name, parser in parsers.items() if (m := parser.search(text))}
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    engine = FetchEngine()
+    print(f'page {size / 2 ** 20:.0f} MB served at {rate / 2 ** 20:.0f} MB/s')
+    for path in pages:
+        url = f'http://127.0.0.1:{server.server_port}{path}'
+        results = []
+        for mode in ('full body + regex', 'streaming extractor'):
+            engine.received = 0
+            start = time.perf_counter()
+            for _ in range(n):
+                if mode == 'streaming extractor':
+                    future = asyncio.run_coroutine_threadsafe(engine.get(url, FieldExtractor), engine._loop)
+                    result = future.result()
+                else:
+                    text = asyncio.run_coroutine_threadsafe(engine.get(url), engine._loop).result()
+                    result = regex_parse(text)
+            elapsed = (time.perf_counter() - start) / n
+            results.append(result)
+            print(f'{path:>7} {mode:>20}: {elapsed * 1000:>6.0f} ms, {engine.received / n / 1024:>6,.0f} KB received')
+        assert results[0] == results[1], results
+    engine.close()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    benchmark()
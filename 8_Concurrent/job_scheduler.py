@@ -0,0 +1,171 @@
+"""
+Модуль планировщика рабочих потоков поверх менеджера потоков QThreadPool
+(используется примерами 20_qrunner_manager.py и 21_qrunner_manager_stop.py).
+QThreadPool.start() ставит рабочий поток в собственную очередь менеджера: порядок запуска строго FIFO,
+узнать количество ожидающих потоков и снять поток с очереди нельзя. Класс JobScheduler:
+♦ хранит рабочие потоки в очередях с приоритетом (отдельная куча heapq для каждой категории)
+  и передает поток в QThreadPool, только когда в нем есть свободный поток;
+♦ ограничивает количество одновременно выполняющихся потоков категории;
+♦ снимает с очереди еще не запущенный поток;
+♦ знает точное количество выполняющихся и ожидающих потоков.
+Запуск модуля как скрипта выводит порядок запуска потоков разных приоритетов и категорий:
+python job_scheduler.py
+"""
+import heapq
+import itertools
+
+"""
+Модуль heapq для работы с очередью с приоритетом (двоичной кучей), модуль itertools для счетчика.
+"""
+
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 1
+PRIORITY_HIGH = 2
+
+
+class JobScheduler:
+    """
+    Класс планировщика рабочих потоков поверх менеджера потоков QThreadPool.
+    Собственная очередь QThreadPool всегда пуста, поэтому планировщик знает точное количество
+    выполняющихся и ожидающих потоков. У рабочего потока должен быть атрибут job_id.
+    Все методы вызываются из главного потока.
+    """
+
+    def __init__(self, threadpool) -> None:
+        """
+        Конструктор планировщика
+        :param threadpool: менеджер рабочих потоков QThreadPool, которому передаются рабочие потоки на выполнение
+        """
+        self.threadpool = threadpool  # сохранение ссылки на менеджер рабочих потоков
+        self._queues = {}  # словарь очередей {категория: куча из кортежей (-приоритет, номер, идентификатор)}
+        self._queued = {}  # словарь ожидающих рабочих потоков {идентификатор: (рабочий поток, категория)}
+        self._running = {}  # словарь выполняющихся рабочих потоков {идентификатор: категория}
+        self._category_running = {}  # словарь количества выполняющихся потоков по категориям
+        self._category_limits = {}  # словарь ограничений на количество выполняющихся потоков по категориям
+        self._counter = itertools.count()  # счетчик для сохранения порядка FIFO внутри одного приоритета
+
+    @property
+    def running(self) -> int:
+        """
+        Свойство - количество выполняющихся рабочих потоков
+        """
+        return len(self._running)
+
+    @property
+    def waiting(self) -> int:
+        """
+        Свойство - количество рабочих потоков, ожидающих в очереди
+        """
+        return len(self._queued)
+
+    def set_category_limit(self, category: str, limit: int | None) -> None:
+        """
+        Метод для установки ограничения на количество одновременно выполняющихся потоков категории
+        :param category: название категории
+        :param limit: максимальное количество потоков, None - без ограничения
+        :return: None
+        """
+        if limit is None:
+            self._category_limits.pop(category, None)
+        else:
+            self._category_limits[category] = limit
+        self.dispatch()  # при увеличении ограничения ожидающие потоки можно запустить сразу
+
+    def submit(self, worker, priority: int = PRIORITY_NORMAL, category: str = 'default') -> None:
+        """
+        Метод для постановки рабочего потока в очередь планировщика
+        :param worker: объект рабочего потока QRunnable
+        :param priority: приоритет, потоки с большим приоритетом запускаются первыми
+        :param category: категория рабочего потока
+        :return: None
+        """
+        self._queued[worker.job_id] = (worker, category)
+        heapq.heappush(self._queues.setdefault(category, []), (-priority, next(self._counter), worker.job_id))
+        self.dispatch()
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Метод для отмены ожидающего в очереди рабочего потока.
+        Запись в куче не ищется, а пропускается при извлечении (отложенное удаление)
+        :param job_id: уникальный идентификатор рабочего потока
+        :return: True, если поток был в очереди и отменен
+        """
+        return self._queued.pop(job_id, None) is not None
+
+    def release(self, job_id: str) -> None:
+        """
+        Метод для освобождения места завершившегося рабочего потока и запуска следующих из очереди
+        :param job_id: уникальный идентификатор рабочего потока
+        :return: None
+        """
+        category = self._running.pop(job_id, None)
+        if category is not None:
+            self._category_running[category] -= 1
+            self.dispatch()
+
+    def dispatch(self) -> None:
+        """
+        Метод для запуска ожидающих рабочих потоков, пока в менеджере потоков есть свободные потоки.
+        Из голов очередей тех категорий, которые не достигли ограничения, выбирается поток
+        с наибольшим приоритетом, а при равном приоритете - поставленный раньше
+        :return: None
+        """
+        while len(self._running) < self.threadpool.maxThreadCount():
+            best = None  # категория с лучшим кандидатом на запуск
+            for category, queue in self._queues.items():
+                while queue and queue[0][2] not in self._queued:  # удаление из головы отмененных потоков
+                    heapq.heappop(queue)
+                if not queue:
+                    continue
+                limit = self._category_limits.get(category)
+                if limit is not None and self._category_running.get(category, 0) >= limit:
+                    continue  # категория достигла ограничения
+                if best is None or queue[0] < self._queues[best][0]:
+                    best = category
+            if best is None:  # запускать нечего
+                return
+            _, _, job_id = heapq.heappop(self._queues[best])
+            worker, category = self._queued.pop(job_id)
+            self._running[job_id] = category
+            self._category_running[category] = self._category_running.get(category, 0) + 1
+            self.threadpool.start(worker)  # в менеджере есть свободный поток, рабочий поток запустится сразу
+
+
+def demo() -> None:
+    """
+    Функция вывода порядка запуска рабочих потоков. Вместо QThreadPool используется менеджер с двумя потоками,
+    который только запоминает переданные ему потоки, а завершение потоков выполняется вызовом release()
+    :return: None
+    """
+    class Job:
+        def __init__(self, job_id: str) -> None:
+            self.job_id = job_id
+
+    class Pool:
+        def __init__(self) -> None:
+            self.started = []
+
+        @staticmethod
+        def maxThreadCount() -> int:
+            return 2
+
+        def start(self, worker) -> None:
+            self.started.append(worker.job_id)
+
+    pool = Pool()
+    scheduler = JobScheduler(pool)
+    scheduler.set_category_limit('urgent', 1)  # не более одного срочного потока одновременно
+    for name in ('low-1', 'normal-1', 'normal-2'):
+        scheduler.submit(Job(name), PRIORITY_LOW if name.startswith('low') else PRIORITY_NORMAL)
+    for name in ('urgent-1', 'urgent-2', 'urgent-3'):
+        scheduler.submit(Job(name), PRIORITY_HIGH, 'urgent')
+    scheduler.cancel('urgent-3')  # снятие с очереди еще не запущенного потока
+    print(f'{scheduler.running} running, {scheduler.waiting} waiting')
+    while scheduler.running:  # завершение потоков в порядке запуска
+        scheduler.release(next(iter(scheduler._running)))
+    print(' -> '.join(pool.started))
+    assert pool.started == ['low-1', 'normal-1', 'urgent-1', 'normal-2', 'urgent-2'], pool.started
+
+
+if __name__ == '__main__':
+    demo()
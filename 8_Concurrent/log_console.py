@@ -0,0 +1,171 @@
+"""
+Модуль виджета журнала для вывода большого количества строк из рабочих потоков и процессов
+(используется примерами 13_qrunner_io.py, 22_qprocess.py, 23_qprocess_manager.py и 24_async_fetch.py).
+Вызов QPlainTextEdit.appendPlainText() на каждую строку - это сигнал между потоками и перестроение разметки
+документа на строку, поэтому рабочий поток, выводящий десятки тысяч строк в секунду, останавливает интерфейс.
+Виджет LogConsole:
+♦ принимает строки порциями (списками) из любого потока методом append_lines(). Порции складываются в очередь
+  deque, методы append() и popleft() которой не требуют блокировок;
+♦ не чаще одного раза за кадр (FRAME_INTERVAL) добавляет все накопленные строки в документ одной правкой курсором;
+♦ хранит не более max_blocks строк (кольцевой режим): старые строки удаляются, а строки, которые все равно
+  были бы удалены, не добавляются в документ.
+Запуск модуля как скрипта выполняет замер наибольшей скорости вывода строк: python log_console.py
+"""
+import sys
+import threading
+import time
+from collections import deque
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtGui import QTextCursor
+from PySide6.QtWidgets import QApplication, QPlainTextEdit
+
+"""
+Модуль sys для доступа к аргументам командной строки, модули threading и time для замера производительности.
+Класс двусторонней очереди deque из модуля collections для очереди порций строк.
+Импорт из модуля PySide6.QtCore базового класса объектов Qt QObject, класса таймера QTimer и класса сигналов Signal.
+Импорт из модуля PySide6.QtGui класса текстового курсора QTextCursor.
+Импорт из модуля PySide6.QtWidgets класса управления приложением QApplication и класса многострочного
+текстового поля QPlainTextEdit.
+"""
+
+FRAME_INTERVAL = 16  # интервал добавления строк в документ в мсек (около 60 раз в секунду)
+MAX_BLOCKS = 10_000  # количество хранимых строк по умолчанию
+
+
+class LogConsole(QPlainTextEdit):
+    """
+    Подкласс многострочного текстового поля для вывода журнала, добавляющий строки пакетами раз в кадр
+    """
+    _wake = Signal()  # сигнал о появлении строк в пустой очереди, из рабочих потоков передается через очередь событий
+
+    def __init__(self, parent=None, max_blocks: int = MAX_BLOCKS) -> None:
+        """
+        Конструктор журнала
+        :param parent: родительский виджет
+        :param max_blocks: наибольшее количество хранимых строк, 0 - без ограничения
+        """
+        QPlainTextEdit.__init__(self, parent)  # явный вызов конструктора родительского класса
+        self.setReadOnly(True)  # журнал только для чтения
+        self.setUndoRedoEnabled(False)  # без истории правок - добавленные строки не копируются в стек отмены
+        self.setMaximumBlockCount(max_blocks)  # документ сам удаляет старые строки сверх ограничения
+        self._queue = deque()  # очередь порций строк
+        self._scheduled = False  # признак запущенного таймера добавления строк
+        self.dropped = 0  # количество строк, не попавших в документ из-за ограничения
+        self.timer = QTimer(self)  # таймер добавления строк в документ
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(FRAME_INTERVAL)
+        self.timer.timeout.connect(self.flush)
+        self._wake.connect(self.timer.start)  # таймер запускается в основном потоке
+
+    def append_lines(self, lines: list) -> None:
+        """
+        Метод добавления порции строк в очередь журнала, может вызываться из любого потока
+        :param lines: список строк
+        :return: None
+        """
+        if not lines:
+            return
+        self._queue.append(lines)
+        if not self._scheduled:  # один сигнал на кадр, а не на каждую порцию
+            self._scheduled = True
+            self._wake.emit()
+
+    def append_line(self, line: str) -> None:
+        """
+        Метод добавления одной строки в очередь журнала, может вызываться из любого потока
+        :param line: строка
+        :return: None
+        """
+        self.append_lines([line])
+
+    def flush(self) -> None:
+        """
+        Метод добавления всех накопленных строк в документ одной правкой
+        :return: None
+        """
+        self._scheduled = False  # порции, добавленные после этой строки, запустят таймер снова
+        chunks = []
+        while self._queue:
+            chunks.append(self._queue.popleft())
+        if not chunks:
+            return
+        lines = [line for chunk in chunks for line in chunk]
+        limit = self.maximumBlockCount()
+        if limit and len(lines) > limit:  # строки, которые были бы сразу удалены, не добавляются
+            self.dropped += len(lines) - limit
+            lines = lines[-limit:]
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()  # прокрутка за новыми строками, если журнал
+        # прокручен до конца
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()  # одна правка - одно перестроение разметки
+        if not self.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText('\n'.join(lines))
+        cursor.endEditBlock()
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def clear(self) -> None:
+        """
+        Метод очистки журнала вместе с очередью строк
+        :return: None
+        """
+        self._queue.clear()
+        self.dropped = 0
+        QPlainTextEdit.clear(self)
+
+
+class LineEmitter(QObject):
+    """
+    Класс сигнала строки для замера вывода appendPlainText() на каждую строку
+    """
+    line = Signal(str)
+
+
+def benchmark(n: int = 100_000) -> None:
+    """
+    Функция замера наибольшей скорости вывода строк из рабочего потока: сигнал и appendPlainText() на каждую
+    строку в сравнении с LogConsole, получающим порции по 1000 строк. Выводится скорость отображения строк
+    и наибольшая пауза в обработке событий основного потока (время, на которое интерфейс перестает отвечать)
+    :param n: количество строк
+    :return: None
+    """
+    app = QApplication.instance() or QApplication(sys.argv)
+    line = 'WORKER 0: <div class="line">Текст строки ответа сервера</div>'
+    for mode in ('appendPlainText', 'LogConsole'):
+        console = LogConsole()
+        console.resize(800, 600)
+        console.show()
+        emitter = LineEmitter()
+        emitter.line.connect(console.appendPlainText)  # объект сигнала в основном потоке - соединение через очередь
+
+        def produce() -> None:  # рабочий поток
+            if mode == 'appendPlainText':
+                for _ in range(n):
+                    emitter.line.emit(line)
+                emitter.line.emit('')  # признак конца вывода - последняя пустая строка
+            else:
+                for _ in range(n // 1000):
+                    console.append_lines([line] * 1000)
+
+        thread = threading.Thread(target=produce)
+        longest = 0
+        start = time.perf_counter()
+        thread.start()
+        while thread.is_alive() or console._queue or console.timer.isActive() or \
+                (mode == 'appendPlainText' and console.document().lastBlock().text()):  # до отображения всех строк
+            tick = time.perf_counter()
+            app.processEvents()
+            longest = max(longest, time.perf_counter() - tick)
+        elapsed = time.perf_counter() - start
+        thread.join()
+        print(f'{mode:>16}: {n / elapsed:>10,.0f} lines/s, longest GUI stall {longest * 1000:,.0f} ms, '
+              f'{console.blockCount():,} lines kept')
+        console.close()
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,57 @@
+"""
+Долгоживущий интерпретатор для пула процессов менеджера JobManager.
+Задания поступают через стандартный ввод по одному в строке в виде JSON-списка [скрипт, [аргументы]].
+Скрипт выполняется в этом же интерпретаторе, поэтому запуск Python и импорт модулей
+происходят один раз на процесс, а не на каждое задание. По той же причине задания не изолированы:
+состояние модулей, sys.modules и другие глобальные данные интерпретатора переходят от задания к заданию.
+Стандартный ввод интерпретатора занят заданиями, поэтому скрипт получает пустой стандартный ввод.
+После завершения задания в стандартный вывод пишется маркер с кодом выхода.
+"""
+import io
+import sys
+import json
+import runpy
+import traceback
+
+JOB_DONE_MARKER = '\x1ejob-done'  # маркер завершения задания, за ним через пробел следует код выхода
+
+
+def run_job(script: str, args: list) -> int:
+    """
+    Функция выполнения скрипта как главного модуля с заданными аргументами командной строки
+    :param script: путь к скрипту
+    :param args: аргументы командной строки
+    :return: код выхода
+    """
+    sys.argv = [script, *args]  # скрипт видит свои аргументы так же, как при отдельном запуске
+    stdin, sys.stdin = sys.stdin, io.StringIO()  # чтение стандартного ввода скриптом не должно забирать
+    # следующие задания
+    try:
+        runpy.run_path(script, run_name='__main__')
+    except SystemExit as e:  # вызов sys.exit() в скрипте завершает задание, а не интерпретатор
+        if e.code is None:
+            return 0
+        return e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        traceback.print_exc()  # вывод трассировки ошибки в стандартный поток ошибок
+        return 1
+    finally:
+        sys.stdin = stdin  # восстановление стандартного ввода с заданиями
+    return 0
+
+
+def main() -> None:
+    """
+    Функция цикла чтения заданий, завершается при закрытии стандартного ввода
+    :return: None
+    """
+    for line in sys.stdin:
+        script, args = json.loads(line)
+        code = run_job(script, args)
+        sys.stderr.flush()  # весь вывод задания должен быть передан до маркера
+        sys.stdout.write(f'{JOB_DONE_MARKER} {code}\n')
+        sys.stdout.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""
+Пример использования библиотеки PyQtGraph для черчения графиков, обновляемых потоком данных в реальном времени.
+В примере 6 данные хранятся в списках Python, и при каждом обновлении списки пересоздаются срезом,
+что требует копирования всех точек и перевода списков в массивы. Здесь каждая линия получает данные из
+потокового ряда (модуль stream_series) с кольцевым буфером NumPy. Данные поступают из потоков-источников
+порциями с общей частотой 1 МГц (8 линий по 125 кГц), а график обновляется 30 раз в секунду рядами,
+прореженными до ширины графика в пикселях.
+"""
+import sys
+import time
+
+import numpy as np
+from PySide6 import QtWidgets, QtCore
+import pyqtgraph as pg
+
+from stream_series import StreamSeries  # импорт класса потокового ряда данных
+
+"""
+Модуль sys нужен для доступа к аргументам командной строки. Если использование аргументов
+командной строки не предполагается, то импорт можно не выполнять. При этом, при создании
+приложения в класс QtWidgets.QApplication([]) в качестве аргумента передается пустой список.
+Модуль time нужен для соблюдения частоты поступления данных в потоках-источниках.
+Импорт пакета NumPy для генерации порций данных.
+Импорт из библиотеки PySide6 модуля виджетов QtWidgets и модуля QtCore.
+Из библиотеки pyqtgraph.
+"""
+
+N_LINES = 8  # количество линий графика
+SAMPLE_RATE = 125_000  # частота отсчетов одной линии в Гц
+CHUNK_INTERVAL = 0.01  # интервал поступления порций данных в секундах
+WINDOW = 2  # отображаемый интервал времени в секундах
+FRAME_INTERVAL = 33  # интервал обновления графика в мсек (30 кадров в секунду)
+
+
+class Producer(QtCore.QRunnable):
+    """
+    Класс потока-источника данных: генерирует зашумленную синусоиду и добавляет ее в ряд порциями
+    """
+
+    def __init__(self, series: StreamSeries, frequency: float) -> None:
+        """
+        Конструктор потока-источника
+        :param series: потоковый ряд для добавления данных
+        :param frequency: частота синусоиды в Гц
+        """
+        QtCore.QRunnable.__init__(self)  # явный вызов конструктора родительского класса
+        self.series = series
+        self.frequency = frequency
+        self.is_killed = False  # флаг остановки потока
+
+    def run(self) -> None:
+        """
+        Метод, выполняемый в потоке: добавление порций с постоянной частотой до установки флага остановки
+        :return: None
+        """
+        rng = np.random.default_rng()
+        chunk = int(SAMPLE_RATE * CHUNK_INTERVAL)  # количество отсчетов в порции
+        deadline = time.perf_counter()
+        while not self.is_killed:
+            t = (self.series.count + np.arange(chunk)) / SAMPLE_RATE  # время отсчетов порции
+            self.series.append(np.sin(2 * np.pi * self.frequency * t) + rng.normal(0, 0.1, chunk))
+            deadline += CHUNK_INTERVAL
+            time.sleep(max(0.0, deadline - time.perf_counter()))
+
+    def kill(self) -> None:
+        """
+        Метод установки флага остановки потока
+        :return: None
+        """
+        self.is_killed = True
+
+
+class MainWindow(QtWidgets.QMainWindow):
+    """
+    Класс главного окна приложения от супер-класса виджета главных окон
+    """
+
+    def __init__(self) -> None:
+        """
+        Конструктор главного окна приложения
+        """
+        QtWidgets.QMainWindow.__init__(self)  # явный вызов конструктора родительского класса
+        self.graph_widget = pg.PlotWidget()  # создание виджета холста для черчения
+        self.setCentralWidget(self.graph_widget)  # размещение холста в главном окне приложения
+        self.graph_widget.setBackground('w')  # установка белого цвета на задний фон
+        self.graph_widget.setLabel('bottom', 'time, s')
+
+        self.series = []  # потоковые ряды линий
+        self.lines = []  # линии графика
+        self.producers = []  # потоки-источники
+        self.threadpool = QtCore.QThreadPool()  # пул потоков для источников данных
+        self.threadpool.setMaxThreadCount(N_LINES)
+        for n in range(N_LINES):
+            series = StreamSeries(SAMPLE_RATE * WINDOW, rate=SAMPLE_RATE)  # ряд хранит последние WINDOW секунд
+            line = self.graph_widget.plot(pen=pg.mkPen(color=pg.intColor(n, N_LINES)))
+            line.setPos(0, n * 3)  # смещение линий по вертикали, чтобы они не перекрывались
+            producer = Producer(series, frequency=1 + n)
+            self.series.append(series)
+            self.lines.append(line)
+            self.producers.append(producer)
+            self.threadpool.start(producer)
+
+        self.timer = QtCore.QTimer()  # создание объекта таймера
+        self.timer.setInterval(FRAME_INTERVAL)  # установка длительности интервала таймера
+        self.timer.timeout.connect(self.update_plot_data)  # создание сигнала на истечение таймера
+        # с привязкой метода ресивера
+        self.timer.start()
+
+    def update_plot_data(self) -> None:
+        """
+        Метод ресивер на обновление данных линий графика прореженными рядами
+        :return: None
+        """
+        width = max(100, self.graph_widget.width())  # количество групп прореживания - ширина графика в пикселях
+        for series, line in zip(self.series, self.lines):
+            x, y = series.decimated(width)
+            line.setData(x, y, skipFiniteCheck=True)  # данные уже в массивах NumPy и не содержат NaN
+        total = sum(series.count for series in self.series)
+        self.statusBar().showMessage(f'{total:,} samples received')
+
+    def closeEvent(self, event) -> None:
+        """
+        Метод обработки закрытия окна: остановка потоков-источников
+        :param event: PySide6.QtGui.QCloseEvent
+        :return: None
+        """
+        for producer in self.producers:
+            producer.kill()
+        self.threadpool.waitForDone()  # ожидание завершения потоков
+        event.accept()
+
+
+def main() -> None:
+    """
+    Функция запуска кода приложения верхнего уровня
+    :return: None
+    """
+    app = QtWidgets.QApplication(sys.argv)  # создание основного цикла событий приложения
+    window = MainWindow()  # создание экземпляра главного окна приложения
+    app.setStyle('Fusion')  # более интересная глобальная кроссплатформенна тема Fusion
+    window.show()  # установка видимости главного окна (по умолчанию окно спрятано)
+    app.exec()  # запуск основного цикла событий приложения
+
+
+if __name__ == '__main__':  # проверка имени запущенного модуля для предотвращения запуска
+    # кода верхнего уровня данного модуля при его импортировании
+    main()  # вызов функции запуска кода приложения верхнего уровня
@@ -0,0 +1,212 @@
+"""
+Пример использования библиотеки matplotlib для черчения графиков, диаграмм
+и других способов визуализации данных.
+В данном примере показан метод обновления рисунка с помощью блиттинга (blitting).
+В примере 10 при каждом обновлении вызывается canvas.draw(), и рисунок полностью отрисовывается заново:
+оси, деления, подписи и линия. Здесь неизменная часть рисунка (фон) сохраняется после полной отрисовки,
+а при обновлении данных фон восстанавливается из сохраненной копии, поверх него рисуются только
+изменившиеся элементы (линии), и на экран передается только область осей.
+Полная отрисовка выполняется только при изменении пределов осей (и при изменении размеров окна).
+Запуск с аргументом --benchmark выполняет замер частоты кадров: python 14_matplotlib_blit.py --benchmark
+"""
+import sys
+import time
+
+from PySide6 import QtWidgets, QtCore  # PySide должен быть импортирован до matplotlib!!!
+
+import numpy as np
+import matplotlib
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+from matplotlib.figure import Figure
+
+"""
+Модуль sys нужен для доступа к аргументам командной строки. Если использование аргументов
+командной строки не предполагается, то импорт можно не выполнять. При этом, при создании
+приложения в класс QtWidgets.QApplication([]) в качестве аргумента передается пустой список.
+Модуль time для замера времени обновления рисунка.
+Импорт из библиотеки PySide6 модуля виджетов QtWidgets, модуля ядра библиотеки QtCore.
+Импорт пакета NumPy для хранения данных графика.
+Импорт библиотеки matplotlib.
+Импорт из модуля matplotlib.backends.backend_qtagg импорт класса холста для рисования FigureCanvasQTAgg
+для библиотеки Qt.
+Импорт из модуля matplotlib.figure класса контейнера верхнего уровня для всех элементов
+визуализаций (чертежей) Figure.
+Другие виджеты можно найти по ссылке https://doc.qt.io/qt-5/widget-classes.html#basic-widget-classes
+"""
+
+matplotlib.use('QtAgg')
+
+
+# вызов метода для выбора бэкэнда библиотеки matplotlib для рисования и интеграции
+# с библиотекой для создания графических интерфейсов
+
+
+class MplCanvas(FigureCanvasQTAgg):
+    """
+    Подкласс холста для рисования от супер-класса холстов библиотеки matplotlib с режимом живого обновления.
+    Элементы, переданные в set_live(), не рисуются при полной отрисовке, а рисуются методом update_live()
+    поверх сохраненного фона
+    """
+
+    def __init__(self, parent=None, width=5, height=4, dpi=100) -> None:
+        """
+        Конструктор хоста для рисования с указанием параметров по умолчанию
+        :param parent: ссылка на родительский объект (из которого был создан экземпляр данного класса)
+        :param width: ширина рисунка, количество значений dpi (n * dpi)
+        :param height: высота рисунка, количество значений dpi (n * dpi)
+        :param dpi: разрешение рисунка, точек на дюйм
+        """
+        fig = Figure(figsize=(width, height), dpi=dpi)  # создание контейнера с указанием размера и разрешения рисунка
+        self.axes = fig.add_subplot(111)  # добавление осей к рисунку
+        FigureCanvasQTAgg.__init__(self, fig)  # явный вызов конструктора родительского класса
+        self._live = []  # элементы рисунка, обновляемые блиттингом
+        self._background = None  # сохраненный фон - рисунок без обновляемых элементов
+        self._limits = None  # пределы осей, при которых был сохранен фон
+        self.mpl_connect('draw_event', self.on_draw)  # после каждой полной отрисовки сохраняется новый фон
+
+    def set_live(self, artists: list) -> None:
+        """
+        Метод включения режима живого обновления для элементов рисунка
+        :param artists: список элементов рисунка (например, линий, возвращенных методом plot)
+        :return: None
+        """
+        for artist in artists:
+            artist.set_animated(True)  # элемент пропускается при полной отрисовке рисунка
+        self._live = list(artists)
+        self._background = None  # фон нужно сохранить заново без этих элементов
+
+    def on_draw(self, event) -> None:
+        """
+        Метод ресивер на событие полной отрисовки: сохранение фона и рисование обновляемых элементов поверх него
+        :param event: matplotlib.backend_bases.DrawEvent
+        :return: None
+        """
+        self._background = self.copy_from_bbox(self.figure.bbox)  # копия отрисованного рисунка без элементов
+        self._limits = self.axes.get_xlim(), self.axes.get_ylim()
+        self._draw_live()
+
+    def _draw_live(self) -> None:
+        """
+        Метод рисования обновляемых элементов поверх текущего содержимого холста
+        :return: None
+        """
+        for artist in self._live:
+            self.figure.draw_artist(artist)
+
+    def update_live(self) -> None:
+        """
+        Метод обновления рисунка после изменения данных обновляемых элементов. Если пределы осей не изменились,
+        фон восстанавливается из копии, поверх него рисуются элементы, и на экран передается только область осей.
+        Иначе выполняется полная отрисовка (деления и подписи осей тоже изменились)
+        :return: None
+        """
+        if self._background is None or self._limits != (self.axes.get_xlim(), self.axes.get_ylim()):
+            self.draw()  # полная отрисовка, фон сохраняется в on_draw()
+            return
+        self.restore_region(self._background)  # восстановление фона
+        self._draw_live()
+        self.blit(self.axes.bbox)  # передача на экран только области осей
+
+
+class MainWindow(QtWidgets.QMainWindow):
+    """
+    Класс главного окна приложения от супер-класса главных окон
+    """
+
+    def __init__(self, n_data: int = 50, interval: int = 100) -> None:
+        """
+        Конструктор главного окна приложения
+        :param n_data: количество точек графика
+        :param interval: интервал обновления графика в мсек
+        """
+        QtWidgets.QMainWindow.__init__(self)  # явный вызов конструктора родительского класса
+        self.canvas = MplCanvas(self, width=5, height=4, dpi=100)  # создание экземпляра класса холста для рисования
+        self.setCentralWidget(self.canvas)  # размещение холста на главном окне приложения
+
+        self.rng = np.random.default_rng()  # генератор случайных чисел для данных
+        self.xdata = np.arange(n_data)  # массив значений для оси х
+        self.ydata = np.cumsum(self.rng.normal(0, 1, n_data))  # случайное блуждание - значения по оси y
+        self._plot_ref, = self.canvas.axes.plot(self.xdata, self.ydata, 'r')  # ссылка на линию графика
+        self.canvas.axes.set_xlim(0, n_data - 1)
+        self.fit_ylim(force=True)
+        self.canvas.set_live([self._plot_ref])  # линия обновляется блиттингом
+
+        self.timer = QtCore.QTimer()  # создание объекта таймера
+        self.timer.setInterval(interval)  # установка величины интервала таймера
+        self.timer.timeout.connect(self.update_plot)  # создание сигнала на истечение таймера
+        # с привязкой метода ресивера
+        self.timer.start()  # запуск таймера
+
+    def fit_ylim(self, force: bool = False) -> None:
+        """
+        Метод установки пределов оси y с запасом, если данные вышли за текущие пределы.
+        Пределы меняются редко, поэтому полная отрисовка выполняется лишь на части обновлений
+        :param force: установить пределы независимо от данных
+        :return: None
+        """
+        low, high = self.canvas.axes.get_ylim()
+        y_min, y_max = self.ydata.min(), self.ydata.max()
+        if force or y_min < low or y_max > high:
+            margin = max(5.0, (y_max - y_min) / 2)
+            self.canvas.axes.set_ylim(y_min - margin, y_max + margin)
+
+    def update_plot(self) -> None:
+        """
+        Метод обновления рисунка
+        """
+        self.ydata[:-1] = self.ydata[1:]  # сдвиг значений на одну позицию без создания нового массива
+        self.ydata[-1] = self.ydata[-2] + self.rng.normal()  # добавление нового значения
+        self._plot_ref.set_ydata(self.ydata)  # обновление данных линии
+        self.fit_ylim()
+        self.canvas.update_live()  # перерисовка только линии, если пределы осей не изменились
+
+
+def benchmark() -> None:
+    """
+    Функция замера частоты кадров для 50 и 5000 точек на холсте 500x400:
+    полная отрисовка canvas.draw() как в примере 10 и блиттинг без изменения пределов осей
+    :return: None
+    """
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    for n_data in (50, 5000):
+        window = MainWindow(n_data)
+        window.timer.stop()  # обновления выполняются в цикле замера
+        window.show()
+        app.processEvents()
+        window.canvas.axes.set_ylim(-1e6, 1e6)  # пределы, за которые данные не выйдут
+        window.canvas.draw()
+        results = []
+        for update in (window.canvas.draw, window.canvas.update_live):
+            frames = 0
+            start = time.perf_counter()
+            while time.perf_counter() - start < 2:
+                window.ydata[:-1] = window.ydata[1:]
+                window.ydata[-1] = window.ydata[-2] + window.rng.normal()
+                window._plot_ref.set_ydata(window.ydata)
+                update()
+                app.processEvents()  # вывод кадра на экран
+                frames += 1
+            results.append(frames / (time.perf_counter() - start))
+        print(f'{n_data:>5} points: full draw {results[0]:.0f} fps, blit {results[1]:.0f} fps '
+              f'({results[1] / results[0]:.1f}x)')
+        window.close()
+
+
+def main() -> None:
+    """
+    Функция запуска кода приложения верхнего уровня
+    :return: None
+    """
+    app = QtWidgets.QApplication(sys.argv)  # создание основного цикла событий приложения
+    window = MainWindow()  # создание экземпляра главного окна приложения
+    app.setStyle('Fusion')  # более интересная глобальная кроссплатформенна тема Fusion
+    window.show()  # установка видимости главного окна (по умолчанию окно спрятано)
+    app.exec()  # запуск основного цикла событий приложения
+
+
+if __name__ == '__main__':  # проверка имени запущенного модуля для предотвращения запуска
+    # кода верхнего уровня данного модуля при его импортировании
+    if '--benchmark' in sys.argv:  # запуск замера производительности вместо приложения
+        benchmark()
+    else:
+        main()  # вызов функции запуска кода приложения верхнего уровня
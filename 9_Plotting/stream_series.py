@@ -0,0 +1,167 @@
+"""
+Модуль потокового ряда данных для графиков, обновляемых в реальном времени (используется примером
+13_pyqtgraph_stream.py).
+Ряд хранит последние capacity отсчетов в заранее выделенном кольцевом буфере NumPy. Отсчеты добавляются
+порциями из любых потоков: порция копируется в буфер одной или двумя операциями среза, без сдвига старых данных
+и без списков Python. Для вывода на график ряд прореживается до разрешения экрана: для каждой группы отсчетов,
+приходящейся на пиксель, берутся минимум и максимум, поэтому пики не теряются.
+Запуск модуля как скрипта выполняет замер пропускной способности: python stream_series.py
+"""
+import threading
+import time
+
+import numpy as np
+from PySide6.QtCore import QMutex, QMutexLocker
+
+"""
+Импорт модуля threading для потоков-источников данных в замере производительности.
+Импорт пакета NumPy для кольцевого буфера и прореживания.
+Импорт из модуля PySide6.QtCore класса мьютекса QMutex и класса автоблокировщика QMutexLocker.
+"""
+
+
+class StreamSeries:
+    """
+    Класс потокового ряда данных на кольцевом буфере
+    """
+
+    def __init__(self, capacity: int, rate: float = 1.0) -> None:
+        """
+        Конструктор ряда
+        :param capacity: количество хранимых последних отсчетов
+        :param rate: частота отсчетов в Гц, используется для перевода номера отсчета во время по оси X
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self._y = np.zeros(capacity)  # кольцевой буфер значений
+        self._head = 0  # позиция записи следующего отсчета
+        self._count = 0  # количество отсчетов, добавленных за все время
+        self._mutex = QMutex()  # блокировка буфера от одновременного доступа из разных потоков
+
+    def __len__(self) -> int:
+        """
+        Метод, возвращающий количество хранимых отсчетов
+        :return: int - количество отсчетов
+        """
+        return min(self._count, self.capacity)
+
+    @property
+    def count(self) -> int:
+        """
+        Свойство - количество отсчетов, добавленных за все время
+        :return: int - количество отсчетов
+        """
+        return self._count
+
+    def append(self, samples) -> None:
+        """
+        Метод добавления порции отсчетов. Порция записывается в буфер одной или двумя операциями среза
+        (вторая нужна, когда порция переходит через конец буфера)
+        :param samples: массив или последовательность значений
+        :return: None
+        """
+        samples = np.asarray(samples, dtype=np.float64).ravel()
+        total = len(samples)
+        if total > self.capacity:  # из слишком большой порции нужны только последние отсчеты
+            samples = samples[-self.capacity:]
+        n = len(samples)
+        with QMutexLocker(self._mutex):
+            head = self._head
+            first = min(n, self.capacity - head)  # часть порции до конца буфера
+            self._y[head:head + first] = samples[:first]
+            self._y[:n - first] = samples[first:]  # остаток порции - в начало буфера
+            self._head = (head + n) % self.capacity
+            self._count += total
+
+    def _snapshot(self) -> tuple:
+        """
+        Метод, возвращающий копию хранимых отсчетов в порядке поступления и номер самого старого из них
+        :return: (номер первого отсчета, массив значений)
+        """
+        with QMutexLocker(self._mutex):
+            n = len(self)
+            if self._count <= self.capacity:  # буфер еще не заполнен по кругу
+                y = self._y[:n].copy()
+            else:
+                y = np.concatenate((self._y[self._head:], self._y[:self._head]))
+            return self._count - n, y
+
+    def latest(self) -> tuple:
+        """
+        Метод, возвращающий копию хранимых отсчетов в порядке поступления
+        :return: (массив времени, массив значений)
+        """
+        start, y = self._snapshot()
+        return (start + np.arange(len(y))) / self.rate, y
+
+    def decimated(self, buckets: int) -> tuple:
+        """
+        Метод прореживания ряда до заданного количества групп (обычно - ширина графика в пикселях).
+        Для каждой группы возвращаются две точки: минимум и максимум, поэтому линия графика
+        проходит через все пики ряда
+        :param buckets: количество групп
+        :return: (массив времени, массив значений) длиной не более 2 * buckets
+        """
+        start, y = self._snapshot()
+        n = len(y)
+        if n <= 2 * buckets:  # отсчетов меньше, чем точек прореженного ряда
+            return (start + np.arange(n)) / self.rate, y
+        k = n // buckets  # отсчетов в группе
+        skip = n - k * buckets  # самые старые отсчеты, не вошедшие в целое число групп
+        groups = y[skip:].reshape(buckets, k)
+        out = np.empty((buckets, 2))
+        groups.min(axis=1, out=out[:, 0])
+        groups.max(axis=1, out=out[:, 1])
+        x = (start + skip + np.arange(buckets) * k) / self.rate  # время начала каждой группы
+        return x.repeat(2), out.ravel()
+
+
+def benchmark() -> None:
+    """
+    Функция замера производительности с 8 рядами и 8 потоками-источниками:
+    - предельная скорость добавления порций по 1250 отсчетов без потребителя;
+    - работа с общей частотой 1 МГц (каждый источник добавляет порцию раз в 10 мсек)
+      при прореживании всех рядов до 2000 точек 30 раз в секунду в основном потоке
+    :return: None
+    """
+    chunk = np.random.default_rng(0).normal(size=1250)  # порция отсчетов
+
+    def run(interval: float, seconds: float) -> tuple:
+        series = [StreamSeries(250_000, rate=125_000) for _ in range(8)]
+        stop = threading.Event()
+
+        def produce(s: StreamSeries) -> None:
+            deadline = time.perf_counter()
+            while not stop.is_set():
+                s.append(chunk)
+                if interval:
+                    deadline += interval  # отсчеты поступают с постоянной частотой
+                    time.sleep(max(0.0, deadline - time.perf_counter()))
+
+        threads = [threading.Thread(target=produce, args=(s,)) for s in series]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        frames = []
+        while time.perf_counter() - start < seconds:
+            if interval:  # потребитель работает только при заданной частоте источников
+                frame = time.perf_counter()
+                for s in series:
+                    s.decimated(1000)
+                frames.append(time.perf_counter() - frame)
+            time.sleep(max(0.0, 1 / 30 - (frames[-1] if frames else 0)))
+        elapsed = time.perf_counter() - start
+        stop.set()
+        for t in threads:
+            t.join()
+        return sum(s.count for s in series) / elapsed, frames
+
+    rate, _ = run(0, 1)
+    print(f'append without consumer: {rate / 1e6:.1f} M samples/s')
+    rate, frames = run(0.01, 3)
+    print(f'paced at 1 MHz with 30 fps decimation: {rate / 1e6:.2f} M samples/s, '
+          f'decimating 8 series {sum(frames) / len(frames) * 1000:.1f} ms/frame, worst {max(frames) * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    benchmark()